@@ -6,7 +6,7 @@ import time
 import sqlite3
 import traceback
 import urllib.parse
-from bs4 import BeautifulSoup, Comment, Tag, element
+from bs4 import BeautifulSoup, Tag, element
 from urllib.parse import urlparse, parse_qs
 import dateutil.parser
 import dateutil.relativedelta
@@ -23,6 +23,7 @@ import threading
 import concurrent
 import getopt
 import socket
+import http.cookiejar
 import json
 import copy
 from pytz import timezone
@@ -46,6 +47,9 @@ import os
 import tempfile
 import shutil
 import base64
+import zlib
+import heapq
+import itertools
 import pytz
 import requests
 try:
@@ -73,6 +77,7 @@ import functools
 import get_constant_data
 import get_team_ids
 import ephem
+import bisect
 import ssl
 import cProfile
 import pstats
@@ -118,6 +123,10 @@ request_headers= {}
 
 max_request_retries = 10
 retry_failure_delay = 3
+gateway_pool_maxsize = 50
+rate_limit_max_rate = 50
+rate_limit_min_rate = 0.2
+rate_limit_max_concurrency = gateway_pool_maxsize
 max_reddit_retries = 3
 
 player_season_age_date = datetime.datetime(1, 6, 30)
@@ -128,6 +137,30 @@ imgur_headers = {
 }
 
 use_threads_for_game = False
+use_processes_for_game = False
+game_process_max_workers = os.cpu_count()
+use_game_feed_cache = True
+game_feed_cache_db = "mlb_game_feeds.db"
+
+feed_fetch_max_workers = 64
+game_feed_window = 10
+feed_fetch_host_limits = {
+    "statsapi.mlb.com" : 32
+}
+bref_fetch_max_workers = 4
+
+use_bref_page_cache = True
+bref_page_cache_max_bytes = 512 * 1024 * 1024
+bref_page_cache_current_ttl = 5 * 60
+bref_page_cache_default_ttl = 60 * 60
+use_leaderboard_cache = True
+leaderboard_cache_db = "mlb_leaderboards.db"
+leaderboard_cache_max_entries = 64
+use_id_crosswalk = True
+id_crosswalk_db = "mlb_id_crosswalk.db"
+use_game_log_store = True
+game_log_store_db = "mlb_game_logs.db"
+game_log_store_current_ttl = 60 * 60
 display_progress_as_edit = True
 ignore_approved = True
 
@@ -7337,6 +7370,9 @@ mlb_team_schedule_url_date_format = "https://statsapi.mlb.com/api/v1/schedule?te
 mlb_player_stats_url_format = "https://statsapi.mlb.com/api/v1/people/{}?hydrate=currentTeam,team,stats(type=[yearByYear](team(league)),leagueListId=mlb_hist)"
 mlb_player_schedule_url_format = "https://statsapi.mlb.com/api/v1/people/{}/stats?stats=gameLog&season={}&gameType=R,F,D,L,W"
 mlb_leaderboard_query = "https://bdfed.stitch.mlbinfra.com/bdfed/stats/player?stitch_env=prod&&season={}&playerPool={}&sportId=1&stats=season&group={}&gameType=R&limit={}&offset={}&sortStat={}&order={}"
+bref_page_year_re = re.compile(r"(?:year=|/)(\d{4})(?:-|\.shtml|&|$)")
+game_feed_url_format = "https://statsapi.mlb.com/api/v1.1/game/{}/feed/live"
+game_feed_url_re = re.compile(r"^https://statsapi\.mlb\.com/api/v1\.1/game/(\d+)/feed/live$")
 mlb_leaderboard_query_no_sort = "https://bdfed.stitch.mlbinfra.com/bdfed/stats/player?stitch_env=prod&&season={}&playerPool={}&sportId=1&stats=season&group={}&gameType=R&limit={}&offset={}"
 
 da_totals = None
@@ -7400,6 +7436,22 @@ team_venue_history = None
 with open ("team_venue_history.json", "r") as file:
     team_venue_history = json.load(file)
 
+team_name_index = {}
+for parsed_team_name in team_name_info:
+    for team in team_name_info[parsed_team_name]:
+        for sleague in team_name_info[parsed_team_name][team]:
+            if (team, sleague) not in team_name_index:
+                team_name_index[(team, sleague)] = {
+                    "years" : {},
+                    "fallback" : None
+                }
+            for year in team_name_info[parsed_team_name][team][sleague]:
+                if year not in team_name_index[(team, sleague)]["years"]:
+                    team_name_index[(team, sleague)]["years"][year] = parsed_team_name
+            team_name_index[(team, sleague)]["fallback"] = parsed_team_name
+
+team_venue_year_index = {}
+
 manual_id_maps = None
 with open ("manual_id_maps.json", "r") as file:
     manual_id_maps = json.load(file)
@@ -7462,7 +7514,9 @@ def main():
         conn.close()
 
     global gateway
+    # Size the pool to every comment thread fanning out at once so connections are kept alive instead of discarded
     gateway = ApiGateway("https://www.baseball-reference.com", verbose=True)
+    gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
     endpoints = gateway.start(force=True)
 
     #global fangraphs_gateway
@@ -7514,6 +7568,7 @@ def get_api_gateway(url):
     while True:
         try:
             gateway = ApiGateway(url, verbose=True)
+            gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
             return gateway.start(force=True)
         except botocore.exceptions.ClientError as e:
             err_code = e.response["Error"]["Code"]
@@ -7581,6 +7636,10 @@ def parse_input(gateway_to_use, fangraphs_gateway_to_use, comment, debug_mode, i
         end_time = datetime.datetime.now() - start_time
         time_str = str(end_time)
         logger.info("#" + str(threading.get_ident()) + "#   " + "RunTime : " + time_str)
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Gateway pool : " + str(get_gateway_pool_stats()))
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Rate limiter : " + str(get_rate_limiter_stats()))
+        if use_bref_page_cache:
+            logger.info("#" + str(threading.get_ident()) + "#   " + "BRef page cache : " + str(get_bref_page_cache_stats()))
 
 def sub_parse_input(curr, comment, debug_mode, comment_obj, force_through):
     curr.execute("SELECT 1 FROM mlb WHERE reply_id = ?;", (comment.id, ))
@@ -17659,6 +17718,8 @@ def handle_player_data(player_data, time_frame, player_type, player_page, valid_
         else:
             player_data["mlb_id"] = int(player_link.split('/')[-1])
             player_data["player_link"] = player_link
+            if player_data["id"] not in manual_id_maps:
+                store_id_crosswalk_entry(player_data["mlb_id"], player_data["id"])
             live_game = get_live_game(player_link, player_data, player_type, time_frame, "hide-live" not in extra_stats and season_in_progress, s)
 
         if "Rookie" in time_frame["qualifiers"]:
@@ -17764,8 +17825,7 @@ def handle_player_data(player_data, time_frame, player_type, player_page, valid_
                     if time_frame["time_start"] or time_frame["time_end"]:
                         years_to_use = [valid_year for valid_year in valid_years if time_frame["time_start"] <= valid_year <= time_frame["time_end"]]
 
-                    for year in years_to_use:
-                        all_rows += parse_table(player_data, time_frame, year, player_type)
+                    all_rows += parse_season_tables(player_data, time_frame, years_to_use, player_type)
                 else:
                     all_rows += parse_table(player_data, time_frame, None, player_type)
                     
@@ -17773,10 +17833,7 @@ def handle_player_data(player_data, time_frame, player_type, player_page, valid_
                     all_rows = handle_playoffs_data(all_rows, player_data, player_type, playoff_data, time_frame)
             else:
                 if valid_years:  
-                    for year in range(time_frame["time_start"].year, time_frame["time_end"].year + 1):
-                        if year not in valid_years:
-                            continue
-                        all_rows += parse_table(player_data, time_frame, year, player_type)
+                    all_rows += parse_season_tables(player_data, time_frame, [year for year in range(time_frame["time_start"].year, time_frame["time_end"].year + 1) if year in valid_years], player_type)
                     
                     if time_frame["playoffs"]:
                         all_rows = handle_playoffs_data(all_rows, player_data, player_type, playoff_data, time_frame)
@@ -17975,14 +18032,6 @@ def handle_player_data(player_data, time_frame, player_type, player_page, valid_
 
         if field_player_page != None:
             table = field_player_page.find("table", id="advanced_fielding")
-            if not table:
-                field_comments = field_player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in field_comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id="advanced_fielding")
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 total_rows = table.find("tbody").find_all("tr")
@@ -18732,9 +18781,28 @@ def get_teammate_info(player_data, player_type, comment_obj):
     }
 
     teammate_map = {}
+
+    indexed_participants = {}
+    if use_game_feed_cache:
+        try:
+            indexed_participants = get_indexed_game_participants([int(row_data["MLBGameLink"]) for row_data in sub_player_data["rows"] if "MLBGameLink" in row_data])
+        except Exception:
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to read game participant index\n" + traceback.format_exc())
+
+    missing_rows = []
+    for row_data in sub_player_data["rows"]:
+        if "MLBGameLink" in row_data and int(row_data["MLBGameLink"]) in indexed_participants:
+            team_str = "home" if row_data["Location"] else "away"
+            teammate_map[row_data["DateTime"]] = indexed_participants[int(row_data["MLBGameLink"])][team_str]
+        else:
+            missing_rows.append(row_data)
+
+    count_info["total_count"] = len(missing_rows)
+    logger.info("#" + str(threading.get_ident()) + "#   " + sub_player_data["id"] + " found " + str(len(sub_player_data["rows"]) - len(missing_rows)) + " teammate games in index, fetching " + str(len(missing_rows)))
+
     with requests.Session() as s:
         with ThreadPoolExecutor(max_workers=5) as sub_executor:
-            for row_data in sub_player_data["rows"]:
+            for row_data in missing_rows:
                 future = sub_executor.submit(get_teammate_data, sub_player_data, row_data, s)
                 future.add_done_callback(functools.partial(teammate_result_callback, teammate_map, sub_player_data, row_data, count_info))
 
@@ -18770,12 +18838,11 @@ def get_teammate_data(player_data, row_data, s):
 
     if "message" in sub_data:
         return teammates
-    
+
+    participants = get_game_participants(sub_data)
+
     team_str = "home" if row_data["Location"] else "away"
-    for sub_player in sub_data["liveData"]["boxscore"]["teams"][team_str]["players"]:
-        sub_player = sub_data["liveData"]["boxscore"]["teams"][team_str]["players"][sub_player]
-        if (sub_player["stats"]["batting"] and sub_player["stats"]["batting"]["gamesPlayed"]) or (sub_player["stats"]["pitching"] and sub_player["stats"]["pitching"]["gamesPitched"]):
-            teammates.add(sub_player["person"]["id"])
+    teammates.update(participants[team_str])
     
     return teammates
 
@@ -19563,19 +19630,9 @@ def handle_missing_reg_rows(player_page, player_data, all_rows, player_type, tim
 
 
     seasons = set([row["Year"] for row in all_rows])
-    comments = None
     previous_headers = set()
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             header_columns = table.find("thead").find_all("th")
@@ -19611,19 +19668,9 @@ def handle_missing_reg_rows(player_page, player_data, all_rows, player_type, tim
 
 def handle_missing_playoff_rows(player_page, player_data, valid_years, all_rows, player_type, time_frame):     
     table_names = ["players_batting_postseason", "players_pitching_postseason"]
-    comments = None
     previous_headers = set()
     for table_index, table_name in enumerate(table_names):
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             header_columns = table.find("thead").find_all("th")
@@ -19780,7 +19827,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
             row["cWPA"] = 0
             row["RE24"] = 0
     
-    comments = None
     previous_headers = set()
     has_pitch_war = False
     has_pos_war = False
@@ -19806,15 +19852,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
             table_name = "span_stats"
 
         table = player_page_to_use.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page_to_use.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             header_columns = table.find("thead").find_all("th")
@@ -19876,15 +19913,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
                     table_name = "span_stats"
 
                     table = player_page_to_use.find("table", id=table_name)
-                    if not table:
-                        if not comments:
-                            comments = player_page_to_use.find_all(string=lambda text: isinstance(text, Comment))
-                        for c in comments:
-                            temp_soup = BeautifulSoup(c, "lxml")
-                            temp_table = temp_soup.find("table", id=table_name)
-                            if temp_table:
-                                table = temp_table
-                                break
 
                     if not table:
                         continue
@@ -20057,8 +20085,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
             if not has_pos_war:
                 pot_row["WAR/Yr"] = pot_row[stat]
 
-    comments = None
-    field_comments = None
     previous_headers = set()
     years_have_salary = {}
     drs_year_values = []
@@ -20068,25 +20094,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
             player_page_to_use = field_player_page
 
         table = player_page_to_use.find("table", id=table_name)
-        if not table:
-            if table_name == "advanced_fielding":
-                if not field_comments:
-                    field_comments = player_page_to_use.find_all(string=lambda text: isinstance(text, Comment))
-                for c in field_comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id=table_name)
-                    if temp_table:
-                        table = temp_table
-                        break
-            else:
-                if not comments:
-                    comments = player_page_to_use.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id=table_name)
-                    if temp_table:
-                        table = temp_table
-                        break
 
         if table:
             header_rows = table.find("thead").find_all("tr")
@@ -20194,15 +20201,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
     
     if is_full_career_drs:
         table = player_page.find("table", id="players_standard_fielding")
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id="players_standard_fielding")
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             total_rows = table.find("tfoot").find_all("tr")
@@ -20235,15 +20233,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
 
     if player_type["da_type"] == "Batter" and is_full_career:
         table = player_page.find("table", id="players_value_batting")
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id="players_value_batting")
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             total_rows = table.find("tfoot").find_all("tr")
@@ -20263,15 +20252,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
             allowed_car_war = True
         if allowed_car_war:
             hof_div = player_page.find("div", {"id" : "div_hof_other"})
-            if not hof_div:
-                if not comments:
-                    comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("div", {"id" : "div_hof_other"})
-                    if temp_table:
-                        hof_div = temp_table
-                        break
             if hof_div:
                 hof_table = hof_div.find("table")
                 if hof_table:
@@ -20294,15 +20274,6 @@ def handle_season_only_stats(player_page, field_player_page, player_data, player
 
     if player_data["catch_valid_years"] and (is_full_career_calling_catch or is_full_career_framing_catch):
         table = field_player_page.find("table", id="advanced_fielding")
-        if not table:
-            if not field_comments:
-                field_comments = field_player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in field_comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id="players_standard_fielding")
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             total_rows = table.find("tfoot").find_all("tr")
@@ -20469,18 +20440,8 @@ def handle_awards(player_page, player_data, player_type, time_frame, is_full_car
     has_quals = bool(time_frame["qualifiers"])
     is_full_career = is_full_career if is_full_career else is_career and not has_quals
 
-    comments = None
     for div_id in count_divs:
         count_div = player_page.find("div", id=div_id)
-        if not count_div:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_div = temp_soup.find("div", id=div_id)
-                if temp_div:
-                    count_div = temp_div
-                    break
                     
         if count_div:
             count_table_rows = count_div.find("table").find_all("tr")
@@ -20540,15 +20501,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, is_full_car
                                     break
 
     awards_div = player_page.find("div", id="leaderboard_awards")
-    if not awards_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="leaderboard_awards")
-            if temp_div:
-                awards_div = temp_div
-                break
                 
     if awards_div:
         awards_table_links = awards_div.find("table").find_all("a")
@@ -20655,15 +20607,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, is_full_car
         
     table_name = "players_standard_pitching" if player_type["da_type"] != "Batter" else "players_standard_batting"
     standard_table = player_page.find("table", id=table_name)
-    if not standard_table:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("table", id=table_name)
-            if temp_div:
-                standard_table = temp_div
-                break
     
     if standard_table:
         standard_table_rows = standard_table.find_all("tr")
@@ -20716,15 +20659,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, is_full_car
                                         break
 
     shares_div = player_page.find("div", id="leaderboard_mvp")
-    if not shares_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="leaderboard_mvp")
-            if temp_div:
-                shares_div = temp_div
-                break
                 
     if shares_div:
         shares_table_rows = shares_div.find("table").find_all("td")
@@ -20753,15 +20687,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, is_full_car
 
     if player_type["da_type"] != "Batter":
         shares_div = player_page.find("div", id="leaderboard_cyyoung")
-        if not shares_div:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_div = temp_soup.find("div", id="leaderboard_cyyoung")
-                if temp_div:
-                    shares_div = temp_div
-                    break
                     
         if shares_div:
             shares_table_rows = shares_div.find("table").find_all("td")
@@ -20793,15 +20718,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, is_full_car
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
 
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find_all("tr")
@@ -20843,17 +20759,7 @@ def handle_leading_seasons(player_page, player_data, player_type, time_frame, ye
             for row in all_rows:
                 row[header] = 0.0
 
-    comments = None
     count_div = player_page.find("div", id="div_leaderboard")
-    if not count_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="div_leaderboard")
-            if temp_div:
-                count_div = temp_div
-                break
 
     if not count_div:
         return
@@ -21106,294 +21012,270 @@ def perform_formula_replace(formula, query_row, index, player_type, player_data,
 
     return formula
 
-def perform_qualifier(player_data, player_type, row, time_frame, all_rows):
-    qualifiers = time_frame["qualifiers"]
+def perform_season_index_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
+    for qual_object in qualifiers["Season Index"]:
+        time_index_start = qual_object["values"]["start_val"] - 1
+        time_index_end = qual_object["values"]["end_val"] - 1
+
+        if time_index_start < 0:
+            time_index_start = 0
+        if time_index_end < 0:
+            time_index_end = 0
+        if time_index_start > len(valid_years) - 1:
+            start_val = -1
+            end_val = -1
+        else:
+            if time_index_end > len(valid_years) - 1:
+                time_index_end = len(valid_years) - 1
+            start_val = valid_years[time_index_start]
+            end_val = valid_years[time_index_end]
 
-    if ("fake_playoff_row" in row and row["fake_playoff_row"]) or ("fake_reg_row" in row and row["fake_reg_row"]):
-        return True
+        if qual_object["negate"]:
+            if row["Year"] >= start_val and row["Year"] <= end_val:
+                return False
+        else:
+            if not (row["Year"] >= start_val and row["Year"] <= end_val):
+                return False
 
-    if "Season Index" in qualifiers:
-        valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
-        for qual_object in qualifiers["Season Index"]:
-            time_index_start = qual_object["values"]["start_val"] - 1
-            time_index_end = qual_object["values"]["end_val"] - 1
+    return True
 
-            if time_index_start < 0:
-                time_index_start = 0
-            if time_index_end < 0:
-                time_index_end = 0
-            if time_index_start > len(valid_years) - 1:
-                start_val = -1
-                end_val = -1
-            else:
-                if time_index_end > len(valid_years) - 1:
-                    time_index_end = len(valid_years) - 1
-                start_val = valid_years[time_index_start]
-                end_val = valid_years[time_index_end]
+def perform_season_index_reversed_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
+    valid_years = list(reversed(valid_years))
+    for qual_object in qualifiers["Season Index Reversed"]:
+        time_index_start = qual_object["values"]["end_val"] - 1
+        time_index_end = qual_object["values"]["start_val"] - 1
+
+        if time_index_start < 0:
+            time_index_start = 0
+        if time_index_end < 0:
+            time_index_end = 0
+        if time_index_start > len(valid_years) - 1:
+            start_val = -1
+            end_val = -1
+        else:
+            if time_index_end > len(valid_years) - 1:
+                time_index_end = len(valid_years) - 1
+            start_val = valid_years[time_index_start]
+            end_val = valid_years[time_index_end]
 
-            if qual_object["negate"]:
-                if row["Year"] >= start_val and row["Year"] <= end_val:
-                    return False
-            else:
-                if not (row["Year"] >= start_val and row["Year"] <= end_val):
-                    return False
-    
-    if "Season Index Reversed" in qualifiers:
-        valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
-        valid_years = list(reversed(valid_years))
-        for qual_object in qualifiers["Season Index Reversed"]:
-            time_index_start = qual_object["values"]["end_val"] - 1
-            time_index_end = qual_object["values"]["start_val"] - 1
+        if qual_object["negate"]:
+            if row["Year"] >= start_val and row["Year"] <= end_val:
+                return False
+        else:
+            if not (row["Year"] >= start_val and row["Year"] <= end_val):
+                return False
 
-            if time_index_start < 0:
-                time_index_start = 0
-            if time_index_end < 0:
-                time_index_end = 0
-            if time_index_start > len(valid_years) - 1:
-                start_val = -1
-                end_val = -1
-            else:
-                if time_index_end > len(valid_years) - 1:
-                    time_index_end = len(valid_years) - 1
-                start_val = valid_years[time_index_start]
-                end_val = valid_years[time_index_end]
+    return True
 
-            if qual_object["negate"]:
-                if row["Year"] >= start_val and row["Year"] <= end_val:
-                    return False
-            else:
-                if not (row["Year"] >= start_val and row["Year"] <= end_val):
-                    return False
+def perform_playoff_season_index_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    valid_years = player_data["playoff_valid_years"]
+    for qual_object in qualifiers["Playoff Season Index"]:
+        time_index_start = qual_object["values"]["start_val"] - 1
+        time_index_end = qual_object["values"]["end_val"] - 1
+
+        if time_index_start < 0:
+            time_index_start = 0
+        if time_index_end < 0:
+            time_index_end = 0
+        if time_index_start > len(valid_years) - 1:
+            start_val = -1
+            end_val = -1
+        else:
+            if time_index_end > len(valid_years) - 1:
+                time_index_end = len(valid_years) - 1
+            start_val = valid_years[time_index_start]
+            end_val = valid_years[time_index_end]
 
-    if "Playoff Season Index" in qualifiers:
-        valid_years = player_data["playoff_valid_years"]
-        for qual_object in qualifiers["Playoff Season Index"]:
-            time_index_start = qual_object["values"]["start_val"] - 1
-            time_index_end = qual_object["values"]["end_val"] - 1
+        if qual_object["negate"]:
+            if row["Year"] >= start_val and row["Year"] <= end_val:
+                return False
+        else:
+            if not (row["Year"] >= start_val and row["Year"] <= end_val):
+                return False
 
-            if time_index_start < 0:
-                time_index_start = 0
-            if time_index_end < 0:
-                time_index_end = 0
-            if time_index_start > len(valid_years) - 1:
-                start_val = -1
-                end_val = -1
-            else:
-                if time_index_end > len(valid_years) - 1:
-                    time_index_end = len(valid_years) - 1
-                start_val = valid_years[time_index_start]
-                end_val = valid_years[time_index_end]
+    return True
 
-            if qual_object["negate"]:
-                if row["Year"] >= start_val and row["Year"] <= end_val:
-                    return False
-            else:
-                if not (row["Year"] >= start_val and row["Year"] <= end_val):
-                    return False
-    
-    if "Playoff Season Index Reversed" in qualifiers:
-        valid_years = player_data["playoff_valid_years"]
-        valid_years = list(reversed(valid_years))
-        for qual_object in qualifiers["Playoff Season Index Reversed"]:
-            time_index_start = qual_object["values"]["end_val"] - 1
-            time_index_end = qual_object["values"]["start_val"] - 1
+def perform_playoff_season_index_reversed_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    valid_years = player_data["playoff_valid_years"]
+    valid_years = list(reversed(valid_years))
+    for qual_object in qualifiers["Playoff Season Index Reversed"]:
+        time_index_start = qual_object["values"]["end_val"] - 1
+        time_index_end = qual_object["values"]["start_val"] - 1
+
+        if time_index_start < 0:
+            time_index_start = 0
+        if time_index_end < 0:
+            time_index_end = 0
+        if time_index_start > len(valid_years) - 1:
+            start_val = -1
+            end_val = -1
+        else:
+            if time_index_end > len(valid_years) - 1:
+                time_index_end = len(valid_years) - 1
+            start_val = valid_years[time_index_start]
+            end_val = valid_years[time_index_end]
 
-            if time_index_start < 0:
-                time_index_start = 0
-            if time_index_end < 0:
-                time_index_end = 0
-            if time_index_start > len(valid_years) - 1:
-                start_val = -1
-                end_val = -1
-            else:
-                if time_index_end > len(valid_years) - 1:
-                    time_index_end = len(valid_years) - 1
-                start_val = valid_years[time_index_start]
-                end_val = valid_years[time_index_end]
+        if qual_object["negate"]:
+            if row["Year"] >= start_val and row["Year"] <= end_val:
+                return False
+        else:
+            if not (row["Year"] >= start_val and row["Year"] <= end_val):
+                return False
 
-            if qual_object["negate"]:
-                if row["Year"] >= start_val and row["Year"] <= end_val:
-                    return False
-            else:
-                if not (row["Year"] >= start_val and row["Year"] <= end_val):
-                    return False
+    return True
 
-    if "Rookie" in qualifiers:
-        for qual_object in qualifiers["Rookie"]:
-            if qual_object["negate"]:
-                if row["Year"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Year"] in qual_object["values"]:
-                    return False
+def perform_rookie_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Rookie"]:
+        if qual_object["negate"]:
+            if row["Year"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Year"] in qual_object["values"]:
+                return False
+
+    return True
 
-    if "Facing Former Team" in qualifiers:
-        for qual_object in qualifiers["Facing Former Team"]:
-            has_match =  row["Opponent"].upper() in player_data["valid_teams_order"]["team"]
+def perform_facing_former_team_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Facing Former Team"]:
+        has_match =  row["Opponent"].upper() in player_data["valid_teams_order"]["team"]
+        if has_match:
+            if isinstance(player_data["valid_teams_order"]["team"][row["Opponent"].upper()], int):
+                has_match = row["Year"] > player_data["valid_teams_order"]["team"][row["Opponent"].upper()]
+            else:
+                has_match = row["DateTime"] > player_data["valid_teams_order"]["team"][row["Opponent"].upper()]
+        if qual_object["negate"]:
             if has_match:
-                if isinstance(player_data["valid_teams_order"]["team"][row["Opponent"].upper()], int):
-                    has_match = row["Year"] > player_data["valid_teams_order"]["team"][row["Opponent"].upper()]
-                else:
-                    has_match = row["DateTime"] > player_data["valid_teams_order"]["team"][row["Opponent"].upper()]
-            if qual_object["negate"]:
-                if has_match:
-                    return False
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_facing_former_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    year = str(row["Year"])
+    team = row["Opponent"].upper()
+    sleague = row["OppLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
+
+    for qual_object in qualifiers["Facing Former Franchise"]:
+        has_match =  team_franchise in player_data["valid_teams_order"]["franchise"]
+        if has_match:
+            if isinstance(player_data["valid_teams_order"]["franchise"][team_franchise], int):
+                has_match = row["Year"] > player_data["valid_teams_order"]["franchise"][team_franchise]
             else:
-                if not has_match:
-                    return False
-    
-    if "Facing Former Franchise" in qualifiers:
-        year = str(row["Year"])
-        team = row["Opponent"].upper()
-        sleague = row["OppLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
+                has_match = row["DateTime"] > player_data["valid_teams_order"]["franchise"][team_franchise]
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
 
-        for qual_object in qualifiers["Facing Former Franchise"]:
-            has_match =  team_franchise in player_data["valid_teams_order"]["franchise"]
+def perform_with_new_team_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["With New Team"]:
+        has_match = row["Tm"] != list(player_data["valid_team_ranges"]["team"].keys())[0]
+        if has_match:
+            first_year = list(player_data["valid_team_ranges"]["team"][row["Tm"]].keys())[0]
+            has_match = row["Year"] == first_year
             if has_match:
-                if isinstance(player_data["valid_teams_order"]["franchise"][team_franchise], int):
-                    has_match = row["Year"] > player_data["valid_teams_order"]["franchise"][team_franchise]
-                else:
-                    has_match = row["DateTime"] > player_data["valid_teams_order"]["franchise"][team_franchise]
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "With New Team" in qualifiers:
-        for qual_object in qualifiers["With New Team"]:
-            has_match = row["Tm"] != list(player_data["valid_team_ranges"]["team"].keys())[0]
+                first_range = player_data["valid_team_ranges"]["team"][row["Tm"]][first_year][0]
+                has_match = row["DateTime"] >= first_range["start"] and row["DateTime"] <= first_range["end"]
+        if qual_object["negate"]:
             if has_match:
-                first_year = list(player_data["valid_team_ranges"]["team"][row["Tm"]].keys())[0]
-                has_match = row["Year"] == first_year
-                if has_match:
-                    first_range = player_data["valid_team_ranges"]["team"][row["Tm"]][first_year][0]
-                    has_match = row["DateTime"] >= first_range["start"] and row["DateTime"] <= first_range["end"]
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "With New Franchise" in qualifiers:
-        year = str(row["Year"])
-        team = row["Opponent"].upper()
-        sleague = row["OppLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_with_new_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    year = str(row["Year"])
+    team = row["Opponent"].upper()
+    sleague = row["OppLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-        for qual_object in qualifiers["With New Franchise"]:
-            has_match = team_franchise != list(player_data["valid_team_ranges"]["franchise"].keys())[0]
+    for qual_object in qualifiers["With New Franchise"]:
+        has_match = team_franchise != list(player_data["valid_team_ranges"]["franchise"].keys())[0]
+        if has_match:
+            first_year = list(player_data["valid_team_ranges"]["franchise"][team_franchise].keys())[0]
+            has_match = row["Year"] == first_year
             if has_match:
-                first_year = list(player_data["valid_team_ranges"]["franchise"][team_franchise].keys())[0]
-                has_match = row["Year"] == first_year
-                if has_match:
-                    first_range = player_data["valid_team_ranges"]["franchise"][team_franchise][first_year][0]
-                    has_match = row["DateTime"] >= first_range["start"] and row["DateTime"] <= first_range["end"]
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+                first_range = player_data["valid_team_ranges"]["franchise"][team_franchise][first_year][0]
+                has_match = row["DateTime"] >= first_range["start"] and row["DateTime"] <= first_range["end"]
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_decision_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Start"] or ("InProgress" in row and row["InProgress"]):
+        return False
         
-    if "Decision" in qualifiers:
-        if not row["Start"] or ("InProgress" in row and row["InProgress"]):
-            return False
-            
-        for qual_object in qualifiers["Decision"]:
-            if qual_object["negate"]:
-                if not row.get("ND", 0):
-                    return False
-            else:
-                if row.get("ND", 0):
-                    return False
-    
-    if "Season Age" in qualifiers:
-        for qual_object in qualifiers["Season Age"]:
-            player_age_date = player_season_age_date.replace(year=row["Year"])
-            player_delt = dateutil.relativedelta.relativedelta(player_age_date, player_data["Birthday"])
-            player_delt_start = qual_object["time_unit_start"].year if qual_object["time_unit_start"] == datetime.date.min else qual_object["time_unit_start"].years
-            player_delt_end = qual_object["time_unit_end"].year if qual_object["time_unit_end"] == datetime.date.max else qual_object["time_unit_end"].years
-            if qual_object["negate"]:
-                if player_delt.years >= player_delt_start and player_delt.years <= player_delt_end:
-                    return False
-            else:
-                if not (player_delt.years >= player_delt_start and player_delt.years <= player_delt_end):
-                    return False
+    for qual_object in qualifiers["Decision"]:
+        if qual_object["negate"]:
+            if not row.get("ND", 0):
+                return False
+        else:
+            if row.get("ND", 0):
+                return False
 
-    if "Age" in qualifiers:
-        for qual_object in qualifiers["Age"]:
-            player_delt_start = datetime.date.min if qual_object["time_unit_start"] == datetime.date.min else player_data["Birthday"] + qual_object["time_unit_start"]
-            player_delt_end = datetime.date.max if qual_object["time_unit_end"] == datetime.date.max else player_data["Birthday"] + qual_object["time_unit_end"]
-            if qual_object["negate"]:
-                if row["Date"] >= player_delt_start and row["Date"] <= player_delt_end:
-                    return False
-            else:
-                if not (row["Date"] >= player_delt_start and row["Date"] <= player_delt_end):
-                    return False
+    return True
 
-    if "Round" in qualifiers:
-        if not row["is_playoffs"]:
-            return False
-        for qual_object in qualifiers["Round"]:
-            if qual_object["negate"]:
-                if row["Round"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Round"] in qual_object["values"]:
-                    return False
+def perform_season_age_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Season Age"]:
+        player_age_date = player_season_age_date.replace(year=row["Year"])
+        player_delt = dateutil.relativedelta.relativedelta(player_age_date, player_data["Birthday"])
+        player_delt_start = qual_object["time_unit_start"].year if qual_object["time_unit_start"] == datetime.date.min else qual_object["time_unit_start"].years
+        player_delt_end = qual_object["time_unit_end"].year if qual_object["time_unit_end"] == datetime.date.max else qual_object["time_unit_end"].years
+        if qual_object["negate"]:
+            if player_delt.years >= player_delt_start and player_delt.years <= player_delt_end:
+                return False
+        else:
+            if not (player_delt.years >= player_delt_start and player_delt.years <= player_delt_end):
+                return False
 
-    if "First Half" in qualifiers:
-        for qual_object in qualifiers["First Half"]:
-            year = row["Year"]
-            if str(year) in all_star_games:
-                all_star_date = dateutil.parser.parse(all_star_games[str(year)])
-                all_star_date = all_star_date.replace(year=year)
-                if qual_object["negate"]:
-                    if row["Date"] < all_star_date.date():
-                        return False
-                else:
-                    if row["Date"] >= all_star_date.date():
-                        return False
-            else:
-                is_first_half = row["TmGm"] / player_data["team_games_map"][row["Year"]][row["Tm"]] <= 0.5
-                if qual_object["negate"]:
-                    if is_first_half:
-                        return False
-                else:
-                    if not is_first_half:
-                        return False
+    return True
 
-    if "Second Half" in qualifiers:
-        for qual_object in qualifiers["Second Half"]:
-            year = row["Year"]
-            if str(year) in all_star_games:
-                all_star_date = dateutil.parser.parse(all_star_games[str(year)])
-                all_star_date = all_star_date.replace(year=year)
-                if qual_object["negate"]:
-                    if row["Date"] >= all_star_date.date():
-                        return False
-                else:
-                    if row["Date"] < all_star_date.date():
-                        return False
-            else:
-                is_second_half = row["TmGm"] / player_data["team_games_map"][row["Year"]][row["Tm"]] > 0.5
-                if qual_object["negate"]:
-                    if is_second_half:
-                        return False
-                else:
-                    if not is_second_half:
-                        return False
-    
-    if "Pre All-Star" in qualifiers:
-        year = row["Year"]
-        if str(year) not in all_star_games:
-            return False
+def perform_age_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Age"]:
+        player_delt_start = datetime.date.min if qual_object["time_unit_start"] == datetime.date.min else player_data["Birthday"] + qual_object["time_unit_start"]
+        player_delt_end = datetime.date.max if qual_object["time_unit_end"] == datetime.date.max else player_data["Birthday"] + qual_object["time_unit_end"]
+        if qual_object["negate"]:
+            if row["Date"] >= player_delt_start and row["Date"] <= player_delt_end:
+                return False
+        else:
+            if not (row["Date"] >= player_delt_start and row["Date"] <= player_delt_end):
+                return False
+
+    return True
+
+def perform_round_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["is_playoffs"]:
+        return False
+    for qual_object in qualifiers["Round"]:
+        if qual_object["negate"]:
+            if row["Round"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Round"] in qual_object["values"]:
+                return False
+
+    return True
 
-        for qual_object in qualifiers["Pre All-Star"]:
+def perform_first_half_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["First Half"]:
+        year = row["Year"]
+        if str(year) in all_star_games:
             all_star_date = dateutil.parser.parse(all_star_games[str(year)])
             all_star_date = all_star_date.replace(year=year)
             if qual_object["negate"]:
@@ -21402,13 +21284,21 @@ def perform_qualifier(player_data, player_type, row, time_frame, all_rows):
             else:
                 if row["Date"] >= all_star_date.date():
                     return False
-    
-    if "Post All-Star" in qualifiers:
-        year = row["Year"]
-        if str(year) not in all_star_games:
-            return False
+        else:
+            is_first_half = row["TmGm"] / player_data["team_games_map"][row["Year"]][row["Tm"]] <= 0.5
+            if qual_object["negate"]:
+                if is_first_half:
+                    return False
+            else:
+                if not is_first_half:
+                    return False
+
+    return True
 
-        for qual_object in qualifiers["Post All-Star"]:
+def perform_second_half_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Second Half"]:
+        year = row["Year"]
+        if str(year) in all_star_games:
             all_star_date = dateutil.parser.parse(all_star_games[str(year)])
             all_star_date = all_star_date.replace(year=year)
             if qual_object["negate"]:
@@ -21417,2139 +21307,2563 @@ def perform_qualifier(player_data, player_type, row, time_frame, all_rows):
             else:
                 if row["Date"] < all_star_date.date():
                     return False
-
-    if "Location" in qualifiers:
-        for qual_object in qualifiers["Location"]:
-            if row["Location"]:
-                if qual_object["negate"]:
-                    if "home" in qual_object["values"]:
-                        return False
-                else:
-                    if not "home" in qual_object["values"]:
-                        return False
-            else:
-                if qual_object["negate"]:
-                    if "away" in qual_object["values"]:
-                        return False
-                else:
-                    if not "away" in qual_object["values"]:
-                        return False
-
-    if "Activated From IL" in qualifiers:
-        if "transactions" not in player_data:
-            return False
-
-        off_il_dates = set()
-        all_team_ids = set()
-        for league in team_ids:
-            all_team_ids.update(team_ids[league].values())
-            
-        for transaction in player_data["transactions"]:
-            if transaction["toTeam"]["id"] in all_team_ids and transaction["typeCode"] == "SC":
-                if transaction["description"].startswith(transaction["toTeam"]["name"] + " activated ") and (transaction["description"].endswith(" injured list.") or transaction["description"].endswith(" disabled list.")):
-                    off_il_dates.add(dateutil.parser.parse(transaction["date"]).date())
-
-        is_coming_off_il = row["Date"] in off_il_dates
-        for qual_object in qualifiers["Activated From IL"]:
-            if is_coming_off_il:
-                if qual_object["negate"]:
+        else:
+            is_second_half = row["TmGm"] / player_data["team_games_map"][row["Year"]][row["Tm"]] > 0.5
+            if qual_object["negate"]:
+                if is_second_half:
                     return False
             else:
-                if not qual_object["negate"]:
+                if not is_second_half:
                     return False
 
-    if "Activated" in qualifiers:
-        if "transactions" not in player_data:
-            return False
+    return True
 
-        off_il_dates = set()
-        all_team_ids = set()
-        for league in team_ids:
-            all_team_ids.update(team_ids[league].values())
-            
-        for transaction in player_data["transactions"]:
-            if transaction["toTeam"]["id"] in all_team_ids and transaction["typeCode"] == "SC":
-                if transaction["description"].startswith(transaction["toTeam"]["name"] + " activated "):
-                    off_il_dates.add(dateutil.parser.parse(transaction["date"]).date())
-
-        is_coming_off_il = row["Date"] in off_il_dates
-        for qual_object in qualifiers["Activated"]:
-            if is_coming_off_il:
-                if qual_object["negate"]:
-                    return False
-            else:
-                if not qual_object["negate"]:
-                    return False
-    
-    if "Temperate Season" in qualifiers:
-        for qual_object in qualifiers["Temperate Season"]:
-            winter_start = ephem.date(ephem.previous_winter_solstice(str(row["Year"]))).datetime().date()
-            spring_start = ephem.date(ephem.next_spring_equinox(str(row["Year"]))).datetime().date()
-            summer_start = ephem.date(ephem.next_summer_solstice(str(row["Year"]))).datetime().date()
-            fall_start = ephem.date(ephem.next_fall_equinox(str(row["Year"]))).datetime().date()
-            winter_2_start = ephem.date(ephem.next_winter_solstice(str(row["Year"]))).datetime().date()
+def perform_pre_all_star_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    year = row["Year"]
+    if str(year) not in all_star_games:
+        return False
 
-            season = None
-            if row["Date"] >= winter_start and row["Date"] < spring_start:
-                season = "Winter"
-            elif row["Date"] >= spring_start and row["Date"] < summer_start:
-                season = "Spring"
-            elif row["Date"] >= summer_start and row["Date"] < fall_start:
-                season = "Summer"
-            elif row["Date"] >= fall_start and row["Date"] < winter_2_start:
-                season = "Fall"
-            else:
-                season = "Winter"
+    for qual_object in qualifiers["Pre All-Star"]:
+        all_star_date = dateutil.parser.parse(all_star_games[str(year)])
+        all_star_date = all_star_date.replace(year=year)
+        if qual_object["negate"]:
+            if row["Date"] < all_star_date.date():
+                return False
+        else:
+            if row["Date"] >= all_star_date.date():
+                return False
 
-            if qual_object["negate"]:
-                if season in qual_object["values"]:
-                    return False
-            else:
-                if not season in qual_object["values"]:
-                    return False
+    return True
 
-    if "Previous Location" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Location"]:
-            if row["Previous Row"]["Location"]:
-                if qual_object["negate"]:
-                    if "home" in qual_object["values"]:
-                        return False
-                else:
-                    if not "home" in qual_object["values"]:
-                        return False
-            elif row["Previous Row"]["Location"] == False:
-                if qual_object["negate"]:
-                    if "away" in qual_object["values"]:
-                        return False
-                else:
-                    if not "away" in qual_object["values"]:
-                        return False
+def perform_post_all_star_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    year = row["Year"]
+    if str(year) not in all_star_games:
+        return False
 
-    if "Upcoming Location" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Location"]:
-            if row["Upcoming Row"]["Location"]:
-                if qual_object["negate"]:
-                    if "home" in qual_object["values"]:
-                        return False
-                else:
-                    if not "home" in qual_object["values"]:
-                        return False
-            elif row["Upcoming Row"]["Location"] == False:
-                if qual_object["negate"]:
-                    if "away" in qual_object["values"]:
-                        return False
-                else:
-                    if not "away" in qual_object["values"]:
-                        return False
+    for qual_object in qualifiers["Post All-Star"]:
+        all_star_date = dateutil.parser.parse(all_star_games[str(year)])
+        all_star_date = all_star_date.replace(year=year)
+        if qual_object["negate"]:
+            if row["Date"] >= all_star_date.date():
+                return False
+        else:
+            if row["Date"] < all_star_date.date():
+                return False
 
-    if "Team" in qualifiers:
-        for qual_object in qualifiers["Team"]:
+    return True
+
+def perform_location_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Location"]:
+        if row["Location"]:
             if qual_object["negate"]:
-                if row["Tm"].lower() in qual_object["values"]:
+                if "home" in qual_object["values"]:
                     return False
             else:
-                if not row["Tm"].lower() in qual_object["values"]:
+                if not "home" in qual_object["values"]:
                     return False
-    
-    if "Opponent" in qualifiers:
-        for qual_object in qualifiers["Opponent"]:
+        else:
             if qual_object["negate"]:
-                if row["Opponent"] in qual_object["values"]:
+                if "away" in qual_object["values"]:
                     return False
             else:
-                if not row["Opponent"] in qual_object["values"]:
+                if not "away" in qual_object["values"]:
                     return False
-    
-    if "Team Franchise" in qualifiers:
-        year = str(row["Year"])
-        team = row["Tm"].upper()
-        sleague = row["TmLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
 
-        for qual_object in qualifiers["Team Franchise"]:
-            if qual_object["negate"]:
-                if team_franchise.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not team_franchise.lower() in qual_object["values"]:
-                    return False
-    
-    if "Opponent Franchise" in qualifiers:
-        year = str(row["Year"])
-        team = row["Opponent"].upper()
-        sleague = row["OppLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
+    return True
 
-        for qual_object in qualifiers["Opponent Franchise"]:
-            if qual_object["negate"]:
-                if team_franchise.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not team_franchise.lower() in qual_object["values"]:
-                    return False
+def perform_activated_from_il_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "transactions" not in player_data:
+        return False
 
-    if "Previous Team" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Team"]:
-            if qual_object["negate"]:
-                if row["Previous Row"]["Tm"].lower() in qual_object["values"]:
-                    return False
-            else:
-                if not row["Previous Row"]["Tm"].lower() in qual_object["values"]:
-                    return False
+    off_il_dates = set()
+    all_team_ids = set()
+    for league in team_ids:
+        all_team_ids.update(team_ids[league].values())
+        
+    for transaction in player_data["transactions"]:
+        if transaction["toTeam"]["id"] in all_team_ids and transaction["typeCode"] == "SC":
+            if transaction["description"].startswith(transaction["toTeam"]["name"] + " activated ") and (transaction["description"].endswith(" injured list.") or transaction["description"].endswith(" disabled list.")):
+                off_il_dates.add(dateutil.parser.parse(transaction["date"]).date())
 
-    if "Previous Opponent" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Opponent"]:
-            if qual_object["negate"]:
-                if row["Previous Row"]["Opponent"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Previous Row"]["Opponent"] in qual_object["values"]:
-                    return False
-    
-    if "Upcoming Team" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Team"]:
+    is_coming_off_il = row["Date"] in off_il_dates
+    for qual_object in qualifiers["Activated From IL"]:
+        if is_coming_off_il:
             if qual_object["negate"]:
-                if row["Upcoming Row"]["Tm"].lower() in qual_object["values"]:
-                    return False
-            else:
-                if not row["Upcoming Row"]["Tm"].lower() in qual_object["values"]:
-                    return False
+                return False
+        else:
+            if not qual_object["negate"]:
+                return False
 
-    if "Upcoming Opponent" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Opponent"]:
-            if qual_object["negate"]:
-                if row["Upcoming Row"]["Opponent"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Upcoming Row"]["Opponent"] in qual_object["values"]:
-                    return False
+    return True
 
-    if "Previous Team Franchise" in qualifiers:
-        if not row["Previous Row"]:
-            return False
+def perform_activated_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "transactions" not in player_data:
+        return False
 
-        year = str(row["Previous Row"]["Year"])
-        team = row["Previous Row"]["Tm"].upper()
-        sleague = row["Previous Row"]["TmLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
+    off_il_dates = set()
+    all_team_ids = set()
+    for league in team_ids:
+        all_team_ids.update(team_ids[league].values())
+        
+    for transaction in player_data["transactions"]:
+        if transaction["toTeam"]["id"] in all_team_ids and transaction["typeCode"] == "SC":
+            if transaction["description"].startswith(transaction["toTeam"]["name"] + " activated "):
+                off_il_dates.add(dateutil.parser.parse(transaction["date"]).date())
 
-        for qual_object in qualifiers["Previous Team Franchise"]:
+    is_coming_off_il = row["Date"] in off_il_dates
+    for qual_object in qualifiers["Activated"]:
+        if is_coming_off_il:
             if qual_object["negate"]:
-                if team_franchise.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not team_franchise.lower() in qual_object["values"]:
-                    return False
-    
-    if "Previous Opponent Franchise" in qualifiers:
-        if not row["Previous Row"]:
-            return False
+                return False
+        else:
+            if not qual_object["negate"]:
+                return False
 
-        year = str(row["Previous Row"]["Year"])
-        team = row["Previous Row"]["Opponent"].upper()
-        sleague = row["Previous Row"]["OppLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
+    return True
 
-        for qual_object in qualifiers["Previous Opponent Franchise"]:
-            if qual_object["negate"]:
-                if team_franchise.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not team_franchise.lower() in qual_object["values"]:
-                    return False
+def perform_temperate_season_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Temperate Season"]:
+        winter_start = ephem.date(ephem.previous_winter_solstice(str(row["Year"]))).datetime().date()
+        spring_start = ephem.date(ephem.next_spring_equinox(str(row["Year"]))).datetime().date()
+        summer_start = ephem.date(ephem.next_summer_solstice(str(row["Year"]))).datetime().date()
+        fall_start = ephem.date(ephem.next_fall_equinox(str(row["Year"]))).datetime().date()
+        winter_2_start = ephem.date(ephem.next_winter_solstice(str(row["Year"]))).datetime().date()
+
+        season = None
+        if row["Date"] >= winter_start and row["Date"] < spring_start:
+            season = "Winter"
+        elif row["Date"] >= spring_start and row["Date"] < summer_start:
+            season = "Spring"
+        elif row["Date"] >= summer_start and row["Date"] < fall_start:
+            season = "Summer"
+        elif row["Date"] >= fall_start and row["Date"] < winter_2_start:
+            season = "Fall"
+        else:
+            season = "Winter"
 
-    if "Upcoming Team Franchise" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
+        if qual_object["negate"]:
+            if season in qual_object["values"]:
+                return False
+        else:
+            if not season in qual_object["values"]:
+                return False
 
-        year = str(row["Upcoming Row"]["Year"])
-        team = row["Upcoming Row"]["Tm"].upper()
-        sleague = row["Upcoming Row"]["TmLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
+    return True
 
-        for qual_object in qualifiers["Upcoming Team Franchise"]:
+def perform_previous_location_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Location"]:
+        if row["Previous Row"]["Location"]:
             if qual_object["negate"]:
-                if team_franchise.lower() in qual_object["values"]:
+                if "home" in qual_object["values"]:
                     return False
             else:
-                if not team_franchise.lower() in qual_object["values"]:
+                if not "home" in qual_object["values"]:
                     return False
-    
-    if "Upcoming Opponent Franchise" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-            
-        year = str(row["Upcoming Row"]["Year"])
-        team = row["Upcoming Row"]["Opponent"].upper()
-        sleague = row["Upcoming Row"]["OppLg"]
-        team_franchise = team_main_abbr[sleague][year][team]
-
-        for qual_object in qualifiers["Upcoming Opponent Franchise"]:
+        elif row["Previous Row"]["Location"] == False:
             if qual_object["negate"]:
-                if team_franchise.lower() in qual_object["values"]:
+                if "away" in qual_object["values"]:
                     return False
             else:
-                if not team_franchise.lower() in qual_object["values"]:
+                if not "away" in qual_object["values"]:
                     return False
 
-    if "Team League" in qualifiers:
-        sleague = row["TmLg"]
+    return True
 
-        for qual_object in qualifiers["Team League"]:
+def perform_upcoming_location_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Location"]:
+        if row["Upcoming Row"]["Location"]:
             if qual_object["negate"]:
-                if sleague.lower() in qual_object["values"]:
+                if "home" in qual_object["values"]:
                     return False
             else:
-                if not sleague.lower() in qual_object["values"]:
+                if not "home" in qual_object["values"]:
                     return False
-
-    if "Opponent League" in qualifiers:
-        sleague = row["OppLg"]
-
-        for qual_object in qualifiers["Opponent League"]:
+        elif row["Upcoming Row"]["Location"] == False:
             if qual_object["negate"]:
-                if sleague.lower() in qual_object["values"]:
+                if "away" in qual_object["values"]:
                     return False
             else:
-                if not sleague.lower() in qual_object["values"]:
+                if not "away" in qual_object["values"]:
                     return False
 
-    if "Previous Team League" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        sleague = row["Previous Row"]["TmLg"]
+    return True
 
-        for qual_object in qualifiers["Previous Team League"]:
-            if qual_object["negate"]:
-                if sleague.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not sleague.lower() in qual_object["values"]:
-                    return False
+def perform_team_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Team"]:
+        if qual_object["negate"]:
+            if row["Tm"].lower() in qual_object["values"]:
+                return False
+        else:
+            if not row["Tm"].lower() in qual_object["values"]:
+                return False
 
-    if "Previous Opponent League" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        sleague = row["Previous Row"]["OppLg"]
+    return True
 
-        for qual_object in qualifiers["Previous Opponent League"]:
-            if qual_object["negate"]:
-                if sleague.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not sleague.lower() in qual_object["values"]:
-                    return False
-    
-    if "Upcoming Team League" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        sleague = row["Upcoming Row"]["TmLg"]
+def perform_opponent_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Opponent"]:
+        if qual_object["negate"]:
+            if row["Opponent"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Opponent"] in qual_object["values"]:
+                return False
 
-        for qual_object in qualifiers["Upcoming Team League"]:
-            if qual_object["negate"]:
-                if sleague.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not sleague.lower() in qual_object["values"]:
-                    return False
+    return True
 
-    if "Upcoming Opponent League" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        sleague = row["Upcoming Row"]["OppLg"]
+def perform_team_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    year = str(row["Year"])
+    team = row["Tm"].upper()
+    sleague = row["TmLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-        for qual_object in qualifiers["Upcoming Opponent League"]:
-            if qual_object["negate"]:
-                if sleague.lower() in qual_object["values"]:
-                    return False
-            else:
-                if not sleague.lower() in qual_object["values"]:
-                    return False
+    for qual_object in qualifiers["Team Franchise"]:
+        if qual_object["negate"]:
+            if team_franchise.lower() in qual_object["values"]:
+                return False
+        else:
+            if not team_franchise.lower() in qual_object["values"]:
+                return False
 
-    if "Previous Same Opponent" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Same Opponent"]:
-            if qual_object["negate"]:
-                if row["Previous Row"]["Opponent"] == row["Opponent"]:
-                    return False
-            else:
-                if not row["Previous Row"]["Opponent"] == row["Opponent"]:
-                    return False
-    
-    if "Upcoming Same Opponent" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Same Opponent"]:
-            if qual_object["negate"]:
-                if row["Upcoming Row"]["Opponent"] == row["Opponent"]:
-                    return False
-            else:
-                if not row["Upcoming Row"]["Opponent"] == row["Opponent"]:
-                    return False
-    
-    if "Interleague" in qualifiers:
-        sleague_team = row["TmLg"]
-        sleague_opponent = row["OppLg"]
+    return True
 
-        for qual_object in qualifiers["Interleague"]:
-            if qual_object["negate"]:
-                if sleague_team != sleague_opponent:
-                    return False
-            else:
-                if not sleague_team != sleague_opponent:
-                    return False
-    
-    if "Intraleague" in qualifiers:
-        sleague_team = row["TmLg"]
-        sleague_opponent = row["OppLg"]
+def perform_opponent_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    year = str(row["Year"])
+    team = row["Opponent"].upper()
+    sleague = row["OppLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-        for qual_object in qualifiers["Intraleague"]:
-            if qual_object["negate"]:
-                if sleague_team == sleague_opponent:
-                    return False
-            else:
-                if not sleague_team == sleague_opponent:
-                    return False
-    
-    if "Sub Query" in qualifiers:
-        for qual_object in qualifiers["Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["GameID"] in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Or Sub Query" in qualifiers:
-        has_any_match = False
-        for qual_object in qualifiers["Or Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["GameID"] in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if not has_match:
-                    has_any_match = True
-            else:
-                if has_match:
-                    has_any_match = True
-        if not has_any_match:
-            return False
-    
-    if "Day Of Sub Query" in qualifiers:
-        for qual_object in qualifiers["Day Of Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Day After Sub Query" in qualifiers:
-        for qual_object in qualifiers["Day After Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Day Before Sub Query" in qualifiers:
-        for qual_object in qualifiers["Day Before Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Game After Sub Query" in qualifiers:
-        all_games = player_data["all_games"][row["Year"]]
+    for qual_object in qualifiers["Opponent Franchise"]:
+        if qual_object["negate"]:
+            if team_franchise.lower() in qual_object["values"]:
+                return False
+        else:
+            if not team_franchise.lower() in qual_object["values"]:
+                return False
 
-        game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
-        if game_index == 0:
-            return False
-        previous_game = all_games[game_index - 1]["GameID"]
+    return True
 
-        for qual_object in qualifiers["Game After Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if previous_game in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Game Before Sub Query" in qualifiers:
-        all_games = player_data["all_games"][row["Year"]]
+def perform_previous_team_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Team"]:
+        if qual_object["negate"]:
+            if row["Previous Row"]["Tm"].lower() in qual_object["values"]:
+                return False
+        else:
+            if not row["Previous Row"]["Tm"].lower() in qual_object["values"]:
+                return False
 
-        game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
-        if game_index == len(all_games) - 1:
-            return False
-        next_game = all_games[game_index + 1]["GameID"]
+    return True
 
-        for qual_object in qualifiers["Game Before Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if next_game in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+def perform_previous_opponent_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Opponent"]:
+        if qual_object["negate"]:
+            if row["Previous Row"]["Opponent"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Previous Row"]["Opponent"] in qual_object["values"]:
+                return False
 
-    if "Season Sub Query" in qualifiers:
-        for qual_object in qualifiers["Season Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Year"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Or Season Sub Query" in qualifiers:
-        has_row_match = False
-        for qual_object in qualifiers["Or Season Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Year"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if not has_match:
-                    has_row_match = True
-            else:
-                if has_match:
-                    has_row_match = True
-        if not has_row_match:
-            return False
+    return True
 
-    if "Season After Sub Query" in qualifiers:
-        valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
+def perform_upcoming_team_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Team"]:
+        if qual_object["negate"]:
+            if row["Upcoming Row"]["Tm"].lower() in qual_object["values"]:
+                return False
+        else:
+            if not row["Upcoming Row"]["Tm"].lower() in qual_object["values"]:
+                return False
 
-        if row["Year"] not in valid_years:
-            return False
+    return True
 
-        year_index = valid_years.index(row["Year"])
-        if year_index == 0:
-            return False
-        previous_year = valid_years[year_index - 1]
+def perform_upcoming_opponent_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Opponent"]:
+        if qual_object["negate"]:
+            if row["Upcoming Row"]["Opponent"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Upcoming Row"]["Opponent"] in qual_object["values"]:
+                return False
 
-        for qual_object in qualifiers["Season After Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if previous_year in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    return True
 
-    if "Season Before Sub Query" in qualifiers:
-        valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
+def perform_previous_team_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
 
-        if row["Year"] not in valid_years:
-            return False
+    year = str(row["Previous Row"]["Year"])
+    team = row["Previous Row"]["Tm"].upper()
+    sleague = row["Previous Row"]["TmLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-        year_index = valid_years.index(row["Year"])
-        if year_index == len(valid_years) - 1:
-            return False
-        next_year = valid_years[year_index + 1]
+    for qual_object in qualifiers["Previous Team Franchise"]:
+        if qual_object["negate"]:
+            if team_franchise.lower() in qual_object["values"]:
+                return False
+        else:
+            if not team_franchise.lower() in qual_object["values"]:
+                return False
 
-        for qual_object in qualifiers["Season Before Sub Query"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if next_year in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    return True
 
-    if "Playing With" in qualifiers:
-        for qual_object in qualifiers["Playing With"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+def perform_previous_opponent_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
 
-    if "Playing Against" in qualifiers:
-        for qual_object in qualifiers["Playing Against"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Playing Same Game" in qualifiers:
-        for qual_object in qualifiers["Playing Same Game"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    year = str(row["Previous Row"]["Year"])
+    team = row["Previous Row"]["Opponent"].upper()
+    sleague = row["Previous Row"]["OppLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-    if "Previous Playing With" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Playing With"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["Previous Row"]["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    for qual_object in qualifiers["Previous Opponent Franchise"]:
+        if qual_object["negate"]:
+            if team_franchise.lower() in qual_object["values"]:
+                return False
+        else:
+            if not team_franchise.lower() in qual_object["values"]:
+                return False
 
-    if "Upcoming Playing With" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Playing With"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["Upcoming Row"]["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    return True
 
-    if "Previous Playing Against" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Playing Against"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["Previous Row"]["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+def perform_upcoming_team_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
 
-    if "Upcoming Playing Against" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Playing Against"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Tm"].lower() in player["games"] and row["Upcoming Row"]["GameID"] in player["games"][row["Tm"].lower()]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Playing Same Opponents" in qualifiers:
-        for qual_object in qualifiers["Playing Same Opponents"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Opponent"] in player["games"] and row["Year"] in player["games"][row["Opponent"]]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Playing Same Date" in qualifiers:
-        for qual_object in qualifiers["Playing Same Date"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    year = str(row["Upcoming Row"]["Year"])
+    team = row["Upcoming Row"]["Tm"].upper()
+    sleague = row["Upcoming Row"]["TmLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-    if "Day After Pitching" in qualifiers:
-        for qual_object in qualifiers["Day After Pitching"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Day After Hitting" in qualifiers:
-        for qual_object in qualifiers["Day After Hitting"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Day Before Pitching" in qualifiers:
-        for qual_object in qualifiers["Day Before Pitching"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Day Before Hitting" in qualifiers:
-        for qual_object in qualifiers["Day Before Hitting"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if row["Date"] in player["games"]:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    for qual_object in qualifiers["Upcoming Team Franchise"]:
+        if qual_object["negate"]:
+            if team_franchise.lower() in qual_object["values"]:
+                return False
+        else:
+            if not team_franchise.lower() in qual_object["values"]:
+                return False
 
-    if "Game After Pitching" in qualifiers:
-        all_games = player_data["all_games"][row["Year"]]
+    return True
 
-        game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
-        if game_index == 0:
-            return False
-        previous_game = all_games[game_index - 1]["GameID"]
+def perform_upcoming_opponent_franchise_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+        
+    year = str(row["Upcoming Row"]["Year"])
+    team = row["Upcoming Row"]["Opponent"].upper()
+    sleague = row["Upcoming Row"]["OppLg"]
+    team_franchise = team_main_abbr[sleague][year][team]
 
-        for qual_object in qualifiers["Game After Pitching"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if previous_game in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Game After Hitting" in qualifiers:
-        all_games = player_data["all_games"][row["Year"]]
+    for qual_object in qualifiers["Upcoming Opponent Franchise"]:
+        if qual_object["negate"]:
+            if team_franchise.lower() in qual_object["values"]:
+                return False
+        else:
+            if not team_franchise.lower() in qual_object["values"]:
+                return False
 
-        game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
-        if game_index == 0:
-            return False
-        previous_game = all_games[game_index - 1]["GameID"]
+    return True
 
-        for qual_object in qualifiers["Game After Hitting"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if previous_game in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Game Before Pitching" in qualifiers:
-        all_games = player_data["all_games"][row["Year"]]
+def perform_team_league_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    sleague = row["TmLg"]
 
-        game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
-        if game_index == len(all_games) - 1:
-            return False
-        next_game = all_games[game_index + 1]["GameID"]
+    for qual_object in qualifiers["Team League"]:
+        if qual_object["negate"]:
+            if sleague.lower() in qual_object["values"]:
+                return False
+        else:
+            if not sleague.lower() in qual_object["values"]:
+                return False
 
-        for qual_object in qualifiers["Game Before Pitching"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if next_game in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Game Before Hitting" in qualifiers:
-        all_games = player_data["all_games"][row["Year"]]
+    return True
 
-        game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
-        if game_index == len(all_games) - 1:
-            return False
-        next_game = all_games[game_index + 1]["GameID"]
+def perform_opponent_league_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    sleague = row["OppLg"]
 
-        for qual_object in qualifiers["Game Before Hitting"]:
-            has_match = False
-            for player in qual_object["values"]:
-                if next_game in player["games"]:
-                    has_match = True
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    for qual_object in qualifiers["Opponent League"]:
+        if qual_object["negate"]:
+            if sleague.lower() in qual_object["values"]:
+                return False
+        else:
+            if not sleague.lower() in qual_object["values"]:
+                return False
 
-    if "Start" in qualifiers:
-        for qual_object in qualifiers["Start"]:
-            if row["Start"]:
-                if qual_object["negate"]:
-                    return False
-            else:
-                if not qual_object["negate"]:
-                    return False
-    
-    if "Finished" in qualifiers:
-        if "Finished" not in row:
-            return False
+    return True
 
-        for qual_object in qualifiers["Finished"]:
-            if row["Finished"]:
-                if qual_object["negate"]:
-                    return False
-            else:
-                if not qual_object["negate"]:
-                    return False
+def perform_previous_team_league_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    sleague = row["Previous Row"]["TmLg"]
 
-    if "Birthday" in qualifiers:
-        for qual_object in qualifiers["Birthday"]:
-            is_birthday = row["Date"].month == player_data["Birthday"].month and row["Date"].day == player_data["Birthday"].day
-            if is_birthday:
-                if qual_object["negate"]:
-                    return False
-            else:
-                if not qual_object["negate"]:
-                    return False
+    for qual_object in qualifiers["Previous Team League"]:
+        if qual_object["negate"]:
+            if sleague.lower() in qual_object["values"]:
+                return False
+        else:
+            if not sleague.lower() in qual_object["values"]:
+                return False
 
-    if "Month" in qualifiers:
-        for qual_object in qualifiers["Month"]:
-            if qual_object["negate"]:
-                if row["Date"].month in qual_object["values"]:
-                    return False
-            else:
-                if not row["Date"].month in qual_object["values"]:
-                    return False
+    return True
 
-    if "Day" in qualifiers:
-        for qual_object in qualifiers["Day"]:
-            if qual_object["negate"]:
-                if row["Date"].weekday() in qual_object["values"]:
-                    return False
-            else:
-                if not row["Date"].weekday() in qual_object["values"]:
-                    return False
+def perform_previous_opponent_league_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    sleague = row["Previous Row"]["OppLg"]
 
-    if "Date" in qualifiers:
-        for qual_object in qualifiers["Date"]:
-            if qual_object["negate"]:
-                if row["Date"].day in qual_object["values"]:
-                    return False
-            else:
-                if not row["Date"].day in qual_object["values"]:
-                    return False
+    for qual_object in qualifiers["Previous Opponent League"]:
+        if qual_object["negate"]:
+            if sleague.lower() in qual_object["values"]:
+                return False
+        else:
+            if not sleague.lower() in qual_object["values"]:
+                return False
 
-    if "Date And Month" in qualifiers:
-        for qual_object in qualifiers["Date And Month"]:
-            has_match = False
-            if isinstance(qual_object["values"], list):
-                for obj_val in qual_object["values"]:
-                    if row["Date"].month == obj_val["month"] and row["Date"].day == obj_val["date"]:
-                        has_match = True
-                        break
-            else:
-                if row["Date"].month == qual_object["values"]["start_month"]:
-                    if row["Date"].day >= qual_object["values"]["start_date"]:
-                        has_match = True
-                elif row["Date"].month == qual_object["values"]["end_month"]:
-                    if row["Date"].day <= qual_object["values"]["end_date"]:
-                        has_match = True
-                else:
-                    if qual_object["values"]["end_month"] < qual_object["values"]["start_month"]:
-                        has_match = row["Date"].month >= qual_object["values"]["start_month"] or row["Date"].month <= qual_object["values"]["end_month"]
-                    else:
-                        if row["Date"].month > qual_object["values"]["start_month"] and row["Date"].month < qual_object["values"]["end_month"]:
-                            has_match = True
+    return True
 
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Dates" in qualifiers:
-        for qual_object in qualifiers["Dates"]:
-            has_one_match = False
-            for date_obj in qual_object["values"]:
-                date_start_to_use = row["DateTime"] if isinstance(date_obj["start_val"], datetime.datetime) else row["Date"]
-                date_end_to_use = row["DateTime"] if isinstance(date_obj["end_val"], datetime.datetime) else row["Date"]
-                if qual_object["negate"]:
-                    if not (date_start_to_use >= date_obj["start_val"] and date_end_to_use <= date_obj["end_val"]):
-                        has_one_match = True
-                else:
-                    if date_start_to_use >= date_obj["start_val"] and date_end_to_use <= date_obj["end_val"]:
-                        has_one_match = True
-            if not has_one_match:
+def perform_upcoming_team_league_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    sleague = row["Upcoming Row"]["TmLg"]
+
+    for qual_object in qualifiers["Upcoming Team League"]:
+        if qual_object["negate"]:
+            if sleague.lower() in qual_object["values"]:
+                return False
+        else:
+            if not sleague.lower() in qual_object["values"]:
                 return False
 
-    if "Season Game" in qualifiers:
-        for qual_object in qualifiers["Season Game"]:
-            if qual_object["negate"]:
-                if row["Gm"] >= qual_object["values"]["start_val"] and row["Gm"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Gm"] >= qual_object["values"]["start_val"] and row["Gm"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Career Game" in qualifiers:
-        for qual_object in qualifiers["Career Game"]:
-            if qual_object["negate"]:
-                if row["CrGm"] >= qual_object["values"]["start_val"] and row["CrGm"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["CrGm"] >= qual_object["values"]["start_val"] and row["CrGm"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Career Game Reversed" in qualifiers:
-        for qual_object in qualifiers["Career Game Reversed"]:
-            if qual_object["negate"]:
-                if row["CrGmRev"] >= qual_object["values"]["start_val"] and row["CrGmRev"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["CrGmRev"] >= qual_object["values"]["start_val"] and row["CrGmRev"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Season Game Reversed" in qualifiers:
-        for qual_object in qualifiers["Season Game Reversed"]:
-            if qual_object["negate"]:
-                if row["GmRev"] >= qual_object["values"]["start_val"] and row["GmRev"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["GmRev"] >= qual_object["values"]["start_val"] and row["GmRev"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Final Team Score" in qualifiers:
-        if "Team Score" not in row or row["Team Score"] == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Final Team Score"]:
-            if qual_object["negate"]:
-                if row["Team Score"] >= qual_object["values"]["start_val"] and row["Team Score"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Team Score"] >= qual_object["values"]["start_val"] and row["Team Score"] <= qual_object["values"]["end_val"]):
-                    return False
+def perform_upcoming_opponent_league_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    sleague = row["Upcoming Row"]["OppLg"]
 
-    if "Final Opponent Score" in qualifiers:
-        if "Opponent Score" not in row or row["Opponent Score"] == None:
-            return False
+    for qual_object in qualifiers["Upcoming Opponent League"]:
+        if qual_object["negate"]:
+            if sleague.lower() in qual_object["values"]:
+                return False
+        else:
+            if not sleague.lower() in qual_object["values"]:
+                return False
 
-        for qual_object in qualifiers["Final Opponent Score"]:
-            if qual_object["negate"]:
-                if row["Opponent Score"] >= qual_object["values"]["start_val"] and row["Opponent Score"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Opponent Score"] >= qual_object["values"]["start_val"] and row["Opponent Score"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Final Score Margin" in qualifiers:
-        if "Team Score" not in row or row["Team Score"] == None or "Opponent Score" not in row or row["Opponent Score"] == None:
-            return False
+    return True
 
-        score_margin = row["Team Score"] - row["Opponent Score"]
+def perform_previous_same_opponent_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Same Opponent"]:
+        if qual_object["negate"]:
+            if row["Previous Row"]["Opponent"] == row["Opponent"]:
+                return False
+        else:
+            if not row["Previous Row"]["Opponent"] == row["Opponent"]:
+                return False
 
-        for qual_object in qualifiers["Final Score Margin"]:
-            if qual_object["negate"]:
-                if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Final Score Difference" in qualifiers:
-        if "Team Score" not in row or row["Team Score"] == None or "Opponent Score" not in row or row["Opponent Score"] == None:
-            return False
+    return True
 
-        score_margin = abs(row["Team Score"] - row["Opponent Score"])
+def perform_upcoming_same_opponent_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Same Opponent"]:
+        if qual_object["negate"]:
+            if row["Upcoming Row"]["Opponent"] == row["Opponent"]:
+                return False
+        else:
+            if not row["Upcoming Row"]["Opponent"] == row["Opponent"]:
+                return False
 
-        for qual_object in qualifiers["Final Score Difference"]:
-            if qual_object["negate"]:
-                if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Previous Team Score" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        if "Team Score" not in row["Previous Row"] or row["Previous Row"]["Team Score"] == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Previous Team Score"]:
-            if qual_object["negate"]:
-                if row["Previous Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Team Score"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Previous Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Team Score"] <= qual_object["values"]["end_val"]):
-                    return False
+def perform_interleague_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    sleague_team = row["TmLg"]
+    sleague_opponent = row["OppLg"]
 
-    if "Previous Opponent Score" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        if "Opponent Score" not in row["Previous Row"] or row["Previous Row"]["Opponent Score"] == None:
-            return False
+    for qual_object in qualifiers["Interleague"]:
+        if qual_object["negate"]:
+            if sleague_team != sleague_opponent:
+                return False
+        else:
+            if not sleague_team != sleague_opponent:
+                return False
 
-        for qual_object in qualifiers["Previous Opponent Score"]:
-            if qual_object["negate"]:
-                if row["Previous Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Opponent Score"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Previous Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Opponent Score"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Previous Score Margin" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        if "Team Score" not in row["Previous Row"] or row["Previous Row"]["Team Score"] == None or "Opponent Score" not in row["Previous Row"] or row["Previous Row"]["Opponent Score"] == None:
-            return False
+    return True
 
-        score_margin = row["Previous Row"]["Team Score"] - row["Previous Row"]["Opponent Score"]
+def perform_intraleague_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    sleague_team = row["TmLg"]
+    sleague_opponent = row["OppLg"]
 
-        for qual_object in qualifiers["Previous Score Margin"]:
-            if qual_object["negate"]:
-                if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Previous Score Difference" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        if "Team Score" not in row["Previous Row"] or row["Previous Row"]["Team Score"] == None or "Opponent Score" not in row["Previous Row"] or row["Previous Row"]["Opponent Score"] == None:
-            return False
+    for qual_object in qualifiers["Intraleague"]:
+        if qual_object["negate"]:
+            if sleague_team == sleague_opponent:
+                return False
+        else:
+            if not sleague_team == sleague_opponent:
+                return False
 
-        score_margin = abs(row["Previous Row"]["Team Score"] - row["Previous Row"]["Opponent Score"])
+    return True
 
-        for qual_object in qualifiers["Previous Score Difference"]:
-            if qual_object["negate"]:
-                if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Upcoming Team Score" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        if "Team Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Team Score"] == None:
-            return False
+def perform_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["GameID"] in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Upcoming Team Score"]:
-            if qual_object["negate"]:
-                if row["Upcoming Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Team Score"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Upcoming Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Team Score"] <= qual_object["values"]["end_val"]):
-                    return False
+    return True
 
-    if "Upcoming Opponent Score" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        if "Opponent Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Opponent Score"] == None:
-            return False
+def perform_or_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    has_any_match = False
+    for qual_object in qualifiers["Or Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["GameID"] in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if not has_match:
+                has_any_match = True
+        else:
+            if has_match:
+                has_any_match = True
+    if not has_any_match:
+        return False
 
-        for qual_object in qualifiers["Upcoming Opponent Score"]:
-            if qual_object["negate"]:
-                if row["Upcoming Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Opponent Score"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Upcoming Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Opponent Score"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Upcoming Score Margin" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        if "Team Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Team Score"] == None or "Opponent Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Opponent Score"] == None:
-            return False
+    return True
 
-        score_margin = row["Upcoming Row"]["Team Score"] - row["Upcoming Row"]["Opponent Score"]
+def perform_day_of_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day Of Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Upcoming Score Margin"]:
-            if qual_object["negate"]:
-                if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Upcoming Score Difference" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        if "Team Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Team Score"] == None or "Opponent Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Opponent Score"] == None:
-            return False
+    return True
 
-        score_margin = abs(row["Upcoming Row"]["Team Score"] - row["Upcoming Row"]["Opponent Score"])
+def perform_day_after_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day After Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Upcoming Score Difference"]:
-            if qual_object["negate"]:
-                if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Batting Order Position" in qualifiers:
-        if "BOP" not in row or not row["BOP"]:
-            return False
-        for qual_object in qualifiers["Batting Order Position"]:
-            if qual_object["negate"]:
-                if row["BOP"] >= qual_object["values"]["start_val"] and row["BOP"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["BOP"] >= qual_object["values"]["start_val"] and row["BOP"] <= qual_object["values"]["end_val"]):
-                    return False
+    return True
 
-    if "Result" in qualifiers:
-        if "Result" not in row or row["Result"] == None:
-            return False
+def perform_day_before_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day Before Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Result"]:
-            if qual_object["negate"]:
-                if row["Result"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Result"] in qual_object["values"]:
-                    return False
+    return True
 
-    if "Previous Result" in qualifiers:
-        if not row["Previous Row"]:
-            return False
-        for qual_object in qualifiers["Previous Result"]:
-            if qual_object["negate"]:
-                if row["Previous Row"]["Result"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Previous Row"]["Result"] in qual_object["values"]:
-                    return False
+def perform_game_after_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    all_games = player_data["all_games"][row["Year"]]
 
-    if "Upcoming Result" in qualifiers:
-        if not row["Upcoming Row"]:
-            return False
-        for qual_object in qualifiers["Upcoming Result"]:
-            if qual_object["negate"]:
-                if row["Upcoming Row"]["Result"] in qual_object["values"]:
-                    return False
-            else:
-                if not row["Upcoming Row"]["Result"] in qual_object["values"]:
-                    return False
-    
-    if "Year" in qualifiers:
-        for qual_object in qualifiers["Year"]:
-            if qual_object["negate"]:
-                if row["Year"] >= qual_object["values"]["start_val"] and row["Year"] <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Year"] >= qual_object["values"]["start_val"] and row["Year"] <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Even Year" in qualifiers:
-        is_even = row["Year"] % 2 == 0
-        for qual_object in qualifiers["Even Year"]:
-            if qual_object["negate"]:
-                if is_even:
-                    return False
-            else:
-                if not is_even:
-                    return False
-    
-    if "Odd Year" in qualifiers:
-        is_odd = row["Year"] % 2 == 1
-        for qual_object in qualifiers["Odd Year"]:
+    game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
+    if game_index == 0:
+        return False
+    previous_game = all_games[game_index - 1]["GameID"]
+
+    for qual_object in qualifiers["Game After Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if previous_game in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_game_before_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    all_games = player_data["all_games"][row["Year"]]
+
+    game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
+    if game_index == len(all_games) - 1:
+        return False
+    next_game = all_games[game_index + 1]["GameID"]
+
+    for qual_object in qualifiers["Game Before Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if next_game in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_season_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Season Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Year"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_or_season_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    has_row_match = False
+    for qual_object in qualifiers["Or Season Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Year"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if not has_match:
+                has_row_match = True
+        else:
+            if has_match:
+                has_row_match = True
+    if not has_row_match:
+        return False
+
+    return True
+
+def perform_season_after_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
+
+    if row["Year"] not in valid_years:
+        return False
+
+    year_index = valid_years.index(row["Year"])
+    if year_index == 0:
+        return False
+    previous_year = valid_years[year_index - 1]
+
+    for qual_object in qualifiers["Season After Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if previous_year in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_season_before_sub_query_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    valid_years = player_data["reg_year_valid_years"] if not time_frame["playoffs"] else player_data["year_valid_years"]
+
+    if row["Year"] not in valid_years:
+        return False
+
+    year_index = valid_years.index(row["Year"])
+    if year_index == len(valid_years) - 1:
+        return False
+    next_year = valid_years[year_index + 1]
+
+    for qual_object in qualifiers["Season Before Sub Query"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if next_year in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_playing_with_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Playing With"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_playing_against_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Playing Against"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_playing_same_game_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Playing Same Game"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_previous_playing_with_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Playing With"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["Previous Row"]["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_upcoming_playing_with_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Playing With"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["Upcoming Row"]["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_previous_playing_against_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Playing Against"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["Previous Row"]["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_upcoming_playing_against_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Playing Against"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Tm"].lower() in player["games"] and row["Upcoming Row"]["GameID"] in player["games"][row["Tm"].lower()]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_playing_same_opponents_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Playing Same Opponents"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Opponent"] in player["games"] and row["Year"] in player["games"][row["Opponent"]]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_playing_same_date_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Playing Same Date"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_day_after_pitching_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day After Pitching"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_day_after_hitting_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day After Hitting"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_day_before_pitching_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day Before Pitching"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_day_before_hitting_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day Before Hitting"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if row["Date"] in player["games"]:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_game_after_pitching_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    all_games = player_data["all_games"][row["Year"]]
+
+    game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
+    if game_index == 0:
+        return False
+    previous_game = all_games[game_index - 1]["GameID"]
+
+    for qual_object in qualifiers["Game After Pitching"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if previous_game in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_game_after_hitting_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    all_games = player_data["all_games"][row["Year"]]
+
+    game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
+    if game_index == 0:
+        return False
+    previous_game = all_games[game_index - 1]["GameID"]
+
+    for qual_object in qualifiers["Game After Hitting"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if previous_game in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_game_before_pitching_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    all_games = player_data["all_games"][row["Year"]]
+
+    game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
+    if game_index == len(all_games) - 1:
+        return False
+    next_game = all_games[game_index + 1]["GameID"]
+
+    for qual_object in qualifiers["Game Before Pitching"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if next_game in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_game_before_hitting_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    all_games = player_data["all_games"][row["Year"]]
+
+    game_index = [sub_row["GameID"] for sub_row in player_data["all_games"][row["Year"]]].index(row["GameID"])
+    if game_index == len(all_games) - 1:
+        return False
+    next_game = all_games[game_index + 1]["GameID"]
+
+    for qual_object in qualifiers["Game Before Hitting"]:
+        has_match = False
+        for player in qual_object["values"]:
+            if next_game in player["games"]:
+                has_match = True
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_start_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Start"]:
+        if row["Start"]:
             if qual_object["negate"]:
-                if is_odd:
-                    return False
-            else:
-                if not is_odd:
-                    return False
-    
-    if "Calendar Year" in qualifiers:
-        for qual_object in qualifiers["Calendar Year"]:
+                return False
+        else:
+            if not qual_object["negate"]:
+                return False
+
+    return True
+
+def perform_finished_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Finished" not in row:
+        return False
+
+    for qual_object in qualifiers["Finished"]:
+        if row["Finished"]:
             if qual_object["negate"]:
-                if row["Date"].year >= qual_object["values"]["start_val"] and row["Date"].year <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (row["Date"].year >= qual_object["values"]["start_val"] and row["Date"].year <= qual_object["values"]["end_val"]):
-                    return False
+                return False
+        else:
+            if not qual_object["negate"]:
+                return False
 
-    if "Even Calendar Year" in qualifiers:
-        is_even = row["Date"].year % 2 == 0
-        for qual_object in qualifiers["Even Calendar Year"]:
+    return True
+
+def perform_birthday_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Birthday"]:
+        is_birthday = row["Date"].month == player_data["Birthday"].month and row["Date"].day == player_data["Birthday"].day
+        if is_birthday:
             if qual_object["negate"]:
-                if is_even:
-                    return False
+                return False
+        else:
+            if not qual_object["negate"]:
+                return False
+
+    return True
+
+def perform_month_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Month"]:
+        if qual_object["negate"]:
+            if row["Date"].month in qual_object["values"]:
+                return False
+        else:
+            if not row["Date"].month in qual_object["values"]:
+                return False
+
+    return True
+
+def perform_day_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Day"]:
+        if qual_object["negate"]:
+            if row["Date"].weekday() in qual_object["values"]:
+                return False
+        else:
+            if not row["Date"].weekday() in qual_object["values"]:
+                return False
+
+    return True
+
+def perform_date_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Date"]:
+        if qual_object["negate"]:
+            if row["Date"].day in qual_object["values"]:
+                return False
+        else:
+            if not row["Date"].day in qual_object["values"]:
+                return False
+
+    return True
+
+def perform_date_and_month_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Date And Month"]:
+        has_match = False
+        if isinstance(qual_object["values"], list):
+            for obj_val in qual_object["values"]:
+                if row["Date"].month == obj_val["month"] and row["Date"].day == obj_val["date"]:
+                    has_match = True
+                    break
+        else:
+            if row["Date"].month == qual_object["values"]["start_month"]:
+                if row["Date"].day >= qual_object["values"]["start_date"]:
+                    has_match = True
+            elif row["Date"].month == qual_object["values"]["end_month"]:
+                if row["Date"].day <= qual_object["values"]["end_date"]:
+                    has_match = True
             else:
-                if not is_even:
-                    return False
-    
-    if "Odd Calendar Year" in qualifiers:
-        is_odd = row["Date"].year % 2 == 1
-        for qual_object in qualifiers["Odd Calendar Year"]:
+                if qual_object["values"]["end_month"] < qual_object["values"]["start_month"]:
+                    has_match = row["Date"].month >= qual_object["values"]["start_month"] or row["Date"].month <= qual_object["values"]["end_month"]
+                else:
+                    if row["Date"].month > qual_object["values"]["start_month"] and row["Date"].month < qual_object["values"]["end_month"]:
+                        has_match = True
+
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_dates_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Dates"]:
+        has_one_match = False
+        for date_obj in qual_object["values"]:
+            date_start_to_use = row["DateTime"] if isinstance(date_obj["start_val"], datetime.datetime) else row["Date"]
+            date_end_to_use = row["DateTime"] if isinstance(date_obj["end_val"], datetime.datetime) else row["Date"]
             if qual_object["negate"]:
-                if is_odd:
-                    return False
+                if not (date_start_to_use >= date_obj["start_val"] and date_end_to_use <= date_obj["end_val"]):
+                    has_one_match = True
             else:
-                if not is_odd:
-                    return False
+                if date_start_to_use >= date_obj["start_val"] and date_end_to_use <= date_obj["end_val"]:
+                    has_one_match = True
+        if not has_one_match:
+            return False
+
+    return True
+
+def perform_season_game_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Season Game"]:
+        if qual_object["negate"]:
+            if row["Gm"] >= qual_object["values"]["start_val"] and row["Gm"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Gm"] >= qual_object["values"]["start_val"] and row["Gm"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_career_game_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Career Game"]:
+        if qual_object["negate"]:
+            if row["CrGm"] >= qual_object["values"]["start_val"] and row["CrGm"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["CrGm"] >= qual_object["values"]["start_val"] and row["CrGm"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_career_game_reversed_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Career Game Reversed"]:
+        if qual_object["negate"]:
+            if row["CrGmRev"] >= qual_object["values"]["start_val"] and row["CrGmRev"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["CrGmRev"] >= qual_object["values"]["start_val"] and row["CrGmRev"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_season_game_reversed_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Season Game Reversed"]:
+        if qual_object["negate"]:
+            if row["GmRev"] >= qual_object["values"]["start_val"] and row["GmRev"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["GmRev"] >= qual_object["values"]["start_val"] and row["GmRev"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_final_team_score_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Team Score" not in row or row["Team Score"] == None:
+        return False
+
+    for qual_object in qualifiers["Final Team Score"]:
+        if qual_object["negate"]:
+            if row["Team Score"] >= qual_object["values"]["start_val"] and row["Team Score"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Team Score"] >= qual_object["values"]["start_val"] and row["Team Score"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_final_opponent_score_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Opponent Score" not in row or row["Opponent Score"] == None:
+        return False
+
+    for qual_object in qualifiers["Final Opponent Score"]:
+        if qual_object["negate"]:
+            if row["Opponent Score"] >= qual_object["values"]["start_val"] and row["Opponent Score"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Opponent Score"] >= qual_object["values"]["start_val"] and row["Opponent Score"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_final_score_margin_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Team Score" not in row or row["Team Score"] == None or "Opponent Score" not in row or row["Opponent Score"] == None:
+        return False
+
+    score_margin = row["Team Score"] - row["Opponent Score"]
+
+    for qual_object in qualifiers["Final Score Margin"]:
+        if qual_object["negate"]:
+            if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_final_score_difference_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Team Score" not in row or row["Team Score"] == None or "Opponent Score" not in row or row["Opponent Score"] == None:
+        return False
+
+    score_margin = abs(row["Team Score"] - row["Opponent Score"])
+
+    for qual_object in qualifiers["Final Score Difference"]:
+        if qual_object["negate"]:
+            if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_previous_team_score_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    if "Team Score" not in row["Previous Row"] or row["Previous Row"]["Team Score"] == None:
+        return False
+
+    for qual_object in qualifiers["Previous Team Score"]:
+        if qual_object["negate"]:
+            if row["Previous Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Team Score"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Previous Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Team Score"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_previous_opponent_score_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    if "Opponent Score" not in row["Previous Row"] or row["Previous Row"]["Opponent Score"] == None:
+        return False
+
+    for qual_object in qualifiers["Previous Opponent Score"]:
+        if qual_object["negate"]:
+            if row["Previous Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Opponent Score"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Previous Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Previous Row"]["Opponent Score"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_previous_score_margin_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    if "Team Score" not in row["Previous Row"] or row["Previous Row"]["Team Score"] == None or "Opponent Score" not in row["Previous Row"] or row["Previous Row"]["Opponent Score"] == None:
+        return False
+
+    score_margin = row["Previous Row"]["Team Score"] - row["Previous Row"]["Opponent Score"]
+
+    for qual_object in qualifiers["Previous Score Margin"]:
+        if qual_object["negate"]:
+            if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_previous_score_difference_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    if "Team Score" not in row["Previous Row"] or row["Previous Row"]["Team Score"] == None or "Opponent Score" not in row["Previous Row"] or row["Previous Row"]["Opponent Score"] == None:
+        return False
+
+    score_margin = abs(row["Previous Row"]["Team Score"] - row["Previous Row"]["Opponent Score"])
+
+    for qual_object in qualifiers["Previous Score Difference"]:
+        if qual_object["negate"]:
+            if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_upcoming_team_score_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    if "Team Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Team Score"] == None:
+        return False
+
+    for qual_object in qualifiers["Upcoming Team Score"]:
+        if qual_object["negate"]:
+            if row["Upcoming Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Team Score"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Upcoming Row"]["Team Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Team Score"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_upcoming_opponent_score_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    if "Opponent Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Opponent Score"] == None:
+        return False
+
+    for qual_object in qualifiers["Upcoming Opponent Score"]:
+        if qual_object["negate"]:
+            if row["Upcoming Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Opponent Score"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Upcoming Row"]["Opponent Score"] >= qual_object["values"]["start_val"] and row["Upcoming Row"]["Opponent Score"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_upcoming_score_margin_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    if "Team Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Team Score"] == None or "Opponent Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Opponent Score"] == None:
+        return False
+
+    score_margin = row["Upcoming Row"]["Team Score"] - row["Upcoming Row"]["Opponent Score"]
+
+    for qual_object in qualifiers["Upcoming Score Margin"]:
+        if qual_object["negate"]:
+            if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_upcoming_score_difference_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    if "Team Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Team Score"] == None or "Opponent Score" not in row["Upcoming Row"] or row["Upcoming Row"]["Opponent Score"] == None:
+        return False
+
+    score_margin = abs(row["Upcoming Row"]["Team Score"] - row["Upcoming Row"]["Opponent Score"])
+
+    for qual_object in qualifiers["Upcoming Score Difference"]:
+        if qual_object["negate"]:
+            if score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin >= qual_object["values"]["start_val"] and score_margin <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_batting_order_position_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "BOP" not in row or not row["BOP"]:
+        return False
+    for qual_object in qualifiers["Batting Order Position"]:
+        if qual_object["negate"]:
+            if row["BOP"] >= qual_object["values"]["start_val"] and row["BOP"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["BOP"] >= qual_object["values"]["start_val"] and row["BOP"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_result_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Result" not in row or row["Result"] == None:
+        return False
+
+    for qual_object in qualifiers["Result"]:
+        if qual_object["negate"]:
+            if row["Result"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Result"] in qual_object["values"]:
+                return False
+
+    return True
+
+def perform_previous_result_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Previous Row"]:
+        return False
+    for qual_object in qualifiers["Previous Result"]:
+        if qual_object["negate"]:
+            if row["Previous Row"]["Result"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Previous Row"]["Result"] in qual_object["values"]:
+                return False
+
+    return True
+
+def perform_upcoming_result_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not row["Upcoming Row"]:
+        return False
+    for qual_object in qualifiers["Upcoming Result"]:
+        if qual_object["negate"]:
+            if row["Upcoming Row"]["Result"] in qual_object["values"]:
+                return False
+        else:
+            if not row["Upcoming Row"]["Result"] in qual_object["values"]:
+                return False
+
+    return True
+
+def perform_year_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Year"]:
+        if qual_object["negate"]:
+            if row["Year"] >= qual_object["values"]["start_val"] and row["Year"] <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Year"] >= qual_object["values"]["start_val"] and row["Year"] <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_even_year_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    is_even = row["Year"] % 2 == 0
+    for qual_object in qualifiers["Even Year"]:
+        if qual_object["negate"]:
+            if is_even:
+                return False
+        else:
+            if not is_even:
+                return False
+
+    return True
+
+def perform_odd_year_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    is_odd = row["Year"] % 2 == 1
+    for qual_object in qualifiers["Odd Year"]:
+        if qual_object["negate"]:
+            if is_odd:
+                return False
+        else:
+            if not is_odd:
+                return False
+
+    return True
+
+def perform_calendar_year_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    for qual_object in qualifiers["Calendar Year"]:
+        if qual_object["negate"]:
+            if row["Date"].year >= qual_object["values"]["start_val"] and row["Date"].year <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (row["Date"].year >= qual_object["values"]["start_val"] and row["Date"].year <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_even_calendar_year_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    is_even = row["Date"].year % 2 == 0
+    for qual_object in qualifiers["Even Calendar Year"]:
+        if qual_object["negate"]:
+            if is_even:
+                return False
+        else:
+            if not is_even:
+                return False
+
+    return True
+
+def perform_odd_calendar_year_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    is_odd = row["Date"].year % 2 == 1
+    for qual_object in qualifiers["Odd Calendar Year"]:
+        if qual_object["negate"]:
+            if is_odd:
+                return False
+        else:
+            if not is_odd:
+                return False
+
+    return True
+
+def perform_double_header_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    double_header_results = set()
+    date = row["Date"]
+    hour = row["DateTime"].hour
+
+    if str(row["Date"]) in special_doubleheaders and row["Tm"] in special_doubleheaders[str(row["Date"])]["single_teams"]:
+        return False
+
+    if hour == 1:
+        double_header_results.add("First")
+        double_header_results.add("Either")
+        if row["Upcoming Row"]:
+            if row["Upcoming Row"]["Date"] == date and row["Upcoming Row"]["DateTime"].hour == 2:
+                    double_header_results.add("Both")
+    elif hour == 2:
+        double_header_results.add("Second")
+        double_header_results.add("Either")
+        if row["Previous Row"]:
+            if row["Previous Row"]["Date"] == date and row["Previous Row"]["DateTime"].hour == 1:
+                double_header_results.add("Both")
+
+    for qual_object in qualifiers["Double Header"]:
+        if qual_object["negate"]:
+            if double_header_results & set(qual_object["values"]):
+                return False
+        else:
+            if not double_header_results & set(qual_object["values"]):
+                return False
+
+    return True
+
+def perform_holiday_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    game_date = row["Date"]
+    for qual_object in qualifiers["Holiday"]:
+        has_match = False
+        for holiday in qual_object["values"]:
+            if is_holiday_match(game_date, holiday):
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_save_situation_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if player_type["da_type"] == "Batter" or row["Start"]:
+        return False
+
+    is_save_situation = None
+    if "SaveOpp" in row:
+        is_save_situation = row["SaveOpp"]
+    else:
+        if "Entered" in row:
+            is_save_situation = parse_entered_str(row)[0]
+            
+    if is_save_situation == None:
+        return False
+        
+    for qual_object in qualifiers["Save Situation"]:
+        if qual_object["negate"]:
+            if is_save_situation:
+                return False
+        else:
+            if not is_save_situation:
+                return False
+
+    return True
+
+def perform_inning_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    inning_entered = None
+    if "InningEntered" in row:
+        inning_entered = row["InningEntered"]
+    else:
+        if "Entered" in row:
+            inning_entered = parse_entered_str(row)[1]
+            
+    if inning_entered == None:
+        return False
+
+    for qual_object in qualifiers["Inning Entered"]:
+        if qual_object["negate"]:
+            if inning_entered >= qual_object["values"]["start_val"] and inning_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (inning_entered >= qual_object["values"]["start_val"] and inning_entered <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_last_inning_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    inning_entered = None
+    if "InningEntered" in row:
+        inning_entered = row["InningEntered"]
+    else:
+        if "Entered" in row:
+            inning_entered = parse_entered_str(row)[1]
+            
+    if inning_entered == None:
+        return False
+
+    last_inning = inning_entered >= 9 or ((row["DateTime"].hour == 1 or row["DateTime"].hour == 2) and row["Year"] >= 2020 and inning_entered >= 7)
+
+    for qual_object in qualifiers["Last Inning Entered"]:
+        if qual_object["negate"]:
+            if last_inning:
+                return False
+        else:
+            if not last_inning:
+                return False
+
+    return True
+
+def perform_top_inning_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    top_inning_entered = None
+    if "TopInningEntered" in row:
+        top_inning_entered = row["TopInningEntered"]
+    else:
+        if "Entered" in row:
+            top_inning_entered = parse_entered_str(row)[6]
+            
+    if top_inning_entered == None:
+        return False
+
+    for qual_object in qualifiers["Top Inning Entered"]:
+        if qual_object["negate"]:
+            if top_inning_entered:
+                return False
+        else:
+            if not top_inning_entered:
+                return False
+
+    return True
+
+def perform_bottom_inning_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    top_inning_entered = None
+    if "TopInningEntered" in row:
+        top_inning_entered = row["TopInningEntered"]
+    else:
+        if "Entered" in row:
+            top_inning_entered = parse_entered_str(row)[6]
+            
+    if top_inning_entered == None:
+        return False
+
+    for qual_object in qualifiers["Bottom Inning Entered"]:
+        if qual_object["negate"]:
+            if not top_inning_entered:
+                return False
+        else:
+            if top_inning_entered:
+                return False
+
+    return True
+
+def perform_outs_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    outs_entered = None
+    if "OutsEntered" in row:
+        outs_entered = row["OutsEntered"]
+    else:
+        if "Entered" in row:
+            outs_entered = parse_entered_str(row)[2]
+
+    if outs_entered == None:
+        return False
+
+    for qual_object in qualifiers["Outs Entered"]:
+        if qual_object["negate"]:
+            if outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_outs_remaining_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    outs_entered = None
+    if "OutsRemainingEntered" in row:
+        outs_entered = row["OutsRemainingEntered"]
+    else:
+        if "Entered" in row:
+            outs_entered = parse_entered_str(row)[7]
+
+    if outs_entered == None:
+        return False
+
+    for qual_object in qualifiers["Outs Remaining Entered"]:
+        if qual_object["negate"]:
+            if outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_men_on_base_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    men_on_base_entered = None
+    if "MenOnBaseEntered" in row:
+        men_on_base_entered = row["MenOnBaseEntered"]
+    else:
+        if "Entered" in row:
+            men_on_base_entered = parse_entered_str(row)[3]
+
+    if men_on_base_entered == None:
+        return False
+
+    for qual_object in qualifiers["Men On Base Entered"]:
+        if qual_object["negate"]:
+            if men_on_base_entered >= qual_object["values"]["start_val"] and men_on_base_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (men_on_base_entered >= qual_object["values"]["start_val"] and men_on_base_entered <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_men_in_scoring_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    men_in_scoring_entered = None
+    if "MenInScoringEntered" in row:
+        men_in_scoring_entered = row["MenInScoringEntered"]
+    else:
+        if "Entered" in row:
+            men_in_scoring_entered = parse_entered_str(row)[4]
+
+    if men_in_scoring_entered == None:
+        return False
+
+    for qual_object in qualifiers["Men In Scoring Entered"]:
+        if qual_object["negate"]:
+            if men_in_scoring_entered >= qual_object["values"]["start_val"] and men_in_scoring_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (men_in_scoring_entered >= qual_object["values"]["start_val"] and men_in_scoring_entered <= qual_object["values"]["end_val"]):
+                return False
+
+    return True
+
+def perform_score_margin_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    score_margin_entered = None
+    if "ScoreMarginEntered" in row:
+        score_margin_entered = row["ScoreMarginEntered"]
+    else:
+        if "Entered" in row:
+            score_margin_entered = parse_entered_str(row)[5]
+
+    if score_margin_entered == None:
+        return False
 
-    if "Double Header" in qualifiers:
-        double_header_results = set()
-        date = row["Date"]
-        hour = row["DateTime"].hour
+    for qual_object in qualifiers["Score Margin Entered"]:
+        if qual_object["negate"]:
+            if score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]):
+                return False
 
-        if str(row["Date"]) in special_doubleheaders and row["Tm"] in special_doubleheaders[str(row["Date"])]["single_teams"]:
-            return False
+    return True
 
-        if hour == 1:
-            double_header_results.add("First")
-            double_header_results.add("Either")
-            if row["Upcoming Row"]:
-                if row["Upcoming Row"]["Date"] == date and row["Upcoming Row"]["DateTime"].hour == 2:
-                        double_header_results.add("Both")
-        elif hour == 2:
-            double_header_results.add("Second")
-            double_header_results.add("Either")
-            if row["Previous Row"]:
-                if row["Previous Row"]["Date"] == date and row["Previous Row"]["DateTime"].hour == 1:
-                    double_header_results.add("Both")
+def perform_score_difference_entered_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    score_margin_entered = None
+    if "ScoreMarginEntered" in row:
+        score_margin_entered = row["ScoreMarginEntered"]
+    else:
+        if "Entered" in row:
+            score_margin_entered = parse_entered_str(row)[5]
 
-        for qual_object in qualifiers["Double Header"]:
-            if qual_object["negate"]:
-                if double_header_results & set(qual_object["values"]):
-                    return False
-            else:
-                if not double_header_results & set(qual_object["values"]):
-                    return False
+    if score_margin_entered == None:
+        return False
     
-    if "Holiday" in qualifiers:
-        game_date = row["Date"]
-        for qual_object in qualifiers["Holiday"]:
-            has_match = False
-            for holiday in qual_object["values"]:
-                country = "usa"
-                eve = False
-                observed = False
-                church = "western"
-                if "canadian" in holiday:
-                    country = "canada"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("canadian", "")).strip()
-                elif "canada" in holiday:
-                    country = "canada"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("canada", "")).strip()
-                elif "eve" in holiday:
-                    eve = True
-                    holiday = re.sub(r"\s+", " ", holiday.replace("eve", "")).strip()
-                elif "observed" in holiday:
-                    observed = True
-                    holiday = re.sub(r"\s+", " ", holiday.replace("observed", "")).strip()
-                elif "orthodox" in holiday:
-                    church = "orthodox"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("orthodox", "")).strip()
-                elif "eastern" in holiday:
-                    church = "eastern"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("eastern", "")).strip()
-                holiday = re.sub(r"\W+", "", re.sub(r"[\s-]+", "_", holiday))
-
-                has_custom_match = False
-                for holiday_func in all_custom_holidays:
-                    if holiday_func[0] == holiday:
-                        has_custom_match = True
-                        if holiday_func[1](game_date, church, country, observed, eve):
-                            has_match = True
-                        break
+    score_margin_entered = abs(score_margin_entered)
 
-                if not has_custom_match:
-                    for holiday_func in all_holidays:
-                        if holiday_func[0] == holiday:
-                            arguments = inspect.signature(holiday_func[1]).parameters
-                            if "church" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, church=church)
-                            elif "country" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, country=country)
-                            elif "observed" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, observed=observed)
-                            elif "eve" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, eve=eve)
-                            else:
-                                holiday_date = holiday_func[1](game_date.year)
+    for qual_object in qualifiers["Score Difference Entered"]:
+        if qual_object["negate"]:
+            if score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]):
+                return False
 
-                            if holiday_date:
-                                holiday_date = datetime.datetime(holiday_date[0], holiday_date[1], holiday_date[2]).date()
-                                if eve:
-                                    holiday_date -= datetime.timedelta(days=1)
-                                if game_date == holiday_date:
-                                    has_match = True
-                            break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
+    return True
 
-    if "Save Situation" in qualifiers:
-        if player_type["da_type"] == "Batter" or row["Start"]:
-            return False
+def perform_season_number_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if not player_data["player_all_numbers"]:
+        return False
+    for qual_object in qualifiers["Season Number"]:
+        has_number_match = False
+
+        for num_obj in player_data["player_all_numbers"]:
+            if row["Tm"] in num_obj["teams"]:
+                if row["Year"] >= num_obj["start_year"] and row["Year"] <= num_obj["end_year"]:
+                    if num_obj["number"] >= qual_object["values"]["start_val"] and num_obj["number"] <= qual_object["values"]["end_val"]:
+                        has_number_match = True
+                        break
 
-        is_save_situation = None
-        if "SaveOpp" in row:
-            is_save_situation = row["SaveOpp"]
-        else:
-            if "Entered" in row:
-                is_save_situation = parse_entered_str(row)[0]
-                
-        if is_save_situation == None:
-            return False
-            
-        for qual_object in qualifiers["Save Situation"]:
-            if qual_object["negate"]:
-                if is_save_situation:
-                    return False
-            else:
-                if not is_save_situation:
-                    return False
-    
-    if "Inning Entered" in qualifiers:
-        inning_entered = None
-        if "InningEntered" in row:
-            inning_entered = row["InningEntered"]
+        if qual_object["negate"]:
+            if has_number_match:
+                return False
         else:
-            if "Entered" in row:
-                inning_entered = parse_entered_str(row)[1]
-                
-        if inning_entered == None:
-            return False
+            if not has_number_match:
+                return False
 
-        for qual_object in qualifiers["Inning Entered"]:
-            if qual_object["negate"]:
-                if inning_entered >= qual_object["values"]["start_val"] and inning_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (inning_entered >= qual_object["values"]["start_val"] and inning_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Last Inning Entered" in qualifiers:
-        inning_entered = None
-        if "InningEntered" in row:
-            inning_entered = row["InningEntered"]
+    return True
+
+def perform_primary_season_position_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Pos" not in row:
+        return False
+
+    qual_str = list(row["Pos"].replace("*", "").replace("/", ""))
+    if not qual_str:
+        return False
+
+    for qual_object in qualifiers["Primary Season Position"]:
+        has_match = False
+        for pos in qual_object["values"]:
+            pos = pos.upper()
+            other_pos = pos
+            if pos in position_map:
+                other_pos = position_map[pos]
+            if qual_str[0] == pos or qual_str[0] == other_pos:
+                has_match = True
+                break
+
+        if qual_object["negate"]:
+            if has_match:
+                return False
         else:
-            if "Entered" in row:
-                inning_entered = parse_entered_str(row)[1]
-                
-        if inning_entered == None:
-            return False
+            if not has_match:
+                return False
 
-        last_inning = inning_entered >= 9 or ((row["DateTime"].hour == 1 or row["DateTime"].hour == 2) and row["Year"] >= 2020 and inning_entered >= 7)
+    return True
 
-        for qual_object in qualifiers["Last Inning Entered"]:
-            if qual_object["negate"]:
-                if last_inning:
-                    return False
-            else:
-                if not last_inning:
-                    return False
-    
-    if "Top Inning Entered" in qualifiers:
-        top_inning_entered = None
-        if "TopInningEntered" in row:
-            top_inning_entered = row["TopInningEntered"]
+def perform_season_position_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Pos" not in row:
+        return False
+
+    qual_str = list(row["Pos"].replace("*", "").replace("/", ""))
+    if not qual_str:
+        return False
+
+    for qual_object in qualifiers["Season Position"]:
+        has_match = False
+        for pos in qual_object["values"]:
+            pos = pos.upper()
+            other_pos = pos
+            if pos in position_map:
+                other_pos = position_map[pos]
+            if pos in qual_str or other_pos in qual_str:
+                has_match = True
+                break
+
+        if qual_object["negate"]:
+            if has_match:
+                return False
         else:
-            if "Entered" in row:
-                top_inning_entered = parse_entered_str(row)[6]
-                
-        if top_inning_entered == None:
-            return False
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Top Inning Entered"]:
-            if qual_object["negate"]:
-                if top_inning_entered:
-                    return False
-            else:
-                if not top_inning_entered:
-                    return False
-    
-    if "Bottom Inning Entered" in qualifiers:
-        top_inning_entered = None
-        if "TopInningEntered" in row:
-            top_inning_entered = row["TopInningEntered"]
+    return True
+
+def perform_primary_game_position_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Pos" not in row:
+        return False
+
+    qual_str = re.split(r"\s+", row["Pos"].replace("*", "").replace("/", ""))
+    if not qual_str:
+        return False
+
+    for qual_object in qualifiers["Primary Game Position"]:
+        has_match = False
+        for pos in qual_object["values"]:
+            pos = pos.upper()
+            other_pos = pos
+            if pos in position_map:
+                other_pos = position_map[pos]
+            if qual_str[0] == pos or qual_str[0] == other_pos:
+                has_match = True
+                break
+
+        if qual_object["negate"]:
+            if has_match:
+                return False
         else:
-            if "Entered" in row:
-                top_inning_entered = parse_entered_str(row)[6]
-                
-        if top_inning_entered == None:
-            return False
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Bottom Inning Entered"]:
-            if qual_object["negate"]:
-                if not top_inning_entered:
-                    return False
-            else:
-                if top_inning_entered:
-                    return False
-    
-    if "Outs Entered" in qualifiers:
-        outs_entered = None
-        if "OutsEntered" in row:
-            outs_entered = row["OutsEntered"]
+    return True
+
+def perform_game_position_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    if "Pos" not in row:
+        return False
+
+    qual_str = re.split(r"\s+", row["Pos"].replace("*", "").replace("/", ""))
+    if not qual_str:
+        return False
+
+    for qual_object in qualifiers["Game Position"]:
+        has_match = False
+        for pos in qual_object["values"]:
+            pos = pos.upper()
+            other_pos = pos
+            if pos in position_map:
+                other_pos = position_map[pos]
+            if pos in qual_str or other_pos in qual_str:
+                has_match = True
+                break
+
+        if qual_object["negate"]:
+            if has_match:
+                return False
         else:
-            if "Entered" in row:
-                outs_entered = parse_entered_str(row)[2]
+            if not has_match:
+                return False
 
-        if outs_entered == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Outs Entered"]:
-            if qual_object["negate"]:
-                if outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Outs Remaining Entered" in qualifiers:
-        outs_entered = None
-        if "OutsRemainingEntered" in row:
-            outs_entered = row["OutsRemainingEntered"]
+def perform_moon_phase_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    moon_phases = human_moon(row["Date"])
+
+    for qual_object in qualifiers["Moon Phase"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in moon_phases:
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
         else:
-            if "Entered" in row:
-                outs_entered = parse_entered_str(row)[7]
+            if not has_match:
+                return False
 
-        if outs_entered == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Outs Remaining Entered"]:
-            if qual_object["negate"]:
-                if outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (outs_entered >= qual_object["values"]["start_val"] and outs_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Men On Base Entered" in qualifiers:
-        men_on_base_entered = None
-        if "MenOnBaseEntered" in row:
-            men_on_base_entered = row["MenOnBaseEntered"]
+def perform_days_rest_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    days_rest = float("inf")
+    for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=True):
+        if sub_data["DateTime"] < row["DateTime"]:
+            days_rest = (row["Date"] - sub_data["Date"]).days - 1
+            break
+
+    for qual_object in qualifiers["Days Rest"]:
+        if qual_object["negate"]:
+            if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
+                return False
         else:
-            if "Entered" in row:
-                men_on_base_entered = parse_entered_str(row)[3]
+            if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
+                return False
 
-        if men_on_base_entered == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Men On Base Entered"]:
-            if qual_object["negate"]:
-                if men_on_base_entered >= qual_object["values"]["start_val"] and men_on_base_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (men_on_base_entered >= qual_object["values"]["start_val"] and men_on_base_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Men In Scoring Entered" in qualifiers:
-        men_in_scoring_entered = None
-        if "MenInScoringEntered" in row:
-            men_in_scoring_entered = row["MenInScoringEntered"]
+def perform_starts_days_rest_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    days_rest = float("inf")
+    for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=True):
+        if sub_data["DateTime"] < row["DateTime"] and sub_data["Start"]:
+            days_rest = (row["Date"] - sub_data["Date"]).days - 1
+            break
+
+    for qual_object in qualifiers["Starts Days Rest"]:
+        if qual_object["negate"]:
+            if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
+                return False
         else:
-            if "Entered" in row:
-                men_in_scoring_entered = parse_entered_str(row)[4]
+            if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
+                return False
 
-        if men_in_scoring_entered == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Men In Scoring Entered"]:
-            if qual_object["negate"]:
-                if men_in_scoring_entered >= qual_object["values"]["start_val"] and men_in_scoring_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (men_in_scoring_entered >= qual_object["values"]["start_val"] and men_in_scoring_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Score Margin Entered" in qualifiers:
-        score_margin_entered = None
-        if "ScoreMarginEntered" in row:
-            score_margin_entered = row["ScoreMarginEntered"]
+def perform_upcoming_starts_days_rest_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    days_rest = float("inf")
+    for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=False):
+        if sub_data["DateTime"] > row["DateTime"] and sub_data["Start"]:
+            days_rest = (row["Date"] - sub_data["Date"]).days - 1
+            break
+
+    for qual_object in qualifiers["Upcoming Starts Days Rest"]:
+        if qual_object["negate"]:
+            if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
+                return False
         else:
-            if "Entered" in row:
-                score_margin_entered = parse_entered_str(row)[5]
+            if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
+                return False
 
-        if score_margin_entered == None:
-            return False
+    return True
 
-        for qual_object in qualifiers["Score Margin Entered"]:
-            if qual_object["negate"]:
-                if score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Score Difference Entered" in qualifiers:
-        score_margin_entered = None
-        if "ScoreMarginEntered" in row:
-            score_margin_entered = row["ScoreMarginEntered"]
+def perform_upcoming_days_rest_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    days_rest = float("inf")
+    for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=False):
+        if sub_data["DateTime"] > row["DateTime"]:
+            days_rest = (row["Date"] - sub_data["Date"]).days - 1
+            break
+
+    for qual_object in qualifiers["Upcoming Days Rest"]:
+        if qual_object["negate"]:
+            if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
+                return False
         else:
-            if "Entered" in row:
-                score_margin_entered = parse_entered_str(row)[5]
+            if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
+                return False
 
-        if score_margin_entered == None:
-            return False
-        
-        score_margin_entered = abs(score_margin_entered)
+    return True
 
-        for qual_object in qualifiers["Score Difference Entered"]:
-            if qual_object["negate"]:
-                if score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (score_margin_entered >= qual_object["values"]["start_val"] and score_margin_entered <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Season Number" in qualifiers:
-        if not player_data["player_all_numbers"]:
-            return False
-        for qual_object in qualifiers["Season Number"]:
-            has_number_match = False
+def perform_days_in_a_row_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    days_in_a_row = 1
+    date_to_check = row["Date"] - datetime.timedelta(days=1)
+    for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=True):
+        if sub_data["Date"] == date_to_check:
+            days_in_a_row += 1
+            date_to_check -= datetime.timedelta(days=1)
 
-            for num_obj in player_data["player_all_numbers"]:
-                if row["Tm"] in num_obj["teams"]:
-                    if row["Year"] >= num_obj["start_year"] and row["Year"] <= num_obj["end_year"]:
-                        if num_obj["number"] >= qual_object["values"]["start_val"] and num_obj["number"] <= qual_object["values"]["end_val"]:
-                            has_number_match = True
-                            break
+    for qual_object in qualifiers["Days In A Row"]:
+        if qual_object["negate"]:
+            if days_in_a_row >= qual_object["values"]["start_val"] and days_in_a_row <= qual_object["values"]["end_val"]:
+                return False
+        else:
+            if not (days_in_a_row >= qual_object["values"]["start_val"] and days_in_a_row <= qual_object["values"]["end_val"]):
+                return False
 
-            if qual_object["negate"]:
-                if has_number_match:
-                    return False
-            else:
-                if not has_number_match:
-                    return False
-    
-    if "Primary Season Position" in qualifiers:
-        if "Pos" not in row:
-            return False
+    return True
 
-        qual_str = list(row["Pos"].replace("*", "").replace("/", ""))
-        if not qual_str:
-            return False
+def perform_team_city_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Primary Season Position"]:
-            has_match = False
-            for pos in qual_object["values"]:
-                pos = pos.upper()
-                other_pos = pos
-                if pos in position_map:
-                    other_pos = position_map[pos]
-                if qual_str[0] == pos or qual_str[0] == other_pos:
+    val_to_check = venue_obj["city"]
+
+    for qual_object in qualifiers["Team City"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower():
+                has_match = True
+                break
+            elif venue_obj["state"] and venue_obj["state"].lower() == "ny" and val_to_check.lower() in ["brooklyn", "bronx", "flushing"]:
+                if stadium in "new york":
                     has_match = True
                     break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Season Position" in qualifiers:
-        if "Pos" not in row:
-            return False
+    return True
 
-        qual_str = list(row["Pos"].replace("*", "").replace("/", ""))
-        if not qual_str:
-            return False
+def perform_team_exact_city_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Season Position"]:
-            has_match = False
-            for pos in qual_object["values"]:
-                pos = pos.upper()
-                other_pos = pos
-                if pos in position_map:
-                    other_pos = position_map[pos]
-                if pos in qual_str or other_pos in qual_str:
-                    has_match = True
-                    break
+    val_to_check = venue_obj["city"]
 
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Primary Game Position" in qualifiers:
-        if "Pos" not in row:
-            return False
+    for qual_object in qualifiers["Team Exact City"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        qual_str = re.split(r"\s+", row["Pos"].replace("*", "").replace("/", ""))
-        if not qual_str:
-            return False
+    return True
 
-        for qual_object in qualifiers["Primary Game Position"]:
-            has_match = False
-            for pos in qual_object["values"]:
-                pos = pos.upper()
-                other_pos = pos
-                if pos in position_map:
-                    other_pos = position_map[pos]
-                if qual_str[0] == pos or qual_str[0] == other_pos:
-                    has_match = True
-                    break
+def perform_team_state_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
 
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Game Position" in qualifiers:
-        if "Pos" not in row:
-            return False
+    val_to_check = venue_obj["state"]
+    if not val_to_check:
+        return False
 
-        qual_str = re.split(r"\s+", row["Pos"].replace("*", "").replace("/", ""))
-        if not qual_str:
-            return False
+    for qual_object in qualifiers["Team State"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Game Position"]:
-            has_match = False
-            for pos in qual_object["values"]:
-                pos = pos.upper()
-                other_pos = pos
-                if pos in position_map:
-                    other_pos = position_map[pos]
-                if pos in qual_str or other_pos in qual_str:
-                    has_match = True
-                    break
+    return True
 
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Moon Phase" in qualifiers:
-        moon_phases = human_moon(row["Date"])
+def perform_team_exact_state_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Moon Phase"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in moon_phases:
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Days Rest" in qualifiers:
-        days_rest = float("inf")
-        for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=True):
-            if sub_data["DateTime"] < row["DateTime"]:
-                days_rest = (row["Date"] - sub_data["Date"]).days - 1
+    val_to_check = venue_obj["state"]
+    if not val_to_check:
+        return False
+
+    for qual_object in qualifiers["Team Exact State"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower():
+                has_match = True
                 break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Days Rest"]:
-            if qual_object["negate"]:
-                if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Starts Days Rest" in qualifiers:
-        days_rest = float("inf")
-        for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=True):
-            if sub_data["DateTime"] < row["DateTime"] and sub_data["Start"]:
-                days_rest = (row["Date"] - sub_data["Date"]).days - 1
+    return True
+
+def perform_team_country_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
+
+    val_to_check = venue_obj["country"]
+
+    for qual_object in qualifiers["Team Country"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower():
+                has_match = True
                 break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Starts Days Rest"]:
-            if qual_object["negate"]:
-                if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Upcoming Starts Days Rest" in qualifiers:
-        days_rest = float("inf")
-        for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=False):
-            if sub_data["DateTime"] > row["DateTime"] and sub_data["Start"]:
-                days_rest = (row["Date"] - sub_data["Date"]).days - 1
+    return True
+
+def perform_team_exact_country_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
+
+    val_to_check = venue_obj["country"]
+
+    for qual_object in qualifiers["Team Exact Country"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower():
+                has_match = True
                 break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Upcoming Starts Days Rest"]:
-            if qual_object["negate"]:
-                if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
-                    return False
+    return True
+
+def perform_team_time_zone_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
+
+    val_to_check = venue_obj["time_zone"]
 
-    if "Upcoming Days Rest" in qualifiers:
-        days_rest = float("inf")
-        for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=False):
-            if sub_data["DateTime"] > row["DateTime"]:
-                days_rest = (row["Date"] - sub_data["Date"]).days - 1
+    for qual_object in qualifiers["Team Time Zone"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower().replace("_", ""):
+                has_match = True
                 break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Upcoming Days Rest"]:
-            if qual_object["negate"]:
-                if days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (days_rest >= qual_object["values"]["start_val"] and days_rest <= qual_object["values"]["end_val"]):
-                    return False
+    return True
 
-    if "Days In A Row" in qualifiers:
-        days_in_a_row = 1
-        date_to_check = row["Date"] - datetime.timedelta(days=1)
-        for sub_data in sorted(player_data["all_games"][row["Year"]], key=lambda seas_row: seas_row["DateTime"], reverse=True):
-            if sub_data["Date"] == date_to_check:
-                days_in_a_row += 1
-                date_to_check -= datetime.timedelta(days=1)
+def perform_team_exact_time_zone_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, True)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Days In A Row"]:
-            if qual_object["negate"]:
-                if days_in_a_row >= qual_object["values"]["start_val"] and days_in_a_row <= qual_object["values"]["end_val"]:
-                    return False
-            else:
-                if not (days_in_a_row >= qual_object["values"]["start_val"] and days_in_a_row <= qual_object["values"]["end_val"]):
-                    return False
-    
-    if "Team City" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+    val_to_check = venue_obj["time_zone"]
 
-        val_to_check = venue_obj["city"]
+    for qual_object in qualifiers["Team Exact Time Zone"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower().replace("_", ""):
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Team City"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower():
-                    has_match = True
-                    break
-                elif venue_obj["state"] and venue_obj["state"].lower() == "ny" and val_to_check.lower() in ["brooklyn", "bronx", "flushing"]:
-                    if stadium in "new york":
-                        has_match = True
-                        break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team Exact City" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+    return True
 
-        val_to_check = venue_obj["city"]
+def perform_opponent_city_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Team Exact City"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower():
+    val_to_check = venue_obj["city"]
+
+    for qual_object in qualifiers["Opponent City"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower():
+                has_match = True
+                break
+            elif venue_obj["state"] and venue_obj["state"].lower() == "ny" and val_to_check.lower() in ["brooklyn", "bronx", "flushing"]:
+                if stadium in "new york":
                     has_match = True
                     break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team State" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        val_to_check = venue_obj["state"]
-        if not val_to_check:
-            return False
+    return True
 
-        for qual_object in qualifiers["Team State"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team Exact State" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+def perform_opponent_exact_city_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
+
+    val_to_check = venue_obj["city"]
+
+    for qual_object in qualifiers["Opponent Exact City"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
+
+def perform_opponent_state_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
+
+    val_to_check = venue_obj["state"]
+    if not val_to_check:
+        return False
+
+    for qual_object in qualifiers["Opponent State"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
+
+    return True
 
-        val_to_check = venue_obj["state"]
-        if not val_to_check:
-            return False
+def perform_opponent_exact_state_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Team Exact State"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team Country" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+    val_to_check = venue_obj["state"]
+    if not val_to_check:
+        return False
 
-        val_to_check = venue_obj["country"]
+    for qual_object in qualifiers["Opponent Exact State"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Team Country"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team Exact Country" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+    return True
 
-        val_to_check = venue_obj["country"]
+def perform_opponent_country_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Team Exact Country"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team Time Zone" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+    val_to_check = venue_obj["country"]
 
-        val_to_check = venue_obj["time_zone"]
+    for qual_object in qualifiers["Opponent Country"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Team Time Zone"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower().replace("_", ""):
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Team Exact Time Zone" in qualifiers:
-        venue_obj = determine_venue_obj(row, True)
-        if not venue_obj:
-            return False
+    return True
 
-        val_to_check = venue_obj["time_zone"]
+def perform_opponent_exact_country_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Team Exact Time Zone"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower().replace("_", ""):
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent City" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+    val_to_check = venue_obj["country"]
 
-        val_to_check = venue_obj["city"]
+    for qual_object in qualifiers["Opponent Exact Country"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower():
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Opponent City"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower():
-                    has_match = True
-                    break
-                elif venue_obj["state"] and venue_obj["state"].lower() == "ny" and val_to_check.lower() in ["brooklyn", "bronx", "flushing"]:
-                    if stadium in "new york":
-                        has_match = True
-                        break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent Exact City" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+    return True
 
-        val_to_check = venue_obj["city"]
+def perform_opponent_time_zone_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
 
-        for qual_object in qualifiers["Opponent Exact City"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent State" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+    val_to_check = venue_obj["time_zone"]
 
-        val_to_check = venue_obj["state"]
-        if not val_to_check:
-            return False
+    for qual_object in qualifiers["Opponent Time Zone"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium in val_to_check.lower().replace("_", ""):
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        for qual_object in qualifiers["Opponent State"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent Exact State" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+    return True
 
-        val_to_check = venue_obj["state"]
-        if not val_to_check:
-            return False
+def perform_opponent_exact_time_zone_qualifier(player_data, player_type, row, time_frame, all_rows, qualifiers):
+    venue_obj = determine_venue_obj(row, False)
+    if not venue_obj:
+        return False
+        
+    val_to_check = venue_obj["time_zone"]
 
-        for qual_object in qualifiers["Opponent Exact State"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent Country" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+    for qual_object in qualifiers["Opponent Exact Time Zone"]:
+        has_match = False
+        for stadium in qual_object["values"]:
+            if stadium == val_to_check.lower().replace("_", ""):
+                has_match = True
+                break
+        if qual_object["negate"]:
+            if has_match:
+                return False
+        else:
+            if not has_match:
+                return False
 
-        val_to_check = venue_obj["country"]
+    return True
 
-        for qual_object in qualifiers["Opponent Country"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent Exact Country" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+row_qualifier_checks = [
+    ("Season Index", perform_season_index_qualifier),
+    ("Season Index Reversed", perform_season_index_reversed_qualifier),
+    ("Playoff Season Index", perform_playoff_season_index_qualifier),
+    ("Playoff Season Index Reversed", perform_playoff_season_index_reversed_qualifier),
+    ("Rookie", perform_rookie_qualifier),
+    ("Facing Former Team", perform_facing_former_team_qualifier),
+    ("Facing Former Franchise", perform_facing_former_franchise_qualifier),
+    ("With New Team", perform_with_new_team_qualifier),
+    ("With New Franchise", perform_with_new_franchise_qualifier),
+    ("Decision", perform_decision_qualifier),
+    ("Season Age", perform_season_age_qualifier),
+    ("Age", perform_age_qualifier),
+    ("Round", perform_round_qualifier),
+    ("First Half", perform_first_half_qualifier),
+    ("Second Half", perform_second_half_qualifier),
+    ("Pre All-Star", perform_pre_all_star_qualifier),
+    ("Post All-Star", perform_post_all_star_qualifier),
+    ("Location", perform_location_qualifier),
+    ("Activated From IL", perform_activated_from_il_qualifier),
+    ("Activated", perform_activated_qualifier),
+    ("Temperate Season", perform_temperate_season_qualifier),
+    ("Previous Location", perform_previous_location_qualifier),
+    ("Upcoming Location", perform_upcoming_location_qualifier),
+    ("Team", perform_team_qualifier),
+    ("Opponent", perform_opponent_qualifier),
+    ("Team Franchise", perform_team_franchise_qualifier),
+    ("Opponent Franchise", perform_opponent_franchise_qualifier),
+    ("Previous Team", perform_previous_team_qualifier),
+    ("Previous Opponent", perform_previous_opponent_qualifier),
+    ("Upcoming Team", perform_upcoming_team_qualifier),
+    ("Upcoming Opponent", perform_upcoming_opponent_qualifier),
+    ("Previous Team Franchise", perform_previous_team_franchise_qualifier),
+    ("Previous Opponent Franchise", perform_previous_opponent_franchise_qualifier),
+    ("Upcoming Team Franchise", perform_upcoming_team_franchise_qualifier),
+    ("Upcoming Opponent Franchise", perform_upcoming_opponent_franchise_qualifier),
+    ("Team League", perform_team_league_qualifier),
+    ("Opponent League", perform_opponent_league_qualifier),
+    ("Previous Team League", perform_previous_team_league_qualifier),
+    ("Previous Opponent League", perform_previous_opponent_league_qualifier),
+    ("Upcoming Team League", perform_upcoming_team_league_qualifier),
+    ("Upcoming Opponent League", perform_upcoming_opponent_league_qualifier),
+    ("Previous Same Opponent", perform_previous_same_opponent_qualifier),
+    ("Upcoming Same Opponent", perform_upcoming_same_opponent_qualifier),
+    ("Interleague", perform_interleague_qualifier),
+    ("Intraleague", perform_intraleague_qualifier),
+    ("Sub Query", perform_sub_query_qualifier),
+    ("Or Sub Query", perform_or_sub_query_qualifier),
+    ("Day Of Sub Query", perform_day_of_sub_query_qualifier),
+    ("Day After Sub Query", perform_day_after_sub_query_qualifier),
+    ("Day Before Sub Query", perform_day_before_sub_query_qualifier),
+    ("Game After Sub Query", perform_game_after_sub_query_qualifier),
+    ("Game Before Sub Query", perform_game_before_sub_query_qualifier),
+    ("Season Sub Query", perform_season_sub_query_qualifier),
+    ("Or Season Sub Query", perform_or_season_sub_query_qualifier),
+    ("Season After Sub Query", perform_season_after_sub_query_qualifier),
+    ("Season Before Sub Query", perform_season_before_sub_query_qualifier),
+    ("Playing With", perform_playing_with_qualifier),
+    ("Playing Against", perform_playing_against_qualifier),
+    ("Playing Same Game", perform_playing_same_game_qualifier),
+    ("Previous Playing With", perform_previous_playing_with_qualifier),
+    ("Upcoming Playing With", perform_upcoming_playing_with_qualifier),
+    ("Previous Playing Against", perform_previous_playing_against_qualifier),
+    ("Upcoming Playing Against", perform_upcoming_playing_against_qualifier),
+    ("Playing Same Opponents", perform_playing_same_opponents_qualifier),
+    ("Playing Same Date", perform_playing_same_date_qualifier),
+    ("Day After Pitching", perform_day_after_pitching_qualifier),
+    ("Day After Hitting", perform_day_after_hitting_qualifier),
+    ("Day Before Pitching", perform_day_before_pitching_qualifier),
+    ("Day Before Hitting", perform_day_before_hitting_qualifier),
+    ("Game After Pitching", perform_game_after_pitching_qualifier),
+    ("Game After Hitting", perform_game_after_hitting_qualifier),
+    ("Game Before Pitching", perform_game_before_pitching_qualifier),
+    ("Game Before Hitting", perform_game_before_hitting_qualifier),
+    ("Start", perform_start_qualifier),
+    ("Finished", perform_finished_qualifier),
+    ("Birthday", perform_birthday_qualifier),
+    ("Month", perform_month_qualifier),
+    ("Day", perform_day_qualifier),
+    ("Date", perform_date_qualifier),
+    ("Date And Month", perform_date_and_month_qualifier),
+    ("Dates", perform_dates_qualifier),
+    ("Season Game", perform_season_game_qualifier),
+    ("Career Game", perform_career_game_qualifier),
+    ("Career Game Reversed", perform_career_game_reversed_qualifier),
+    ("Season Game Reversed", perform_season_game_reversed_qualifier),
+    ("Final Team Score", perform_final_team_score_qualifier),
+    ("Final Opponent Score", perform_final_opponent_score_qualifier),
+    ("Final Score Margin", perform_final_score_margin_qualifier),
+    ("Final Score Difference", perform_final_score_difference_qualifier),
+    ("Previous Team Score", perform_previous_team_score_qualifier),
+    ("Previous Opponent Score", perform_previous_opponent_score_qualifier),
+    ("Previous Score Margin", perform_previous_score_margin_qualifier),
+    ("Previous Score Difference", perform_previous_score_difference_qualifier),
+    ("Upcoming Team Score", perform_upcoming_team_score_qualifier),
+    ("Upcoming Opponent Score", perform_upcoming_opponent_score_qualifier),
+    ("Upcoming Score Margin", perform_upcoming_score_margin_qualifier),
+    ("Upcoming Score Difference", perform_upcoming_score_difference_qualifier),
+    ("Batting Order Position", perform_batting_order_position_qualifier),
+    ("Result", perform_result_qualifier),
+    ("Previous Result", perform_previous_result_qualifier),
+    ("Upcoming Result", perform_upcoming_result_qualifier),
+    ("Year", perform_year_qualifier),
+    ("Even Year", perform_even_year_qualifier),
+    ("Odd Year", perform_odd_year_qualifier),
+    ("Calendar Year", perform_calendar_year_qualifier),
+    ("Even Calendar Year", perform_even_calendar_year_qualifier),
+    ("Odd Calendar Year", perform_odd_calendar_year_qualifier),
+    ("Double Header", perform_double_header_qualifier),
+    ("Holiday", perform_holiday_qualifier),
+    ("Save Situation", perform_save_situation_qualifier),
+    ("Inning Entered", perform_inning_entered_qualifier),
+    ("Last Inning Entered", perform_last_inning_entered_qualifier),
+    ("Top Inning Entered", perform_top_inning_entered_qualifier),
+    ("Bottom Inning Entered", perform_bottom_inning_entered_qualifier),
+    ("Outs Entered", perform_outs_entered_qualifier),
+    ("Outs Remaining Entered", perform_outs_remaining_entered_qualifier),
+    ("Men On Base Entered", perform_men_on_base_entered_qualifier),
+    ("Men In Scoring Entered", perform_men_in_scoring_entered_qualifier),
+    ("Score Margin Entered", perform_score_margin_entered_qualifier),
+    ("Score Difference Entered", perform_score_difference_entered_qualifier),
+    ("Season Number", perform_season_number_qualifier),
+    ("Primary Season Position", perform_primary_season_position_qualifier),
+    ("Season Position", perform_season_position_qualifier),
+    ("Primary Game Position", perform_primary_game_position_qualifier),
+    ("Game Position", perform_game_position_qualifier),
+    ("Moon Phase", perform_moon_phase_qualifier),
+    ("Days Rest", perform_days_rest_qualifier),
+    ("Starts Days Rest", perform_starts_days_rest_qualifier),
+    ("Upcoming Starts Days Rest", perform_upcoming_starts_days_rest_qualifier),
+    ("Upcoming Days Rest", perform_upcoming_days_rest_qualifier),
+    ("Days In A Row", perform_days_in_a_row_qualifier),
+    ("Team City", perform_team_city_qualifier),
+    ("Team Exact City", perform_team_exact_city_qualifier),
+    ("Team State", perform_team_state_qualifier),
+    ("Team Exact State", perform_team_exact_state_qualifier),
+    ("Team Country", perform_team_country_qualifier),
+    ("Team Exact Country", perform_team_exact_country_qualifier),
+    ("Team Time Zone", perform_team_time_zone_qualifier),
+    ("Team Exact Time Zone", perform_team_exact_time_zone_qualifier),
+    ("Opponent City", perform_opponent_city_qualifier),
+    ("Opponent Exact City", perform_opponent_exact_city_qualifier),
+    ("Opponent State", perform_opponent_state_qualifier),
+    ("Opponent Exact State", perform_opponent_exact_state_qualifier),
+    ("Opponent Country", perform_opponent_country_qualifier),
+    ("Opponent Exact Country", perform_opponent_exact_country_qualifier),
+    ("Opponent Time Zone", perform_opponent_time_zone_qualifier),
+    ("Opponent Exact Time Zone", perform_opponent_exact_time_zone_qualifier)
+]
 
-        val_to_check = venue_obj["country"]
+row_qualifier_plans = {}
 
-        for qual_object in qualifiers["Opponent Exact Country"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower():
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent Time Zone" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
-            return False
+def get_row_qualifier_plan(qualifiers):
+    plan_key = frozenset(qualifiers)
+    plan = row_qualifier_plans.get(plan_key)
+    if plan is None:
+        # Only the checks for qualifiers present in the query are kept, in their original order
+        plan = tuple(qualifier_check for qualifier_name, qualifier_check in row_qualifier_checks if qualifier_name in qualifiers)
+        row_qualifier_plans[plan_key] = plan
+    return plan
 
-        val_to_check = venue_obj["time_zone"]
+def perform_qualifier(player_data, player_type, row, time_frame, all_rows):
+    qualifiers = time_frame["qualifiers"]
 
-        for qual_object in qualifiers["Opponent Time Zone"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium in val_to_check.lower().replace("_", ""):
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-    
-    if "Opponent Exact Time Zone" in qualifiers:
-        venue_obj = determine_venue_obj(row, False)
-        if not venue_obj:
+    if ("fake_playoff_row" in row and row["fake_playoff_row"]) or ("fake_reg_row" in row and row["fake_reg_row"]):
+        return True
+
+    for qualifier_check in get_row_qualifier_plan(qualifiers):
+        if not qualifier_check(player_data, player_type, row, time_frame, all_rows, qualifiers):
             return False
-            
-        val_to_check = venue_obj["time_zone"]
 
-        for qual_object in qualifiers["Opponent Exact Time Zone"]:
-            has_match = False
-            for stadium in qual_object["values"]:
-                if stadium == val_to_check.lower().replace("_", ""):
-                    has_match = True
-                    break
-            if qual_object["negate"]:
-                if has_match:
-                    return False
-            else:
-                if not has_match:
-                    return False
-                    
     return True
 
 def determine_venue_obj(row, is_team):
@@ -23560,89 +23874,192 @@ def determine_venue_obj(row, is_team):
 
 def get_venue_obj(team, sleague, year):
     team_id = None
-    for parsed_team_name in team_name_info:
-        if team in team_name_info[parsed_team_name]:
-            if sleague in team_name_info[parsed_team_name][team]:
-                if year in team_name_info[parsed_team_name][team][sleague]:
-                    team_id = team_ids[sleague][parsed_team_name]
-                    break
-    
-    if not team_id:
-        for parsed_team_name in team_name_info:
-            if team in team_name_info[parsed_team_name]:
-                if sleague in team_name_info[parsed_team_name][team]:
-                    team_id = team_ids[sleague][parsed_team_name]
+    team_names = team_name_index.get((team, sleague))
+    if team_names:
+        if year in team_names["years"]:
+            team_id = team_ids[sleague][team_names["years"][year]]
+        else:
+            team_id = team_ids[sleague][team_names["fallback"]]
 
-    if team_id and str(team_id) in team_venue_history:
+    if not team_id or str(team_id) not in team_venue_history:
+        return None, None
+
+    venue_key = (str(team_id), year)
+    if venue_key not in team_venue_year_index:
+        team_venue_year_index[venue_key] = None
         for pot_team_venue in team_venue_history[str(team_id)]:
             if pot_team_venue["start_year"] == None:
                 if year <= pot_team_venue["end_year"]:
-                    return pot_team_venue["venue"], team_venues[str(pot_team_venue["venue"])]
+                    team_venue_year_index[venue_key] = pot_team_venue["venue"]
+                    break
             elif pot_team_venue["end_year"] == None:
                 if year >= pot_team_venue["start_year"]:
-                    return pot_team_venue["venue"], team_venues[str(pot_team_venue["venue"])]
+                    team_venue_year_index[venue_key] = pot_team_venue["venue"]
+                    break
             else:
                 if year >= pot_team_venue["start_year"] and year <= pot_team_venue["end_year"]:
-                    return pot_team_venue["venue"], team_venues[str(pot_team_venue["venue"])]
+                    team_venue_year_index[venue_key] = pot_team_venue["venue"]
+                    break
 
-    return None, None
+    venue_id = team_venue_year_index[venue_key]
+    if venue_id == None:
+        return None, None
+    return venue_id, team_venues[str(venue_id)]
+
+moon_phase_tables = {}
+moon_phase_names = ["Full Moon", "New Moon", "First Quarter", "Third Quarter"]
+moon_phase_next_funcs = {
+    "Full Moon" : ephem.next_full_moon,
+    "New Moon" : ephem.next_new_moon,
+    "First Quarter" : ephem.next_first_quarter_moon,
+    "Third Quarter" : ephem.next_last_quarter_moon
+}
+moon_phase_between_names = {
+    "First Quarter" : "Waxing Crescent",
+    "Full Moon" : "Waxing Gibbous",
+    "Third Quarter" : "Waning Gibbous",
+    "New Moon" : "Waning Crescent"
+}
 
 def human_moon(date):
-    date = datetime.datetime(year=date.year, month=date.month, day=date.day, hour=19, minute=0, second=0)
-    date = pytz.timezone("US/Eastern").localize(date)
-    next_full = ephem.next_full_moon(date)
-    next_new = ephem.next_new_moon(date)
-    next_last_quarter = ephem.next_last_quarter_moon(date)
-    next_first_quarter = ephem.next_first_quarter_moon(date)
-    previous_full = ephem.previous_full_moon(date)
-    previous_new = ephem.previous_new_moon(date)
-    previous_last_quarter = ephem.previous_last_quarter_moon(date)
-    previous_first_quarter = ephem.previous_first_quarter_moon(date)
-
-    moon_phases = []
-
-    if is_moon_match(date.date(), next_full):
-        moon_phases.append("Full Moon")
-    if is_moon_match(date.date(), previous_full):
-        moon_phases.append("Full Moon")
-    
-    if is_moon_match(date.date(), next_new):
-        moon_phases.append("New Moon")
-    if is_moon_match(date.date(), previous_new):
-        moon_phases.append("New Moon")
-    
-    if is_moon_match(date.date(), next_first_quarter):
-        moon_phases.append("First Quarter")
-    if is_moon_match(date.date(), previous_first_quarter):
-        moon_phases.append("First Quarter")
-    
-    if is_moon_match(date.date(), next_last_quarter):
-        moon_phases.append("Third Quarter")
-    if is_moon_match(date.date(), previous_last_quarter):
-        moon_phases.append("Third Quarter")
-    
-    if previous_new < next_first_quarter < next_full < next_last_quarter < next_new:
-        moon_phases.append("Waxing Crescent")
-    elif previous_first_quarter < next_full < next_last_quarter < next_new < next_first_quarter:
-        moon_phases.append("Waxing Gibbous")
-    elif previous_full < next_last_quarter < next_new < next_first_quarter < next_full:
-        moon_phases.append("Waning Gibbous")
-    elif previous_last_quarter < next_new < next_first_quarter < next_full < next_last_quarter:
-        moon_phases.append("Waning Crescent")
-
-    return [moon_phase.lower() for moon_phase in moon_phases]
-
-def is_moon_match(da_date, da_moon_date):
+    if date.year not in moon_phase_tables:
+        moon_phase_tables[date.year] = build_moon_phase_table(date.year)
+    return moon_phase_tables[date.year][datetime.date(date.year, date.month, date.day)]
+
+def build_moon_phase_table(year):
+    eastern = pytz.timezone("US/Eastern")
+    first_date = datetime.date(year, 1, 1)
+    end_time = ephem.Date(eastern.localize(datetime.datetime(year=year + 1, month=2, day=1, hour=19, minute=0, second=0)))
+
+    # Walk every phase event from a month before to a month after the year once, instead of searching from each day
+    phase_events = []
+    for moon_phase in moon_phase_names:
+        event_time = moon_phase_next_funcs[moon_phase](eastern.localize(datetime.datetime(year=year - 1, month=12, day=1, hour=19, minute=0, second=0)))
+        while event_time < end_time:
+            phase_events.append((float(event_time), moon_phase))
+            event_time = moon_phase_next_funcs[moon_phase](ephem.Date(event_time + 1))
+    phase_events.sort()
+    event_times = [phase_event[0] for phase_event in phase_events]
+
+    event_dates = {}
+    for event_time, moon_phase in phase_events:
+        for match_date in get_moon_match_dates(ephem.Date(event_time)):
+            if match_date not in event_dates:
+                event_dates[match_date] = set()
+            event_dates[match_date].add(moon_phase)
+
+    moon_phase_table = {}
+    for day in range((datetime.date(year + 1, 1, 1) - first_date).days):
+        da_date = first_date + datetime.timedelta(days=day)
+        da_time = ephem.Date(eastern.localize(datetime.datetime(year=da_date.year, month=da_date.month, day=da_date.day, hour=19, minute=0, second=0)))
+
+        moon_phases = [moon_phase for moon_phase in moon_phase_names if moon_phase in event_dates.get(da_date, ())]
+        next_event = phase_events[bisect.bisect_right(event_times, float(da_time))]
+        moon_phases.append(moon_phase_between_names[next_event[1]])
+
+        moon_phase_table[da_date] = [moon_phase.lower() for moon_phase in moon_phases]
+
+    return moon_phase_table
+
+def get_moon_match_dates(da_moon_date):
     da_moon_date = da_moon_date.datetime()
     da_moon_date = pytz.utc.localize(da_moon_date).astimezone(pytz.timezone("US/Eastern"))
     if da_moon_date.time() < datetime.time(hour=12, minute=0, second=0):
-        dt_1 = da_moon_date - datetime.timedelta(days=1)
-        dt_2 = da_moon_date
+        return [(da_moon_date - datetime.timedelta(days=1)).date(), da_moon_date.date()]
     else:
-        dt_1 = da_moon_date
-        dt_2 = da_moon_date
+        return [da_moon_date.date()]
+
+holiday_infos = {}
+holiday_year_dates = {}
+holiday_date_matches = {}
+
+def get_holiday_info(holiday):
+    if holiday in holiday_infos:
+        return holiday_infos[holiday]
+
+    holiday_name = holiday
+    country = "usa"
+    eve = False
+    observed = False
+    church = "western"
+    if "canadian" in holiday_name:
+        country = "canada"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("canadian", "")).strip()
+    elif "canada" in holiday_name:
+        country = "canada"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("canada", "")).strip()
+    elif "eve" in holiday_name:
+        eve = True
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("eve", "")).strip()
+    elif "observed" in holiday_name:
+        observed = True
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("observed", "")).strip()
+    elif "orthodox" in holiday_name:
+        church = "orthodox"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("orthodox", "")).strip()
+    elif "eastern" in holiday_name:
+        church = "eastern"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("eastern", "")).strip()
+    holiday_name = re.sub(r"\W+", "", re.sub(r"[\s-]+", "_", holiday_name))
+
+    holiday_info = {
+        "church" : church,
+        "country" : country,
+        "observed" : observed,
+        "eve" : eve,
+        "custom_func" : None,
+        "func" : None
+    }
+    for holiday_func in all_custom_holidays:
+        if holiday_func[0] == holiday_name:
+            holiday_info["custom_func"] = holiday_func[1]
+            break
+    if not holiday_info["custom_func"]:
+        for holiday_func in all_holidays:
+            if holiday_func[0] == holiday_name:
+                holiday_info["func"] = holiday_func[1]
+                break
 
-    return da_date >= dt_1.date() and da_date <= dt_2.date()
+    holiday_infos[holiday] = holiday_info
+    return holiday_info
+
+def get_holiday_date(holiday, year):
+    holiday_key = (holiday, year)
+    if holiday_key in holiday_year_dates:
+        return holiday_year_dates[holiday_key]
+
+    holiday_info = get_holiday_info(holiday)
+    holiday_func = holiday_info["func"]
+    arguments = inspect.signature(holiday_func).parameters
+    if "church" in arguments:
+        holiday_date = holiday_func(year, church=holiday_info["church"])
+    elif "country" in arguments:
+        holiday_date = holiday_func(year, country=holiday_info["country"])
+    elif "observed" in arguments:
+        holiday_date = holiday_func(year, observed=holiday_info["observed"])
+    elif "eve" in arguments:
+        holiday_date = holiday_func(year, eve=holiday_info["eve"])
+    else:
+        holiday_date = holiday_func(year)
+
+    if holiday_date:
+        holiday_date = datetime.datetime(holiday_date[0], holiday_date[1], holiday_date[2]).date()
+        if holiday_info["eve"]:
+            holiday_date -= datetime.timedelta(days=1)
+
+    holiday_year_dates[holiday_key] = holiday_date
+    return holiday_date
+
+def is_holiday_match(game_date, holiday):
+    holiday_info = get_holiday_info(holiday)
+    if holiday_info["custom_func"]:
+        holiday_key = (holiday, game_date)
+        if holiday_key not in holiday_date_matches:
+            holiday_date_matches[holiday_key] = bool(holiday_info["custom_func"](game_date, holiday_info["church"], holiday_info["country"], holiday_info["observed"], holiday_info["eve"]))
+        return holiday_date_matches[holiday_key]
+    elif holiday_info["func"]:
+        return get_holiday_date(holiday, game_date.year) == game_date
+    return False
 
 def parse_entered_str(row):
     is_save_situation = bool(row.get("SV", 0) or row.get("BSv", 0) or row.get("Hold", 0))
@@ -23905,6 +24322,8 @@ def handle_min_max_calc(the_stats, stat_quals, player_data, player_type, stat, t
         only_games = True
         qual_type = qual_type.replace("Single-Game-", "")
 
+    row_columns = build_row_columns(all_rows, player_type)
+
     if qual_type == "Days" or qual_type == "Weeks" or qual_type == "Months" or qual_type == "Years":
         dates = [row["Date"] for row in all_rows]
         start_date = min(dates)
@@ -23929,7 +24348,7 @@ def handle_min_max_calc(the_stats, stat_quals, player_data, player_type, stat, t
             
             for days in range((end_date - start_date).days + 1):
                 current_start_date = start_date + datetime.timedelta(days)
-                stat_value, matching_rows = handle_date_rows(player_data, player_type, stat, current_start_date, date_diff, all_rows)
+                stat_value, matching_rows = handle_date_rows(player_data, player_type, stat, current_start_date, date_diff, all_rows, row_columns=row_columns)
                 if matching_rows:
                     if not stat_quals:
                         single_index = 0
@@ -23967,7 +24386,7 @@ def handle_min_max_calc(the_stats, stat_quals, player_data, player_type, stat, t
             tmp_end_date = end_date - datetime.timedelta(days=end_date.weekday())
             end_date = tmp_end_date + datetime.timedelta(days=6)
             for date in dateutil.rrule.rrule(dateutil.rrule.WEEKLY, dtstart=start_date, until=end_date):
-                stat_value, matching_rows = handle_week_rows(player_data, player_type, stat, date, all_rows)
+                stat_value, matching_rows = handle_week_rows(player_data, player_type, stat, date, all_rows, row_columns=row_columns)
                 if matching_rows:
                     if not stat_quals:
                         single_index = 0
@@ -23993,7 +24412,7 @@ def handle_min_max_calc(the_stats, stat_quals, player_data, player_type, stat, t
             start_date = datetime.datetime(start_date.year, start_date.month, 1)
             end_date = datetime.datetime(end_date.year, end_date.month, calendar.monthrange(end_date.year, end_date.month)[1])
             for date in dateutil.rrule.rrule(dateutil.rrule.MONTHLY, dtstart=start_date, until=end_date):
-                stat_value, matching_rows = handle_month_rows(player_data, player_type, stat, date, all_rows)
+                stat_value, matching_rows = handle_month_rows(player_data, player_type, stat, date, all_rows, row_columns=row_columns)
                 if matching_rows:
                     if not stat_quals:
                         single_index = 0
@@ -24019,7 +24438,7 @@ def handle_min_max_calc(the_stats, stat_quals, player_data, player_type, stat, t
             start_date = datetime.datetime(start_date.year, 1, 1)
             end_date = datetime.datetime(end_date.year, 12, calendar.monthrange(end_date.year, 12)[1])
             for date in dateutil.rrule.rrule(dateutil.rrule.YEARLY, dtstart=start_date, until=end_date):
-                stat_value, matching_rows = handle_year_rows(player_data, player_type, stat, date, all_rows)
+                stat_value, matching_rows = handle_year_rows(player_data, player_type, stat, date, all_rows, row_columns=row_columns)
                 if matching_rows:
                     if not stat_quals:
                         single_index = 0
@@ -24045,7 +24464,7 @@ def handle_min_max_calc(the_stats, stat_quals, player_data, player_type, stat, t
         qual_num = qual_num_start
         while (True):
             for i in range(len(all_rows)):
-                stat_value, matching_rows = handle_game_rows(i, player_data, player_type, stat, qual_num, all_rows, only_seasons)
+                stat_value, matching_rows = handle_game_rows(i, player_data, player_type, stat, qual_num, all_rows, only_seasons, row_columns=row_columns)
                 if matching_rows:
                     if not stat_quals:
                         single_index = 0
@@ -24304,6 +24723,8 @@ def handle_min_max_final(stat_val, current_explain_strs, player_data, player_typ
     
     format_str = "b" if player_type["da_type"] == "Batter" else "p"
 
+    row_columns = build_row_columns(all_rows, player_type)
+
     match_count = 0
     total_matching_rows = []
     total_matching_strs = []
@@ -24332,7 +24753,7 @@ def handle_min_max_final(stat_val, current_explain_strs, player_data, player_typ
             
             for days in range((end_date - start_date).days + 1):
                 current_start_date = start_date + datetime.timedelta(days)
-                stat_value, matching_rows = handle_date_rows(player_data, player_type, stat, current_start_date, date_diff, all_rows)
+                stat_value, matching_rows = handle_date_rows(player_data, player_type, stat, current_start_date, date_diff, all_rows, row_columns=row_columns)
                 if matching_rows:
                     has_match = False
                     has_value_match = False
@@ -24399,7 +24820,7 @@ def handle_min_max_final(stat_val, current_explain_strs, player_data, player_typ
                 real_end_date = tmp_real_end_date + datetime.timedelta(days=6)
                 date_diff = real_end_date - date + datetime.timedelta(days=1)
 
-                stat_value, matching_rows = handle_week_rows(player_data, player_type, stat, date, all_rows)
+                stat_value, matching_rows = handle_week_rows(player_data, player_type, stat, date, all_rows, row_columns=row_columns)
                 if matching_rows:
                     has_match = False
                     has_value_match = False
@@ -24450,7 +24871,7 @@ def handle_min_max_final(stat_val, current_explain_strs, player_data, player_typ
             end_date = datetime.datetime(end_date.year, end_date.month, calendar.monthrange(end_date.year, end_date.month)[1])
             for date in dateutil.rrule.rrule(dateutil.rrule.MONTHLY, dtstart=start_date, until=end_date):
                 date_diff = datetime.datetime(date.year, date.month, calendar.monthrange(date.year, date.month)[1]) - date + datetime.timedelta(days=1)
-                stat_value, matching_rows = handle_month_rows(player_data, player_type, stat, date, all_rows)
+                stat_value, matching_rows = handle_month_rows(player_data, player_type, stat, date, all_rows, row_columns=row_columns)
                 if matching_rows:
                     has_match = False
                     has_value_match = False
@@ -24495,7 +24916,7 @@ def handle_min_max_final(stat_val, current_explain_strs, player_data, player_typ
             end_date = datetime.datetime(end_date.year, 12, calendar.monthrange(end_date.year, 12)[1])
             for date in dateutil.rrule.rrule(dateutil.rrule.YEARLY, dtstart=start_date, until=end_date):
                 date_diff = datetime.datetime(date.year, 12, calendar.monthrange(date.year, 12)[1]) - date + datetime.timedelta(days=1)
-                stat_value, matching_rows = handle_year_rows(player_data, player_type, stat, date, all_rows)
+                stat_value, matching_rows = handle_year_rows(player_data, player_type, stat, date, all_rows, row_columns=row_columns)
                 if matching_rows:
                     has_match = False
                     has_value_match = False
@@ -24539,7 +24960,7 @@ def handle_min_max_final(stat_val, current_explain_strs, player_data, player_typ
         qual_num = qual_num_start
         while (True):
             for i in range(len(all_rows)):
-                stat_value, matching_rows = handle_game_rows(i, player_data, player_type, stat, qual_num, all_rows, only_seasons)
+                stat_value, matching_rows = handle_game_rows(i, player_data, player_type, stat, qual_num, all_rows, only_seasons, row_columns=row_columns)
                 if matching_rows:
                     has_match = False
                     has_value_match = False
@@ -25374,80 +25795,63 @@ def handle_max_streak_calc(new_rows, stat_objs, player_data, player_type, all_ro
         all_rows = list(reversed(all_rows))
 
     if qual_type == "Games" or qual_type == "Games-Start" or qual_type == "Games-End":
-        prev_year = None
-        break_next = False
-        for i in range(len(all_rows)):
-            row = all_rows[i]
-            if prev_year != None and prev_year == row["Year"]:
-                if break_next:
+        if is_start == None:
+            run_ends = get_streak_run_ends(player_data, player_type, stat_objs, all_rows, only_seasons, is_formula)
+            covered_end = 0
+            covered_game_ids = set()
+            for i in range(len(all_rows)):
+                if run_ends[i] == i or i < covered_end:
                     continue
-            else:
-                break_next = False
-            prev_year = row["Year"]
 
-            matching_rows = handle_streak_game_rows(i, player_data, player_type, stat_objs, all_rows, only_seasons, is_formula)
-            if matching_rows:
-                if not stat_quals:
-                    found_match = False
-                    for key in all_streak_obj:
-                        for old_rows in all_streak_obj[key]:
-                            for old_row in old_rows:
-                                for new_row in matching_rows:
-                                    if new_row["GameID"] == old_row["GameID"]:
-                                        found_match = True
-                                        break
-                    if not found_match:
-                        streak_length = len(matching_rows)
-                        if not streak_length in all_streak_obj:
-                            all_streak_obj[streak_length] = []
-                        all_streak_obj[streak_length].append(matching_rows)
-                elif valid_matching_rows(matching_rows, stat_quals, player_type, player_data):
-                    found_match = False
-                    for key in all_streak_obj:
-                        for old_rows in all_streak_obj[key]:
-                            for old_row in old_rows:
-                                for new_row in matching_rows:
-                                    if new_row["GameID"] == old_row["GameID"]:
-                                        found_match = True
-                                        break
-                    if not found_match:
+                matching_rows = all_rows[i:run_ends[i]]
+                if any(row["GameID"] in covered_game_ids for row in matching_rows):
+                    continue
+                if not stat_quals or valid_matching_rows(matching_rows, stat_quals, player_type, player_data):
+                    covered_end = run_ends[i]
+                    covered_game_ids.update(row["GameID"] for row in matching_rows)
+                    streak_length = len(matching_rows)
+                    if not streak_length in all_streak_obj:
+                        all_streak_obj[streak_length] = []
+                    all_streak_obj[streak_length].append(matching_rows)
+        else:
+            covered_game_ids = set()
+            prev_year = None
+            break_next = False
+            for i in range(len(all_rows)):
+                row = all_rows[i]
+                if prev_year != None and prev_year == row["Year"]:
+                    if break_next:
+                        continue
+                else:
+                    break_next = False
+                prev_year = row["Year"]
+
+                matching_rows = handle_streak_game_rows(i, player_data, player_type, stat_objs, all_rows, only_seasons, is_formula)
+                if matching_rows:
+                    found_match = any(row["GameID"] in covered_game_ids for row in matching_rows)
+                    if not found_match and (not stat_quals or valid_matching_rows(matching_rows, stat_quals, player_type, player_data)):
+                        covered_game_ids.update(row["GameID"] for row in matching_rows)
                         streak_length = len(matching_rows)
                         if not streak_length in all_streak_obj:
                             all_streak_obj[streak_length] = []
                         all_streak_obj[streak_length].append(matching_rows)
-            elif only_seasons and (is_start == True or is_start == False):
-                break_next = True
+                elif only_seasons:
+                    break_next = True
 
-            if not only_seasons and (is_start == True or is_start == False):
-                break
+                if not only_seasons:
+                    break
     elif qual_type == "Seasons" or qual_type == "Seasons-Start" or qual_type == "Seasons-End":
         seasons = sorted(list(set([row["Year"] for row in all_rows])))
         for i in range(len(seasons)):
             matching_rows = handle_streak_season_rows(i, seasons, player_data, player_type, stat_objs, all_rows)
             if matching_rows:
                 if not stat_quals:
-                    found_match = False
-                    for key in all_streak_obj:
-                        for old_rows in all_streak_obj[key]:
-                            for old_row in old_rows:
-                                for new_row in matching_rows:
-                                    if new_row["Year"] == old_row["Year"]:
-                                        found_match = True
-                                        break
                     dates = set([row["Year"] for row in matching_rows])
                     streak_length = len(dates)
                     if not streak_length in all_streak_obj:
                         all_streak_obj[streak_length] = []
                     all_streak_obj[streak_length].append(matching_rows)
                 elif valid_matching_rows(matching_rows, stat_quals, player_type, player_data):
-                    found_match = False
-                    for key in all_streak_obj:
-                        for old_rows in all_streak_obj[key]:
-                            for old_row in old_rows:
-                                for new_row in matching_rows:
-                                    if new_row["Year"] == old_row["Year"]:
-                                        found_match = True
-                                        break
                     dates = set([row["Year"] for row in matching_rows])
                     streak_length = len(dates)
                     if not streak_length in all_streak_obj:
@@ -25460,6 +25864,20 @@ def handle_max_streak_calc(new_rows, stat_objs, player_data, player_type, all_ro
         teams = sorted(list(set([row[row_stat] for row in all_rows])))
         for team in teams:
             team_rows = [row for row in all_rows if row[row_stat] == team]
+            if is_start == None:
+                run_ends = get_streak_run_ends(player_data, player_type, stat_objs, team_rows, only_seasons, False)
+                for i in range(len(team_rows)):
+                    if run_ends[i] == i:
+                        continue
+
+                    matching_rows = team_rows[i:run_ends[i]]
+                    if not stat_quals or valid_matching_rows(matching_rows, stat_quals, player_type, player_data):
+                        streak_length = len(matching_rows)
+                        if not streak_length in all_streak_obj:
+                            all_streak_obj[streak_length] = []
+                        all_streak_obj[streak_length].append(matching_rows)
+                continue
+
             prev_year = None
             break_next = False
             for i in range(len(team_rows)):
@@ -25473,20 +25891,15 @@ def handle_max_streak_calc(new_rows, stat_objs, player_data, player_type, all_ro
 
                 matching_rows = handle_streak_game_rows(i, player_data, player_type, stat_objs, team_rows, only_seasons, False)
                 if matching_rows:
-                    if not stat_quals:
-                        streak_length = len(matching_rows)
-                        if not streak_length in all_streak_obj:
-                            all_streak_obj[streak_length] = []
-                        all_streak_obj[streak_length].append(matching_rows)
-                    elif valid_matching_rows(matching_rows, stat_quals, player_type, player_data):
+                    if not stat_quals or valid_matching_rows(matching_rows, stat_quals, player_type, player_data):
                         streak_length = len(matching_rows)
                         if not streak_length in all_streak_obj:
                             all_streak_obj[streak_length] = []
                         all_streak_obj[streak_length].append(matching_rows)
-                elif only_seasons and (is_start == True or is_start == False):
+                elif only_seasons:
                     break_next = True
 
-                if not only_seasons and (is_start == True or is_start == False):
+                if not only_seasons:
                     break
 
     all_streak_counts = sorted(list(all_streak_obj.keys()), reverse=True)
@@ -25675,6 +26088,7 @@ def handle_max_stretch_calc(new_rows, stat_objs, player_data, player_type, all_r
         all_rows = list(reversed(all_rows))
 
     if qual_type == "Games" or qual_type == "Games-Start" or qual_type == "Games-End":
+        row_columns = build_row_columns(all_rows, player_type)
         prev_year = None
         break_next = False
         for i in range(len(all_rows)):
@@ -25686,7 +26100,7 @@ def handle_max_stretch_calc(new_rows, stat_objs, player_data, player_type, all_r
                 break_next = False
             prev_year = row["Year"]
 
-            total_matching_rows = handle_stretch_game_rows(i, player_data, player_type, stat_objs, all_rows, only_seasons)
+            total_matching_rows = handle_stretch_game_rows(i, player_data, player_type, stat_objs, all_rows, only_seasons, row_columns=row_columns)
             for matching_rows in total_matching_rows:
                 if not stat_quals:
                     found_match = False
@@ -26278,7 +26692,87 @@ def get_matching_row_val(match_all, stat, matching_rows, stat_quals, player_data
     
     return stat_objs
 
-def comb_rows(matching_rows, player_data, player_type, lower=True, stats=None):
+def build_row_columns(all_rows, player_type):
+    playoff_rows = numpy.array([bool(row_data["is_playoffs"]) for row_data in all_rows], dtype=bool)
+    next_playoff_index = numpy.full(len(all_rows) + 1, len(all_rows), dtype=int)
+    for index in range(len(all_rows) - 1, -1, -1):
+        next_playoff_index[index] = index if playoff_rows[index] else next_playoff_index[index + 1]
+
+    season_start_index = []
+    for index, row_data in enumerate(all_rows):
+        if index and all_rows[index - 1]["Year"] == row_data["Year"]:
+            season_start_index.append(season_start_index[index - 1])
+        else:
+            season_start_index.append(index)
+
+    dates = [row_data.get("DateTime") for row_data in all_rows]
+    dates_sorted = all(isinstance(date, datetime.datetime) for date in dates) or all(isinstance(date, int) for date in dates)
+    if dates_sorted:
+        dates_sorted = all(dates[index - 1] <= dates[index] for index in range(1, len(dates)))
+
+    return {
+        "all_rows" : all_rows,
+        "player_type" : player_type,
+        "index" : {id(row_data) : index for index, row_data in enumerate(all_rows)},
+        "columns" : {},
+        "prefix_sums" : {},
+        "playoff_prefix" : numpy.concatenate(([0], numpy.cumsum(playoff_rows))),
+        "next_playoff_index" : next_playoff_index,
+        "season_start_index" : season_start_index,
+        "dates" : dates if dates_sorted else None
+    }
+
+def get_row_column(row_columns, header):
+    # Columns are only built for the stats a search actually combines
+    if header not in row_columns["columns"]:
+        player_type = row_columns["player_type"]
+        column = None
+        if header in formulas[player_type["da_type"]] or header in advanced_stats["Batter"] or header in advanced_stats["Pitcher"]:
+            pass
+        elif header in qualifier_map and header != "Team Score" and header != "Opponent Score":
+            pass
+        elif header in decimal_stats:
+            # Decimal stats are rounded after every row, a column sum would only round once
+            pass
+        else:
+            column = numpy.array([row_data[header] if header in row_data and isinstance(row_data[header], numbers.Number) else 0 for row_data in row_columns["all_rows"]], dtype=float)
+            # Window totals are read as prefix differences, only exact for integer valued stats
+            if numpy.array_equal(column, numpy.floor(column)):
+                row_columns["prefix_sums"][header] = numpy.concatenate(([0.0], numpy.cumsum(column)))
+        row_columns["columns"][header] = column
+    return row_columns["columns"][header]
+
+def get_row_column_indexes(row_columns, matching_rows):
+    if not matching_rows:
+        return None
+
+    index = row_columns["index"]
+    first_index = index.get(id(matching_rows[0]))
+    last_index = index.get(id(matching_rows[-1]))
+    if first_index == None or last_index == None:
+        return None
+
+    if last_index - first_index + 1 == len(matching_rows):
+        return slice(first_index, last_index + 1)
+
+    row_indexes = []
+    for row_data in matching_rows:
+        row_index = index.get(id(row_data))
+        if row_index == None:
+            return None
+        row_indexes.append(row_index)
+    return numpy.array(row_indexes, dtype=int)
+
+def get_window_is_playoffs(row_columns, start_index, end_index):
+    first_playoff_index = row_columns["next_playoff_index"][start_index]
+    if first_playoff_index >= end_index:
+        return None
+    playoff_count = row_columns["playoff_prefix"][end_index] - row_columns["playoff_prefix"][first_playoff_index + 1]
+    if end_index - first_playoff_index - 1 > playoff_count:
+        return "Include"
+    return "Only"
+
+def comb_rows(matching_rows, player_data, player_type, lower=True, stats=None, row_columns=None):
     parse_formula_stats = stats == None or set(stats).intersection(formulas[player_type["da_type"]].keys())
     parse_advanced_stats = stats == None or set(stats).intersection(advanced_stats[player_type["da_type"]])
 
@@ -26288,11 +26782,38 @@ def comb_rows(matching_rows, player_data, player_type, lower=True, stats=None):
             if not header in formulas[player_type["da_type"]] and not header in advanced_stats["Batter"] and not header in advanced_stats["Pitcher"]:
                 comb_row[header] = 0.0
 
+    row_indexes = get_row_column_indexes(row_columns, matching_rows) if row_columns else None
+    is_window = isinstance(row_indexes, slice)
+    row_stats = None
+    if row_indexes is not None:
+        row_stats = ["DateTime"]
+        for stat in comb_row:
+            column = get_row_column(row_columns, stat)
+            if column is None:
+                if stat in decimal_stats:
+                    row_stats.append(stat)
+                continue
+            if is_window and stat in row_columns["prefix_sums"]:
+                stat_total = row_columns["prefix_sums"][stat][row_indexes.stop] - row_columns["prefix_sums"][stat][row_indexes.start]
+            else:
+                stat_total = column[row_indexes].sum()
+            comb_row[stat] = float(stat_total)
+
     date_start = 0
     date_end = 0
     is_playoffs = None
-    for row_data in matching_rows:
-        for stat in row_data:
+    rows_to_walk = matching_rows
+    if is_window and row_columns["dates"] and len(row_stats) == 1:
+        # Contiguous window over sorted rows, the first and last rows hold the date range
+        date_start = row_columns["dates"][row_indexes.start]
+        date_end = row_columns["dates"][row_indexes.stop - 1]
+        is_playoffs = get_window_is_playoffs(row_columns, row_indexes.start, row_indexes.stop)
+        rows_to_walk = []
+
+    for row_data in rows_to_walk:
+        for stat in (row_data if row_indexes is None else row_stats):
+            if stat not in row_data:
+                continue
             if parse_formula_stats or parse_advanced_stats or stat == "DateTime" or stats == None or stat in stats:
                 if stat in comb_row and isinstance(row_data[stat], numbers.Number) and isinstance(comb_row[stat], numbers.Number) and (not stat in qualifier_map or stat == "Team Score" or stat == "Opponent Score") and not stat in formulas[player_type["da_type"]] and not stat in advanced_stats["Batter"] and not stat in advanced_stats["Pitcher"] and row_data[stat] != 0:
                     if stat in decimal_stats:
@@ -26397,7 +26918,7 @@ def calculate_recursive_formula(stat, player_data, player_type, comb_row, matchi
                 calculate_recursive_formula(header_stat, player_data, player_type, comb_row, matching_rows)
     comb_row[stat] = calculate_formula(stat, player_data, player_type, formula, comb_row, matching_rows)
             
-def handle_date_rows(player_data, player_type, stat, start_date, date_diff, all_rows):
+def handle_date_rows(player_data, player_type, stat, start_date, date_diff, all_rows, row_columns=None):
     stat_value = 0
     matching_rows = []
     end_date = start_date + date_diff
@@ -26407,7 +26928,7 @@ def handle_date_rows(player_data, player_type, stat, start_date, date_diff, all_
 
     stats = set()
     find_sub_sub_stat_match(stat, player_type, stats)
-    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats)
+    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats, row_columns=row_columns)
     if stat not in combined_row:
         for header_stat in headers[player_type["da_type"]]:
             if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
@@ -26420,7 +26941,7 @@ def handle_date_rows(player_data, player_type, stat, start_date, date_diff, all_
 
     return stat_value, matching_rows
 
-def handle_week_rows(player_data, player_type, stat, date, all_rows):
+def handle_week_rows(player_data, player_type, stat, date, all_rows, row_columns=None):
     stat_value = 0
     matching_rows = []
     for row in all_rows:
@@ -26429,7 +26950,7 @@ def handle_week_rows(player_data, player_type, stat, date, all_rows):
 
     stats = set()
     find_sub_sub_stat_match(stat, player_type, stats)
-    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats)
+    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats, row_columns=row_columns)
     if stat not in combined_row:
         for header_stat in headers[player_type["da_type"]]:
             if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
@@ -26442,7 +26963,7 @@ def handle_week_rows(player_data, player_type, stat, date, all_rows):
 
     return stat_value, matching_rows
 
-def handle_month_rows(player_data, player_type, stat, date, all_rows):
+def handle_month_rows(player_data, player_type, stat, date, all_rows, row_columns=None):
     stat_value = 0
     matching_rows = []
     for row in all_rows:
@@ -26451,7 +26972,7 @@ def handle_month_rows(player_data, player_type, stat, date, all_rows):
 
     stats = set()
     find_sub_sub_stat_match(stat, player_type, stats)
-    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats)
+    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats, row_columns=row_columns)
     if stat not in combined_row:
         for header_stat in headers[player_type["da_type"]]:
             if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
@@ -26464,7 +26985,7 @@ def handle_month_rows(player_data, player_type, stat, date, all_rows):
 
     return stat_value, matching_rows
 
-def handle_year_rows(player_data, player_type, stat, date, all_rows):
+def handle_year_rows(player_data, player_type, stat, date, all_rows, row_columns=None):
     stat_value = 0
     matching_rows = []
     for row in all_rows:
@@ -26473,7 +26994,7 @@ def handle_year_rows(player_data, player_type, stat, date, all_rows):
             
     stats = set()
     find_sub_sub_stat_match(stat, player_type, stats)
-    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats)
+    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats, row_columns=row_columns)
     if stat not in combined_row:
         for header_stat in headers[player_type["da_type"]]:
             if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
@@ -26486,24 +27007,32 @@ def handle_year_rows(player_data, player_type, stat, date, all_rows):
 
     return stat_value, matching_rows
 
-def handle_game_rows(start_index, player_data, player_type, stat, num_games, all_rows, only_seasons):
+def handle_game_rows(start_index, player_data, player_type, stat, num_games, all_rows, only_seasons, row_columns=None):
     stat_value = 0
     matching_rows = []
-    prev_year = None
-    for i in range(start_index, start_index + num_games):
-        if i >= len(all_rows):
+    if row_columns:
+        end_index = start_index + num_games
+        if end_index > len(all_rows):
             return 0, []
-        
-        row = all_rows[i]
-        if only_seasons and prev_year != None and prev_year != row["Year"]:
+        if only_seasons and num_games and row_columns["season_start_index"][end_index - 1] > start_index:
             return 0, []
-        prev_year = row["Year"]
+        matching_rows = all_rows[start_index:end_index]
+    else:
+        prev_year = None
+        for i in range(start_index, start_index + num_games):
+            if i >= len(all_rows):
+                return 0, []
+            
+            row = all_rows[i]
+            if only_seasons and prev_year != None and prev_year != row["Year"]:
+                return 0, []
+            prev_year = row["Year"]
 
-        matching_rows.append(row)
+            matching_rows.append(row)
 
     stats = set()
     find_sub_sub_stat_match(stat, player_type, stats)
-    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats)
+    combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats, row_columns=row_columns)
     if stat not in combined_row:
         for header_stat in headers[player_type["da_type"]]:
             if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
@@ -26516,6 +27045,40 @@ def handle_game_rows(start_index, player_data, player_type, stat, num_games, all
 
     return stat_value, matching_rows
 
+def is_streak_row_match(row, player_data, player_type, over_stat_objs, all_rows, is_formula, stats):
+    if is_formula:
+        row_normal = fill_row(row, player_data, player_type, lower=False)
+    else:
+        row_lower = fill_row(row, player_data, player_type, stats=stats)
+    any_passed = False
+    for over_stat_obj in over_stat_objs:
+        all_passed = True
+        for stat_obj in over_stat_obj["stats"]:
+            stat = stat_obj["stat"]
+            if is_formula:
+                try:
+                    if not bool(calculate_formula("custom_formula", player_data, player_type, stat, row_normal, all_rows, safe_eval=True)):
+                        all_passed = False
+                        break
+                except Exception:
+                    all_passed = False
+            else:
+                if stat not in row_lower:
+                    for header_stat in headers[player_type["da_type"]]:
+                        if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
+                            stat = header_stat.lower()
+                if stat in row_lower:
+                    if row_lower[stat] < stat_obj["start_val"] or row_lower[stat] > stat_obj["end_val"]:
+                        all_passed = False
+                        break
+                else:
+                    all_passed = False
+                    break
+        if all_passed:
+            any_passed = True
+            break
+    return any_passed
+
 def handle_streak_game_rows(start_index, player_data, player_type, over_stat_objs, all_rows, only_seasons, is_formula):
     matching_rows = []
     prev_year = None
@@ -26527,45 +27090,32 @@ def handle_streak_game_rows(start_index, player_data, player_type, over_stat_obj
         if only_seasons and prev_year != None and prev_year != row["Year"]:
             break
         prev_year = row["Year"]
-        
-        if is_formula:
-            row_normal = fill_row(row, player_data, player_type, lower=False)
-        else:
-            row_lower = fill_row(row, player_data, player_type, stats=stats)
-        any_passed = False
-        for over_stat_obj in over_stat_objs:
-            all_passed = True
-            for stat_obj in over_stat_obj["stats"]:
-                stat = stat_obj["stat"]
-                if is_formula:
-                    try:
-                        if not bool(calculate_formula("custom_formula", player_data, player_type, stat, row_normal, all_rows, safe_eval=True)):
-                            all_passed = False
-                            break
-                    except Exception:
-                        all_passed = False
-                else:
-                    if stat not in row_lower:
-                        for header_stat in headers[player_type["da_type"]]:
-                            if "display-value" in headers[player_type["da_type"]][header_stat] and headers[player_type["da_type"]][header_stat]["display-value"].lower() == stat:
-                                stat = header_stat.lower()
-                    if stat in row_lower:
-                        if row_lower[stat] < stat_obj["start_val"] or row_lower[stat] > stat_obj["end_val"]:
-                            all_passed = False
-                            break
-                    else:
-                        all_passed = False
-                        break
-            if all_passed:
-                any_passed = True
-                break
-        if any_passed:
+
+        if is_streak_row_match(row, player_data, player_type, over_stat_objs, all_rows, is_formula, stats):
             matching_rows.append(row)
         else:
             break
     return matching_rows
 
-def handle_stretch_game_rows(start_index, player_data, player_type, over_stat_objs, all_rows, only_seasons):
+def get_streak_run_ends(player_data, player_type, over_stat_objs, all_rows, only_seasons, is_formula):
+    stats = set()
+    if not is_formula:
+        find_stat_match(over_stat_objs, player_type, stats, stat_name="stats")
+
+    run_ends = [0] * len(all_rows)
+    next_end = len(all_rows)
+    for i in range(len(all_rows) - 1, -1, -1):
+        row = all_rows[i]
+        if only_seasons and i + 1 < len(all_rows) and all_rows[i + 1]["Year"] != row["Year"]:
+            next_end = i + 1
+        if is_streak_row_match(row, player_data, player_type, over_stat_objs, all_rows, is_formula, stats):
+            run_ends[i] = next_end
+        else:
+            run_ends[i] = i
+            next_end = i
+    return run_ends
+
+def handle_stretch_game_rows(start_index, player_data, player_type, over_stat_objs, all_rows, only_seasons, row_columns=None):
     total_matching_rows = []
 
     matching_rows = []
@@ -26579,7 +27129,7 @@ def handle_stretch_game_rows(start_index, player_data, player_type, over_stat_ob
         prev_year = row["Year"]
         
         matching_rows.append(row)
-        combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats)
+        combined_row = comb_rows(matching_rows, player_data, player_type, stats=stats, row_columns=row_columns)
 
         any_passed = False
         for over_stat_obj in over_stat_objs:
@@ -26932,19 +27482,239 @@ def fill_row(row, player_data, player_type, lower=True, stats=None):
     else:
         return row
 
+bref_page_cache = collections.OrderedDict()
+bref_page_cache_info = {
+    "bytes" : 0,
+    "hits" : 0,
+    "misses" : 0,
+    "evictions" : 0
+}
+bref_page_cache_lock = threading.Lock()
+
+def get_bref_page_ttl(url):
+    year_match = bref_page_year_re.search(url)
+    if year_match:
+        year = int(year_match.group(1))
+        if year < current_season or (year == current_season and not season_in_progress):
+            return None
+        return bref_page_cache_current_ttl
+    return bref_page_cache_current_ttl if season_in_progress else bref_page_cache_default_ttl
+
+def get_bref_cached_page(url):
+    with bref_page_cache_lock:
+        entry = bref_page_cache.get(url)
+        if entry and entry["expires"] and entry["expires"] < time.time():
+            del bref_page_cache[url]
+            bref_page_cache_info["bytes"] -= len(entry["content"])
+            entry = None
+
+        if entry:
+            bref_page_cache.move_to_end(url)
+            bref_page_cache_info["hits"] += 1
+        else:
+            bref_page_cache_info["misses"] += 1
+        return entry
+
+def store_bref_cached_page(url, response, content):
+    if len(content) > bref_page_cache_max_bytes:
+        return
+
+    ttl = get_bref_page_ttl(url)
+    with bref_page_cache_lock:
+        if url in bref_page_cache:
+            bref_page_cache_info["bytes"] -= len(bref_page_cache.pop(url)["content"])
+
+        bref_page_cache[url] = {
+            "response" : response,
+            "content" : content,
+            "expires" : time.time() + ttl if ttl else None
+        }
+        bref_page_cache_info["bytes"] += len(content)
+
+        while bref_page_cache_info["bytes"] > bref_page_cache_max_bytes:
+            evicted = bref_page_cache.popitem(last=False)[1]
+            bref_page_cache_info["bytes"] -= len(evicted["content"])
+            bref_page_cache_info["evictions"] += 1
+
+def get_bref_page_cache_stats():
+    with bref_page_cache_lock:
+        stats = dict(bref_page_cache_info)
+        stats["entries"] = len(bref_page_cache)
+    return stats
+
+gateway_sessions = {}
+gateway_sessions_lock = threading.Lock()
+
+def get_gateway_session(host):
+    with gateway_sessions_lock:
+        gateway_session = gateway_sessions.get(host)
+        if not gateway_session or gateway_session.get_adapter(host) is not gateway:
+            # The session is shared by every comment thread, so it must not carry cookies from one request into another
+            gateway_session = requests.Session()
+            gateway_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            gateway_session.mount(host, gateway)
+            gateway_sessions[host] = gateway_session
+        return gateway_session
+
+def get_gateway_pool_stats():
+    stats = {
+        "pools" : 0,
+        "connections" : 0,
+        "requests" : 0,
+        "reuse_rate" : 0
+    }
+    pools = gateway.poolmanager.pools
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool:
+            stats["pools"] += 1
+            stats["connections"] += pool.num_connections
+            stats["requests"] += pool.num_requests
+    if stats["requests"]:
+        stats["reuse_rate"] = round(1 - stats["connections"] / stats["requests"], 3)
+    return stats
+
+rate_limiters = {}
+rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(host):
+    with rate_limiters_lock:
+        if host not in rate_limiters:
+            rate_limiters[host] = {
+                "condition" : threading.Condition(),
+                "rate" : float(rate_limit_max_rate),
+                "tokens" : float(rate_limit_max_rate),
+                "last_refill" : time.monotonic(),
+                "concurrency" : rate_limit_max_concurrency,
+                "in_flight" : 0,
+                "waiting" : 0,
+                "successes" : 0,
+                "requests" : 0,
+                "throttled" : 0,
+                "wait_time" : 0.0,
+                "max_waiting" : 0
+            }
+        return rate_limiters[host]
+
+def acquire_rate_limit(host):
+    rate_limiter = get_rate_limiter(host)
+    start_time = time.monotonic()
+    with rate_limiter["condition"]:
+        rate_limiter["waiting"] += 1
+        rate_limiter["max_waiting"] = max(rate_limiter["max_waiting"], rate_limiter["waiting"])
+        try:
+            while True:
+                now = time.monotonic()
+                rate_limiter["tokens"] = min(max(rate_limiter["rate"], 1.0), rate_limiter["tokens"] + (now - rate_limiter["last_refill"]) * rate_limiter["rate"])
+                rate_limiter["last_refill"] = now
+                if rate_limiter["in_flight"] < rate_limiter["concurrency"] and rate_limiter["tokens"] >= 1:
+                    break
+
+                if rate_limiter["in_flight"] >= rate_limiter["concurrency"]:
+                    rate_limiter["condition"].wait()
+                else:
+                    rate_limiter["condition"].wait((1 - rate_limiter["tokens"]) / rate_limiter["rate"])
+
+            rate_limiter["tokens"] -= 1
+            rate_limiter["in_flight"] += 1
+        finally:
+            rate_limiter["waiting"] -= 1
+        rate_limiter["requests"] += 1
+        rate_limiter["wait_time"] += time.monotonic() - start_time
+
+def release_rate_limit(host, status_code, response_host=None):
+    rate_limiter = get_rate_limiter(host)
+    with rate_limiter["condition"]:
+        rate_limiter["in_flight"] -= 1
+        # A 403 through the gateway only means its endpoint needs rebuilding, only a 403 from the origin itself is push back
+        if status_code == 429 or (status_code == 403 and response_host == host):
+            # Halve both the request rate and the concurrency as soon as the host pushes back
+            rate_limiter["rate"] = max(rate_limit_min_rate, rate_limiter["rate"] / 2)
+            rate_limiter["concurrency"] = max(1, rate_limiter["concurrency"] // 2)
+            rate_limiter["tokens"] = min(rate_limiter["tokens"], 0.0)
+            rate_limiter["successes"] = 0
+            rate_limiter["throttled"] += 1
+        elif status_code != None and status_code < 400:
+            rate_limiter["rate"] = min(float(rate_limit_max_rate), rate_limiter["rate"] + rate_limit_max_rate / 50)
+            rate_limiter["successes"] += 1
+            if rate_limiter["successes"] >= rate_limiter["concurrency"]:
+                rate_limiter["successes"] = 0
+                rate_limiter["concurrency"] = min(rate_limit_max_concurrency, rate_limiter["concurrency"] + 1)
+        rate_limiter["condition"].notify_all()
+
+def rate_limited_get(session, url, **kwargs):
+    host = urlparse(url).netloc
+    acquire_rate_limit(host)
+    status_code = None
+    response_host = None
+    try:
+        response = session.get(url, **kwargs)
+        status_code = response.status_code
+        response_host = urlparse(response.url).netloc
+        return response
+    finally:
+        release_rate_limit(host, status_code, response_host)
+
+def get_rate_limiter_stats():
+    with rate_limiters_lock:
+        hosts = list(rate_limiters.keys())
+
+    stats = {}
+    for host in hosts:
+        rate_limiter = rate_limiters[host]
+        with rate_limiter["condition"]:
+            stats[host] = {
+                "rate" : round(rate_limiter["rate"], 2),
+                "concurrency" : rate_limiter["concurrency"],
+                "in_flight" : rate_limiter["in_flight"],
+                "waiting" : rate_limiter["waiting"],
+                "max_waiting" : rate_limiter["max_waiting"],
+                "requests" : rate_limiter["requests"],
+                "throttled" : rate_limiter["throttled"],
+                "avg_wait" : round(rate_limiter["wait_time"] / rate_limiter["requests"], 3) if rate_limiter["requests"] else 0
+            }
+    return stats
+
+def uncomment_hidden_tables(text):
+    # Reference sites ship most secondary tables inside HTML comments, unwrap them once so a single parse exposes every table
+    parts = []
+    position = 0
+    while True:
+        comment_start = text.find(b"<!--", position)
+        if comment_start == -1:
+            break
+        comment_end = text.find(b"-->", comment_start + 4)
+        if comment_end == -1:
+            break
+        parts.append(text[position:comment_start])
+        comment = text[comment_start + 4:comment_end]
+        if b"<table" in comment:
+            parts.append(comment)
+        else:
+            parts.append(text[comment_start:comment_end + 3])
+        position = comment_end + 3
+    parts.append(text[position:])
+    return b"".join(parts)
+
 def url_request(url, timeout=30, retry_403=True):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.baseball-reference.com", gateway)
+    if use_bref_page_cache:
+        cached_page = get_bref_cached_page(url)
+        if cached_page:
+            return cached_page["response"], BeautifulSoup(cached_page["content"], "lxml")
+
+    gateway_session = get_gateway_session("https://www.baseball-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
-            text = response.content
+            text = uncomment_hidden_tables(response.content)
 
             bs = BeautifulSoup(text, "lxml")
             if not bs.contents:
                 raise requests.exceptions.HTTPError("Page is empty!")
+            if use_bref_page_cache:
+                store_bref_cached_page(url, response, text)
             return response, bs
         except requests.exceptions.HTTPError as e:
             if retry_403 and url.startswith("https://www.baseball-reference.com/") and not response.url.startswith("https://www.baseball-reference.com/"):
@@ -26954,18 +27724,21 @@ def url_request(url, timeout=30, retry_403=True):
                     replaced = url_parsed._replace(path="/ProxyStage" + url_parsed.path)
                     rebuilt_url = urllib.parse.urlunparse(replaced)
                     logger.info("#" + str(threading.get_ident()) + "#   " + "Rebuilt URL on 403 and retrying from " + response.url + " to " + rebuilt_url)
-                    return url_request(rebuilt_url, timeout=timeout, retry_403=False)
+                    rebuilt_response, bs = url_request(rebuilt_url, timeout=timeout, retry_403=False)
+                    if use_bref_page_cache:
+                        store_bref_cached_page(url, rebuilt_response, uncomment_hidden_tables(rebuilt_response.content))
+                    return rebuilt_response, bs
                 else:
                     failed_counter += 1
-                    if failed_counter > max_request_retries:
+                    if failed_counter > get_request_retries():
                         raise
             else:
                 failed_counter += 1
-                if failed_counter > max_request_retries:
+                if failed_counter > get_request_retries():
                     raise
         except Exception as e:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
         
         delay_step = 10
@@ -26977,12 +27750,13 @@ def url_request(url, timeout=30, retry_403=True):
         logger.info("#" + str(threading.get_ident()) + "#   " + "0")
 
 def url_request_lxml(session, url, timeout=2, retry_403=True):
+    timeout = get_request_timeout(timeout)
     failed_counter = 0
     while(True):
         try:
-            response = session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
-            bs = lxml.html.document_fromstring(response.content)
+            bs = lxml.html.document_fromstring(uncomment_hidden_tables(response.content))
             if not bs:
                 raise requests.exceptions.HTTPError("Page is empty!")
             return response, bs
@@ -26997,15 +27771,15 @@ def url_request_lxml(session, url, timeout=2, retry_403=True):
                     return url_request_lxml(session, rebuilt_url, timeout=timeout, retry_403=False)
                 else:
                     failed_counter += 1
-                    if failed_counter > max_request_retries:
+                    if failed_counter > get_request_retries():
                         raise
             else:
                 failed_counter += 1
-                if failed_counter > max_request_retries:
+                if failed_counter > get_request_retries():
                     raise
         except Exception:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
         
         delay_step = 10
@@ -27021,12 +27795,11 @@ def url_request_lxml(session, url, timeout=2, retry_403=True):
             timeout = 10
 
 def url_request_bytes(url, timeout=30):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.baseball-reference.com", gateway)
+    gateway_session = get_gateway_session("https://www.baseball-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             return response.content
         except requests.exceptions.HTTPError as e:
@@ -27040,15 +27813,15 @@ def url_request_bytes(url, timeout=30):
                     return url_request(rebuilt_url, timeout=timeout, retry_403=False)
                 else:
                     failed_counter += 1
-                    if failed_counter > max_request_retries:
+                    if failed_counter > get_request_retries():
                         raise
             else:
                 failed_counter += 1
-                if failed_counter > max_request_retries:
+                if failed_counter > get_request_retries():
                     raise
         except Exception as e:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
         
         delay_step = 10
@@ -27059,16 +27832,226 @@ def url_request_bytes(url, timeout=30):
             time.sleep(time_to_wait)
         logger.info("#" + str(threading.get_ident()) + "#   " + "0")
 
+def connect_game_feed_cache():
+    conn = sqlite3.connect(game_feed_cache_db, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS game_feeds (game_id INTEGER PRIMARY KEY, feed BLOB NOT NULL, timestamp INTEGER NOT NULL);")
+    conn.execute("CREATE TABLE IF NOT EXISTS game_participants (game_id INTEGER NOT NULL, side TEXT NOT NULL, player_id INTEGER NOT NULL, PRIMARY KEY (game_id, side, player_id));")
+    conn.execute("CREATE INDEX IF NOT EXISTS game_participants_player ON game_participants (player_id);")
+    return conn
+
+def get_cached_game_feed(game_id):
+    conn = connect_game_feed_cache()
+    try:
+        row = conn.execute("SELECT feed, EXISTS (SELECT 1 FROM game_participants WHERE game_id = ?) FROM game_feeds WHERE game_id = ?;", (game_id, game_id)).fetchone()
+        if row:
+            data = json.loads(zlib.decompress(row[0]))
+            if not row[1]:
+                # Feeds cached before the participant index existed are indexed the first time they are read
+                with conn:
+                    insert_game_participants(conn, game_id, get_game_participants(data))
+            return data
+    finally:
+        conn.close()
+    return None
+
+def store_cached_game_feed(game_id, data):
+    # Only finished games are stored, live and scheduled games can still change
+    if "message" in data or data["gameData"]["status"]["abstractGameState"] != "Final":
+        return
+
+    if "liveData" in data and data["liveData"]["plays"]["allPlays"]:
+        build_game_event_table(data)
+
+    feed = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+    conn = connect_game_feed_cache()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO game_feeds (game_id, feed, timestamp) VALUES (?, ?, ?);", (game_id, feed, int(time.time())))
+            insert_game_participants(conn, game_id, get_game_participants(data))
+    finally:
+        conn.close()
+
+def get_game_participants(data):
+    participants = {}
+    for team_str in ["home", "away"]:
+        participants[team_str] = set()
+        for sub_player in data["liveData"]["boxscore"]["teams"][team_str]["players"]:
+            sub_player = data["liveData"]["boxscore"]["teams"][team_str]["players"][sub_player]
+            if (sub_player["stats"]["batting"] and sub_player["stats"]["batting"]["gamesPlayed"]) or (sub_player["stats"]["pitching"] and sub_player["stats"]["pitching"]["gamesPitched"]):
+                participants[team_str].add(sub_player["person"]["id"])
+    return participants
+
+def insert_game_participants(conn, game_id, participants):
+    conn.execute("DELETE FROM game_participants WHERE game_id = ?;", (game_id, ))
+    conn.executemany("INSERT OR IGNORE INTO game_participants (game_id, side, player_id) VALUES (?, ?, ?);", [(game_id, team_str, player_id) for team_str in participants for player_id in participants[team_str]])
+
+def get_indexed_game_participants(game_ids):
+    participants = {}
+    game_ids = list(set(game_ids))
+    conn = connect_game_feed_cache()
+    try:
+        # Stay under the SQLite bound parameter limit
+        for i in range(0, len(game_ids), 500):
+            sub_game_ids = game_ids[i:i + 500]
+            for game_id, team_str, player_id in conn.execute("SELECT game_id, side, player_id FROM game_participants WHERE game_id IN (" + ",".join(["?"] * len(sub_game_ids)) + ");", sub_game_ids):
+                if game_id not in participants:
+                    participants[game_id] = {"home" : set(), "away" : set()}
+                participants[game_id][team_str].add(player_id)
+    finally:
+        conn.close()
+    return participants
+
+feed_fetch_executor = ThreadPoolExecutor(max_workers=feed_fetch_max_workers, thread_name_prefix="feed_fetch")
+# BRef season pages get their own small pool so waiting on the host never holds a shared fetcher worker
+bref_fetch_executor = ThreadPoolExecutor(max_workers=bref_fetch_max_workers, thread_name_prefix="bref_fetch")
+feed_fetch_semaphores = {host : threading.BoundedSemaphore(feed_fetch_host_limits[host]) for host in feed_fetch_host_limits}
+feed_fetch_session = requests.Session()
+feed_fetch_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=len(feed_fetch_host_limits), pool_maxsize=feed_fetch_max_workers))
+
+deferred_retry_state = threading.local()
+
+def get_request_retries():
+    # Work on the shared fetcher hands its retries to the retry scheduler instead of sleeping in place
+    if getattr(deferred_retry_state, "enabled", False):
+        return 0
+    return max_request_retries
+
+def get_request_timeout(timeout):
+    # Deferred attempts run one request each, so the last one is picked out by its attempt number
+    if getattr(deferred_retry_state, "enabled", False) and deferred_retry_state.failed_counter >= max_request_retries:
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Last retry, will use a timeout of 10 seconds")
+        return 10
+    return timeout
+
+retry_schedule = []
+retry_schedule_counter = itertools.count()
+retry_schedule_condition = threading.Condition()
+retry_schedule_thread = None
+
+def run_retry_schedule():
+    while True:
+        with retry_schedule_condition:
+            while not retry_schedule or retry_schedule[0][0] > time.monotonic():
+                retry_schedule_condition.wait(retry_schedule[0][0] - time.monotonic() if retry_schedule else None)
+            retry_call = heapq.heappop(retry_schedule)[2]
+        try:
+            retry_call()
+        except Exception:
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to run scheduled retry\n" + traceback.format_exc())
+
+def schedule_retry(delay, retry_call):
+    global retry_schedule_thread
+    with retry_schedule_condition:
+        if not retry_schedule_thread:
+            retry_schedule_thread = threading.Thread(target=run_retry_schedule, name="retry_schedule", daemon=True)
+            retry_schedule_thread.start()
+        heapq.heappush(retry_schedule, (time.monotonic() + delay, next(retry_schedule_counter), retry_call))
+        retry_schedule_condition.notify()
+
+def is_retryable_error(err):
+    # Only transport failures and throttled or failing responses are retried, parse errors are raised right away
+    if isinstance(err, requests.exceptions.HTTPError):
+        return err.response == None or err.response.status_code in (403, 429) or err.response.status_code >= 500
+    return isinstance(err, requests.exceptions.RequestException)
+
+def run_deferred_retry_call(func, args, failed_counter):
+    deferred_retry_state.enabled = True
+    deferred_retry_state.failed_counter = failed_counter
+    try:
+        return func(*args)
+    finally:
+        deferred_retry_state.enabled = False
+
+def submit_retrying(executor, func, *args):
+    outer_future = concurrent.futures.Future()
+    attempt_info = {
+        "failed_counter" : 0
+    }
+
+    def attempt_done(attempt_future):
+        if outer_future.cancelled():
+            return
+
+        err = attempt_future.exception()
+        try:
+            if not err:
+                outer_future.set_result(attempt_future.result())
+                return
+
+            attempt_info["failed_counter"] += 1
+            if attempt_info["failed_counter"] > max_request_retries or not is_retryable_error(err):
+                outer_future.set_exception(err)
+                return
+        except concurrent.futures.InvalidStateError:
+            # Cancelled by the caller after the check above
+            return
+
+        # The worker is released while waiting, the attempt is resubmitted once the delay passes
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Scheduling retry " + str(attempt_info["failed_counter"]) + " of " + func.__name__ + " in " + str(retry_failure_delay) + " seconds")
+        schedule_retry(retry_failure_delay, submit_attempt)
+
+    def submit_attempt():
+        if outer_future.cancelled():
+            return
+        try:
+            executor.submit(run_deferred_retry_call, func, args, attempt_info["failed_counter"]).add_done_callback(attempt_done)
+        except Exception as err:
+            try:
+                outer_future.set_exception(err)
+            except concurrent.futures.InvalidStateError:
+                pass
+
+    submit_attempt()
+    return outer_future
+
+def fetch_game_feed(game_id):
+    url = game_feed_url_format.format(game_id)
+    with feed_fetch_semaphores[urlparse(url).netloc]:
+        return url_request_json(feed_fetch_session, url)
+
+def submit_game_feed(game_id):
+    return submit_retrying(feed_fetch_executor, fetch_game_feed, game_id)
+
+def parse_season_tables(player_data, time_frame, years, player_type):
+    season_futures = [submit_retrying(bref_fetch_executor, parse_table, player_data, time_frame, year, player_type) for year in years]
+
+    all_rows = []
+    try:
+        for season_future in season_futures:
+            all_rows += season_future.result()
+    except Exception:
+        for season_future in season_futures:
+            season_future.cancel()
+        raise
+    return all_rows
+
 def url_request_json(session, url, timeout=2):
+    game_feed_match = game_feed_url_re.match(url) if use_game_feed_cache else None
+    if game_feed_match:
+        game_id = int(game_feed_match.group(1))
+        try:
+            data = get_cached_game_feed(game_id)
+            if data:
+                return data
+        except Exception:
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to read cached game feed for " + str(game_id) + "\n" + traceback.format_exc())
+
+    timeout = get_request_timeout(timeout)
     failed_counter = 0
     while(True):
         try:
-            response = session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
-            return json.loads(response.content)
+            data = json.loads(response.content)
+            if game_feed_match:
+                try:
+                    store_cached_game_feed(game_id, data)
+                except Exception:
+                    logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to cache game feed for " + str(game_id) + "\n" + traceback.format_exc())
+            return data
         except Exception:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
 
         logger.info("#" + str(threading.get_ident()) + "#   " + "Retrying to allow request to " + url + " to chill")
@@ -27167,14 +28150,6 @@ def get_player_position(player_page):
 
 def get_player_jaws_position(player_page):
     hof_div = player_page.find("div", {"id" : "div_hof_other"})
-    if not hof_div:
-        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_table = temp_soup.find("div", {"id" : "div_hof_other"})
-            if temp_table:
-                hof_div = temp_table
-                break
     if hof_div:
         hof_table = hof_div.find("table")
         if hof_table:
@@ -27214,19 +28189,9 @@ def get_valid_years(player_page, player_type, player_id):
 
     if player_id[len(player_id) - 1].isdigit():
         table_names = ["players_standard_batting", "players_standard_pitching", "players_standard_fielding", "players_batting_postseason", "players_pitching_postseason"]
-        comments = None
         for table_name in table_names:
             table = player_page.find("table", id=table_name)
 
-            if not table:
-                if not comments:
-                    comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id=table_name)
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 standard_table_rows = table.find_all("tr")
@@ -27365,16 +28330,6 @@ def determine_rookie_years(player_page, player_type, rookie_quals):
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
 
-        comments = None
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find_all("tr")
@@ -27458,22 +28413,12 @@ def get_player_current_team_number(player_id, player_page):
     numbers_map = []
     numbers_team_map = {}
     numbers_year_map = {}
-    comments = None
 
     table_names = ["players_value_batting", "players_value_pitching", "players_batting_postseason", "players_pitching_postseason"]
     valid_teams = {}
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
 
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find_all("tr")
@@ -27623,6 +28568,10 @@ def get_player_entity_id(player_page):
 def get_mlb_player_link(player_data, s):
     if player_data["id"] in manual_id_maps:
         return "/api/v1/people/" +  str(manual_id_maps[player_data["id"]])
+
+    crosswalk_entry = get_id_crosswalk_entry(bref_id=player_data["id"])
+    if crosswalk_entry:
+        return "/api/v1/people/" +  str(crosswalk_entry["mlb_id"])
         
     for sub_year in player_data["numbers_year_map"]:
         year_str = str(sub_year)
@@ -27949,7 +28898,80 @@ def get_mlb_player_link(player_data, s):
                         logger.info("#" + str(threading.get_ident()) + "#   " + "Found MLB Player " + player["person"]["fullName"] + " (" + str(player["person"]["id"]) + ") by name")
                         return player["person"]["link"]
 
+def connect_game_log_store():
+    conn = sqlite3.connect(game_log_store_db, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS game_logs (player_id TEXT NOT NULL, season INTEGER NOT NULL, log_type TEXT NOT NULL, rows BLOB NOT NULL, timestamp INTEGER NOT NULL, PRIMARY KEY (player_id, season, log_type));")
+    return conn
+
+def encode_game_log_value(value):
+    if isinstance(value, datetime.datetime):
+        return {"datetime" : value.isoformat()}
+    elif isinstance(value, datetime.date):
+        return {"date" : value.isoformat()}
+    raise TypeError("Unable to store " + type(value).__name__ + " in a game log")
+
+def decode_game_log_value(value):
+    if len(value) == 1:
+        if "datetime" in value:
+            return datetime.datetime.fromisoformat(value["datetime"])
+        elif "date" in value:
+            return datetime.date.fromisoformat(value["date"])
+    return value
+
+def get_stored_game_log(player_data, season, log_type):
+    conn = connect_game_log_store()
+    try:
+        row = conn.execute("SELECT rows, timestamp FROM game_logs WHERE player_id = ? AND season = ? AND log_type = ?;", (player_data["id"], season, log_type)).fetchone()
+    finally:
+        conn.close()
+
+    if not row:
+        return None
+
+    # Finished seasons are final, the current season and the postseason log (season 0) can still gain games
+    if not season or season >= current_season:
+        if time.time() - row[1] >= game_log_store_current_ttl:
+            return None
+
+    return json.loads(zlib.decompress(row[0]), object_hook=decode_game_log_value)
+
+def store_game_log(player_data, season, log_type, all_rows):
+    conn = connect_game_log_store()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO game_logs (player_id, season, log_type, rows, timestamp) VALUES (?, ?, ?, ?, ?);", (player_data["id"], season, log_type, zlib.compress(json.dumps(all_rows, separators=(",", ":"), default=encode_game_log_value).encode("utf-8")), int(time.time())))
+    finally:
+        conn.close()
+
+def is_game_log_row_included(row_data, time_frame):
+    if isinstance(time_frame["time_start"], int) or isinstance(time_frame["time_end"], int):
+        return row_data["Date"].year >= time_frame["time_start"] and row_data["Date"].year <= time_frame["time_end"]
+    else:
+        return row_data["Date"] >= time_frame["time_start"] and row_data["Date"] <= time_frame["time_end"]
+
 def parse_table(player_data, time_frame, year, player_type):
+    log_type = None
+    if use_game_log_store and (year or not time_frame):
+        log_type = ("p" if player_type["da_type"] != "Batter" else "b") + ("-playoffs" if not time_frame else "")
+        try:
+            stored_rows = get_stored_game_log(player_data, year if year else 0, log_type)
+        except Exception:
+            stored_rows = None
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to read stored game log for " + player_data["id"] + " and season " + str(year) + "\n" + traceback.format_exc())
+        if stored_rows != None:
+            if not time_frame:
+                return stored_rows
+            return [row_data for row_data in stored_rows if is_game_log_row_included(row_data, time_frame)]
+
+        # Parse the whole season so the stored log can serve any later date range
+        if time_frame:
+            requested_time_frame = time_frame
+            time_frame = {
+                "time_start" : datetime.date.min,
+                "time_end" : datetime.date.max
+            }
+
+
     table_names = None
     player_url = None
     
@@ -27985,7 +29007,6 @@ def parse_table(player_data, time_frame, year, player_type):
         else:
             raise
 
-    comments = None
 
     previous_headers = set()
 
@@ -27995,15 +29016,6 @@ def parse_table(player_data, time_frame, year, player_type):
     all_rows = []
     for table_index, table_name in enumerate(table_names):
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             if table_name == "pitching_basesituation":
@@ -28039,6 +29051,17 @@ def parse_table(player_data, time_frame, year, player_type):
                         all_rows.append(row_data)
 
             previous_headers.update(header_values)
+
+    if log_type:
+        # An empty log usually means the table was missing from the page, storing it would hide the season for good
+        if all_rows:
+            try:
+                store_game_log(player_data, year if year else 0, log_type, all_rows)
+            except Exception:
+                logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to store game log for " + player_data["id"] + " and season " + str(year) + "\n" + traceback.format_exc())
+        if time_frame:
+            return [row_data for row_data in all_rows if is_game_log_row_included(row_data, requested_time_frame)]
+
     return all_rows
 
 def handle_missing_game_data(all_rows, player_data, player_type, time_frame, valid_years):
@@ -28046,31 +29069,29 @@ def handle_missing_game_data(all_rows, player_data, player_type, time_frame, val
     if time_frame["time_start"] or time_frame["time_end"]:
         years_to_use = [valid_year for valid_year in valid_years if time_frame["time_start"] <= valid_year <= time_frame["time_end"]]
 
-    for year in years_to_use:
-        year_rows = parse_table(player_data, time_frame, year, player_type)
-        for year_row in year_rows:
-            for row_data in all_rows:
-                if row_data["Year"] == year_row["Year"] and row_data["Tm"] == year_row["Tm"] and not row_data["is_playoffs"]:
+    for year_row in parse_season_tables(player_data, time_frame, years_to_use, player_type):
+        for row_data in all_rows:
+            if row_data["Year"] == year_row["Year"] and row_data["Tm"] == year_row["Tm"] and not row_data["is_playoffs"]:
+                if year_row["Start"]:
+                    if "IPStart" not in row_data:
+                        row_data["IPStart"] = 0
+                    if "PitStart" not in row_data:
+                        row_data["PitStart"] = 0
+                    if "GmSc" not in row_data:
+                        row_data["GmSc"] = 0
+                    row_data["IPStart"] += year_row.get("IP", 0)
+                    row_data["PitStart"] += year_row.get("Pit", 0)
+                    row_data["GmSc"] += year_row.get("GmSc", 0)
+                    
+                if year_row.get("Pit", 0):
+                    if "GamesPit" not in row_data:
+                        row_data["GamesPit"] = 0
+                    row_data["GamesPit"] += 1
                     if year_row["Start"]:
-                        if "IPStart" not in row_data:
-                            row_data["IPStart"] = 0
-                        if "PitStart" not in row_data:
-                            row_data["PitStart"] = 0
-                        if "GmSc" not in row_data:
-                            row_data["GmSc"] = 0
-                        row_data["IPStart"] += year_row.get("IP", 0)
-                        row_data["PitStart"] += year_row.get("Pit", 0)
-                        row_data["GmSc"] += year_row.get("GmSc", 0)
-                        
-                    if year_row.get("Pit", 0):
-                        if "GamesPit" not in row_data:
-                            row_data["GamesPit"] = 0
-                        row_data["GamesPit"] += 1
-                        if year_row["Start"]:
-                            if "StartsPit" not in row_data:
-                                row_data["StartsPit"] = 0
-                            row_data["StartsPit"] += 1
-                    break
+                        if "StartsPit" not in row_data:
+                            row_data["StartsPit"] = 0
+                        row_data["StartsPit"] += 1
+                break
 
 def fix_prob_data(all_rows, player_data, player_type, all_teams_unique):
     season_ranges = {
@@ -28155,17 +29176,7 @@ def handle_prob_data_bat(all_season_ranges, player_data, all_rows, is_post):
         except requests.exceptions.HTTPError:
             raise
 
-        comments = None
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find("tbody").find_all("tr")
@@ -28223,17 +29234,7 @@ def handle_prob_data_pitch(all_season_ranges, player_data, all_rows, is_post):
 
         table_name = "span_stats"
 
-        comments = None
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find("tbody").find_all("tr")
@@ -28282,15 +29283,6 @@ def handle_season_prob_data(player_type, all_season_ranges, player_data, all_row
     table_name = "span_stats"
 
     table = player_page.find("table", id=table_name)
-    if not table:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_table = temp_soup.find("table", id=table_name)
-            if temp_table:
-                table = temp_table
-                break
 
     if table:
         standard_table_rows = table.find("tbody").find_all("tr")
@@ -29636,6 +30628,71 @@ def handle_stat_rank_stats(all_rows, qualifiers, player_type, s):
                     if year_map_obj != None:
                         qual_obj["year_map_obj"] = year_map_obj
 
+leaderboard_cache = collections.OrderedDict()
+leaderboard_cache_lock = threading.Lock()
+
+def store_leaderboard_cache_entry(url, stats):
+    with leaderboard_cache_lock:
+        leaderboard_cache[url] = (time.time(), stats)
+        leaderboard_cache.move_to_end(url)
+        while len(leaderboard_cache) > leaderboard_cache_max_entries:
+            leaderboard_cache.popitem(last=False)
+
+def connect_leaderboard_cache():
+    conn = sqlite3.connect(leaderboard_cache_db, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS leaderboards (url TEXT PRIMARY KEY, stats BLOB NOT NULL, timestamp INTEGER NOT NULL);")
+    return conn
+
+def get_season_leaderboard(s, season, player_pool, call_type, league, stat_name=None, sort_str=None):
+    if stat_name:
+        url_to_use = mlb_leaderboard_query.format(season, player_pool, "pitching" if call_type == "Batter" else "hitting", 1000000, 0, stat_name, sort_str)
+    else:
+        url_to_use = mlb_leaderboard_query_no_sort.format(season, player_pool, "pitching" if call_type == "Batter" else "hitting", 1000000, 0)
+    if league:
+        url_to_use += "&leagueIds=" + str(league)
+
+    if not use_leaderboard_cache:
+        return url_request_json(s, url_to_use)["stats"]
+
+    # Finished seasons never change and are kept on disk, the current season is refetched once stale
+    is_finished = season < current_season
+    with leaderboard_cache_lock:
+        if url_to_use in leaderboard_cache:
+            cache_time, stats = leaderboard_cache[url_to_use]
+            if is_finished or time.time() - cache_time < bref_page_cache_current_ttl:
+                leaderboard_cache.move_to_end(url_to_use)
+                return stats
+
+    if is_finished:
+        try:
+            conn = connect_leaderboard_cache()
+            try:
+                row = conn.execute("SELECT stats FROM leaderboards WHERE url = ?;", (url_to_use, )).fetchone()
+            finally:
+                conn.close()
+            if row:
+                stats = json.loads(zlib.decompress(row[0]))
+                store_leaderboard_cache_entry(url_to_use, stats)
+                return stats
+        except Exception:
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to read cached leaderboard for " + url_to_use + "\n" + traceback.format_exc())
+
+    stats = url_request_json(s, url_to_use)["stats"]
+
+    store_leaderboard_cache_entry(url_to_use, stats)
+    if is_finished and stats:
+        try:
+            conn = connect_leaderboard_cache()
+            try:
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO leaderboards (url, stats, timestamp) VALUES (?, ?, ?);", (url_to_use, zlib.compress(json.dumps(stats, separators=(",", ":")).encode("utf-8")), int(time.time())))
+            finally:
+                conn.close()
+        except Exception:
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to cache leaderboard for " + url_to_use + "\n" + traceback.format_exc())
+
+    return stats
+
 def handle_facing_stat_rank_qual(qual_obj, stat_mapping, call_type, seasons, league, s):
     year_map_obj = {}
     has_one_stat_match = False
@@ -29673,16 +30730,13 @@ def handle_facing_stat_rank_qual(qual_obj, stat_mapping, call_type, seasons, lea
             elif qual_obj["include_all_players"]:
                 qual_str = "ALL"
 
-            url_to_use = mlb_leaderboard_query.format(season_obj["Year"], qual_str, "pitching" if call_type == "Batter" else "hitting", limit, offset, stat_name, sort_str, league)
-            if league:
-                url_to_use += "&leagueIds=" + str(league)
-
-            data = url_request_json(s, url_to_use)
+            leaderboard = get_season_leaderboard(s, season_obj["Year"], qual_str, call_type, league, stat_name, sort_str)
+            leaderboard = leaderboard[int(offset):int(offset + limit)]
 
-            if data["stats"]:
+            if leaderboard:
                 if season_obj["Year"] not in year_map_obj:
                     year_map_obj[season_obj["Year"]] = set()                
-                for player in data["stats"]:
+                for player in leaderboard:
                     year_map_obj[season_obj["Year"]].add(player["playerId"])
 
     if has_one_stat_match:
@@ -29711,9 +30765,6 @@ def handle_facing_stat_percent_qual(qual_obj, stat_mapping, call_type, seasons,
             if "reverse" in qual_obj and qual_obj["reverse"]:
                 sort_str = "desc" if sort_str == "asc" else "asc"
 
-            offset = 0
-            limit = 1000000
-
             qual_str = "QUALIFIED"
             if qual_obj["only_rookies"]:
                 if qual_obj["include_all_players"]:
@@ -29723,17 +30774,13 @@ def handle_facing_stat_percent_qual(qual_obj, stat_mapping, call_type, seasons,
             elif qual_obj["include_all_players"]:
                 qual_str = "ALL"
                 
-            url_to_use = mlb_leaderboard_query.format(season_obj["Year"], qual_str, "pitching" if call_type == "Batter" else "hitting", limit, offset, stat_name, sort_str, league)
-            if league:
-                url_to_use += "&leagueIds=" + str(league)
-
-            data = url_request_json(s, url_to_use)
+            leaderboard = get_season_leaderboard(s, season_obj["Year"], qual_str, call_type, league, stat_name, sort_str)
 
-            if data["stats"]:
+            if leaderboard:
                 if season_obj["Year"] not in year_map_obj:
                     year_map_obj[season_obj["Year"]] = set()                
-                for index, player in enumerate(data["stats"]):
-                    rank = (index + 1) / len(data["stats"])
+                for index, player in enumerate(leaderboard):
+                    rank = (index + 1) / len(leaderboard)
 
                     if rank >= sub_qual_object["start_val"] and rank <= sub_qual_object["end_val"]:
                         year_map_obj[season_obj["Year"]].add(player["playerId"])
@@ -29756,14 +30803,10 @@ def handle_facing_stat_qual(qual_obj, stat_mapping, call_type, seasons, league,
         elif qual_obj["include_all_players"]:
             qual_str = "ALL"
 
-        url_to_use = mlb_leaderboard_query_no_sort.format(season_obj["Year"], qual_str, "pitching" if call_type == "Batter" else "hitting", 1000000, 0)
-        if league:
-            url_to_use += "&leagueIds=" + str(league)
+        leaderboard = get_season_leaderboard(s, season_obj["Year"], qual_str, call_type, league)
 
-        data = url_request_json(s, url_to_use)
-
-        if data["stats"]:
-            for player in data["stats"]:
+        if leaderboard:
+            for player in leaderboard:
                 has_match = False
                 for sub_qual_object in qual_obj["values"]:
                     raw_stat = sub_qual_object["stat"].upper()
@@ -29775,10 +30818,10 @@ def handle_facing_stat_qual(qual_obj, stat_mapping, call_type, seasons, league,
                     if season_obj["Year"] not in year_map_obj:
                         year_map_obj[season_obj["Year"]] = set()
 
-                    if player[stat_name] == "-.--":
-                        player[stat_name] = math.inf
+                    # Leaderboards are shared through the cache so the player entry is left untouched
+                    stat_value = math.inf if player[stat_name] == "-.--" else float(player[stat_name])
 
-                    has_match = float(player[stat_name]) >= sub_qual_object["start_val"] and float(player[stat_name]) <= sub_qual_object["end_val"]
+                    has_match = stat_value >= sub_qual_object["start_val"] and stat_value <= sub_qual_object["end_val"]
                     
                     if has_match:
                         break
@@ -29798,15 +30841,13 @@ def handle_facing_no_stat_qual(qual_str, qualifiers, call_type, seasons, s):
         for season_obj in seasons:
             qualifier_str = "QUALIFIED_ROOKIES" if qual_str == "Facing Qualified Rookie" else "ROOKIES"
 
-            url_to_use = mlb_leaderboard_query_no_sort.format(season_obj["Year"], qualifier_str, "pitching" if call_type == "Batter" else "hitting", 1000000, 0)
-
-            data = url_request_json(s, url_to_use)
+            leaderboard = get_season_leaderboard(s, season_obj["Year"], qualifier_str, call_type, None)
 
-            if data["stats"]:
+            if leaderboard:
                 if season_obj["Year"] not in year_map_obj:
                     year_map_obj[season_obj["Year"]] = set()
 
-                for player in data["stats"]:
+                for player in leaderboard:
                     year_map_obj[season_obj["Year"]].add(player["playerId"])
 
         qual_obj["year_map_obj"] = year_map_obj
@@ -37718,7 +38759,59 @@ def handle_da_mlb_quals(row, event_name, at_bat_event, qualifiers, player_data,
 
     return True
 
+def connect_id_crosswalk():
+    conn = sqlite3.connect(id_crosswalk_db, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS id_crosswalk (mlb_id INTEGER PRIMARY KEY, bref_id TEXT, position TEXT, timestamp INTEGER NOT NULL);")
+    conn.execute("CREATE INDEX IF NOT EXISTS id_crosswalk_bref_id ON id_crosswalk (bref_id);")
+    return conn
+
+def get_id_crosswalk_entry(mlb_id=None, bref_id=None):
+    if not use_id_crosswalk:
+        return None
+
+    try:
+        conn = connect_id_crosswalk()
+        try:
+            if mlb_id != None:
+                row = conn.execute("SELECT mlb_id, bref_id, position FROM id_crosswalk WHERE mlb_id = ?;", (int(mlb_id), )).fetchone()
+            else:
+                row = conn.execute("SELECT mlb_id, bref_id, position FROM id_crosswalk WHERE bref_id = ?;", (bref_id, )).fetchone()
+        finally:
+            conn.close()
+    except Exception:
+        logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to read id crosswalk for MLB ID : " + str(mlb_id) + " and BRef ID : " + str(bref_id) + "\n" + traceback.format_exc())
+        return None
+
+    if row:
+        return {
+            "mlb_id" : row[0],
+            "bref_id" : row[1],
+            "position" : row[2]
+        }
+    return None
+
+def store_id_crosswalk_entry(mlb_id, bref_id=None, position=None):
+    if not use_id_crosswalk:
+        return
+
+    try:
+        conn = connect_id_crosswalk()
+        try:
+            with conn:
+                conn.execute("INSERT INTO id_crosswalk (mlb_id, bref_id, position, timestamp) VALUES (?, ?, ?, ?) ON CONFLICT(mlb_id) DO UPDATE SET bref_id = COALESCE(excluded.bref_id, bref_id), position = COALESCE(excluded.position, position), timestamp = excluded.timestamp;", (int(mlb_id), bref_id, position, int(time.time())))
+        finally:
+            conn.close()
+    except Exception:
+        logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to store id crosswalk for MLB ID : " + str(mlb_id) + " and BRef ID : " + str(bref_id) + "\n" + traceback.format_exc())
+
+def is_pitcher_position(main_pos):
+    return "pitcher" in main_pos or "starting" in main_pos or "relief" in main_pos
+
 def get_is_bref_pitcher(mlb_id, mlb_name):
+    crosswalk_entry = get_id_crosswalk_entry(mlb_id=mlb_id)
+    if crosswalk_entry and crosswalk_entry["position"] != None:
+        return is_pitcher_position(crosswalk_entry["position"])
+
     bref_id = get_bref_id(mlb_id, mlb_name)
     if not bref_id:
         logger.warn("#" + str(threading.get_ident()) + "#   " + "Unable to get BRef player link for MLB ID : " + str(mlb_id) + " (" + mlb_name + "). Will not consider this a pitcher")
@@ -37738,12 +38831,15 @@ def get_is_bref_pitcher(mlb_id, mlb_name):
     if not player_info:
         player_info = player_page.find("div", {"id" : "meta"}).find("strong", text="Positions:")
         if not player_info:
+            store_id_crosswalk_entry(mlb_id, bref_id, "")
             return False
         main_pos = player_info.parent.text.replace("Positions:", "").strip().lower()
     else:
         main_pos = player_info.parent.text.replace("Position:", "").strip().lower()
 
-    is_pitcher = "pitcher" in main_pos or "starting" in main_pos or "relief" in main_pos
+    store_id_crosswalk_entry(mlb_id, bref_id, main_pos)
+
+    is_pitcher = is_pitcher_position(main_pos)
     if is_pitcher:
         logger.info("#" + str(threading.get_ident()) + "#   " + "Determined MLB ID : " + str(mlb_id) + " (" + mlb_name + ") to be a pitcher")
     else:
@@ -37755,6 +38851,16 @@ def get_bref_id(mlb_id, mlb_name):
     if mlb_id in manual_bref_id_maps:
         return manual_bref_id_maps[mlb_id]
 
+    crosswalk_entry = get_id_crosswalk_entry(mlb_id=mlb_id)
+    if crosswalk_entry and crosswalk_entry["bref_id"]:
+        return crosswalk_entry["bref_id"]
+
+    bref_id = find_bref_id(mlb_id, mlb_name)
+    if bref_id:
+        store_id_crosswalk_entry(mlb_id, bref_id)
+    return bref_id
+
+def find_bref_id(mlb_id, mlb_name):
     with requests.Session() as s:
         data = url_request_json(s, mlb_player_stats_url_format.format(mlb_id))["people"][0]
 
@@ -37792,14 +38898,6 @@ def get_bref_id(mlb_id, mlb_name):
                     raise
 
             table = player_page.find("table", id="appearances")
-            if not table:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id="appearances")
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 matching_players = []
@@ -37850,14 +38948,6 @@ def get_bref_id(mlb_id, mlb_name):
                     raise
 
             table = player_page.find("table", id="appearances")
-            if not table:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id="appearances")
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 matching_players = []
@@ -39302,12 +40392,62 @@ def get_mlb_game_stats(all_rows, has_count_stat, qualifiers, games_to_skip, play
     if not count_info["total_count"]:
         return new_rows, count_info["missing_games"], count_info["missing_pitch"]
 
+    feed_rows = []
+    pending_feeds = {}
     with ThreadPoolExecutor(max_workers=5) as sub_executor:
         for index, row_data in enumerate(sorted(all_rows, key=lambda row: row["DateTime"])):
             if row_data["GameID"] not in games_to_skip:
-                future = sub_executor.submit(get_live_game_data, index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, s)
-                future.add_done_callback(functools.partial(result_call_back, qualifiers, count_info, new_rows, player_type, player_data, needs_plays, row_data, extra_stats))
-    
+                if "MLBGameLink" in row_data:
+                    feed_rows.append((index, row_data))
+                else:
+                    future = sub_executor.submit(get_live_game_data, index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, s)
+                    future.add_done_callback(functools.partial(result_call_back, qualifiers, count_info, new_rows, player_type, player_data, needs_plays, row_data, extra_stats))
+
+        # Feeds download on the shared fetcher and are parsed here in the order they arrive. Only a window of them is downloading or waiting to be parsed at once,
+        # a slot frees up once its feed is parsed so a long career is neither buffered in memory nor queued ahead of other comments on the fetcher
+        feed_slots = threading.Semaphore(game_feed_window)
+        next_feed = 0
+        process_futures = []
+        game_futures = []
+        while (next_feed < len(feed_rows) or pending_feeds) and not count_info["exception"]:
+            while next_feed < len(feed_rows) and feed_slots.acquire(blocking=False):
+                index, row_data = feed_rows[next_feed]
+                next_feed += 1
+                pending_feeds[submit_game_feed(row_data["MLBGameLink"])] = (index, row_data)
+
+            if not pending_feeds:
+                feed_slots.acquire()
+                feed_slots.release()
+                continue
+
+            done_feeds = concurrent.futures.wait(pending_feeds, return_when=concurrent.futures.FIRST_COMPLETED)[0]
+            for feed_future in done_feeds:
+                index, row_data = pending_feeds.pop(feed_future)
+                if use_processes_for_game and not feed_future.exception():
+                    future = get_game_process_executor().submit(evaluate_game_qualifiers, slice_game_feed(feed_future.result()), index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, extra_stats)
+                    future.add_done_callback(functools.partial(process_result_call_back, count_info, new_rows, player_data, needs_plays, row_data))
+                    process_futures.append(future)
+                else:
+                    if feed_future.exception():
+                        future = sub_executor.submit(get_live_game_data, index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, s, feed_future)
+                    else:
+                        # BRef lookups made while evaluating the game hand their retries to the retry scheduler too, the whole game is evaluated again once the delay passes
+                        future = submit_retrying(sub_executor, get_live_game_data, index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, s, feed_future)
+                        game_futures.append(future)
+                    future.add_done_callback(functools.partial(result_call_back, qualifiers, count_info, new_rows, player_type, player_data, needs_plays, row_data, extra_stats))
+                future.add_done_callback(lambda future: feed_slots.release())
+            done_feeds = feed_future = None
+
+        if count_info["exception"]:
+            for future in process_futures:
+                future.cancel()
+        concurrent.futures.wait(process_futures)
+        # A game waiting on a retry holds no worker, so the pool is only shut down once every game has finished
+        concurrent.futures.wait(game_futures)
+    
+    for feed_future in pending_feeds:
+        feed_future.cancel()
+
     if count_info["exception"]:
         raise count_info["exception"]
 
@@ -40510,6 +41650,94 @@ def result_call_back(qualifiers, count_info, new_rows, player_type, player_data,
     #     ps.sort_stats(pstats.SortKey.TIME)
     #     ps.print_stats()
 
+game_process_executor = None
+game_process_gateway = None
+game_process_executor_lock = threading.Lock()
+
+def init_game_process_worker(gateway_site, gateway_endpoints):
+    # Spawned workers never run main(), rebuild the parent's gateway from its endpoints for the BRef lookups some qualifiers make
+    global gateway
+    gateway = ApiGateway(gateway_site, verbose=False)
+    gateway.endpoints = gateway_endpoints
+    gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
+
+def get_game_process_executor():
+    global game_process_executor
+    global game_process_gateway
+    with game_process_executor_lock:
+        if game_process_executor and game_process_gateway is not gateway:
+            # The gateway was rebuilt since the workers started, they would still use the old endpoints
+            game_process_executor.shutdown(wait=False)
+            game_process_executor = None
+        if not game_process_executor:
+            # Forking would copy the held locks of the fetcher and retry threads into the workers
+            game_process_executor = concurrent.futures.ProcessPoolExecutor(max_workers=game_process_max_workers, mp_context=multiprocessing.get_context("spawn"), initializer=init_game_process_worker, initargs=(gateway.site, gateway.endpoints))
+            game_process_gateway = gateway
+        return game_process_executor
+
+def slice_game_feed(sub_data):
+    if "message" in sub_data:
+        return sub_data
+
+    sliced_data = {
+        "gameData" : {
+            "players" : sub_data["gameData"]["players"],
+            "status" : sub_data["gameData"]["status"]
+        },
+        "liveData" : {
+            "boxscore" : {
+                "teams" : sub_data["liveData"]["boxscore"]["teams"]
+            },
+            "plays" : {
+                "allPlays" : sub_data["liveData"]["plays"]["allPlays"]
+            }
+        }
+    }
+    if "event_table" in sub_data:
+        sliced_data["event_table"] = sub_data["event_table"]
+    return sliced_data
+
+def evaluate_game_qualifiers(sub_data, index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, extra_stats):
+    # Runs in a worker process so the per pitch qualifier checks of many games are not serialized by the GIL
+    feed_future = concurrent.futures.Future()
+    feed_future.set_result(sub_data)
+    game_data, row_data, index, sub_missing_games, sub_missing_pitch = get_live_game_data(index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, None, feed_future)
+
+    count_info = {
+        "missing_games" : [],
+        "missing_pitch" : []
+    }
+    has_match = handle_result_qualifiers(game_data, index, row_data, sub_missing_games, sub_missing_pitch, player_type, player_data, qualifiers, None, None, count_info, extra_stats)[0]
+    return has_match, row_data, count_info["missing_games"], count_info["missing_pitch"]
+
+def process_result_call_back(count_info, new_rows, player_data, needs_plays, old_row_data, result):
+    try:
+        if result.exception():
+            logger.info("Error parsing date " + str(old_row_data["Date"]) + " for player " + str(player_data["id"]))
+            if not count_info["exception"]:
+                count_info["exception"] = result.exception()
+        else:
+            has_match, row_data, missing_games, missing_pitch = result.result()
+            count_info["missing_games"].extend(missing_games)
+            count_info["missing_pitch"].extend(missing_pitch)
+
+            # Keep the original row object so callers holding it see the same updates as the threaded path
+            old_row_data.clear()
+            old_row_data.update(row_data)
+            if has_match:
+                new_rows.append(old_row_data)
+
+        percent_complete = 100 * (count_info["count"] / count_info["total_count"])
+        if count_info["total_count"] >= 10 and percent_complete >= count_info["current_percent"]:
+            if needs_plays:
+                logger.info("#" + str(threading.get_ident()) + "#   " + player_data["id"] + " game data " + str(count_info["current_percent"]) + "% complete")
+            count_info["current_percent"] += 10
+        count_info["count"] += 1
+    except Exception as err:
+        logger.info("Error parsing date " + str(old_row_data["Date"]) + " for player " + str(player_data["id"]))
+        if not count_info["exception"]:
+            count_info["exception"] = err
+
 def handle_result_qualifiers(game_data, index, row_data, sub_missing_games, sub_missing_pitch, player_type, player_data, qualifiers, saved_row_data, last_values, count_info, extra_stats):
     set_row_data(game_data, row_data, player_type)
 
@@ -40974,7 +42202,104 @@ def add_missing_schedule_games(team_id, sub_year, da_dates, s):
                 if not existing_match:
                     da_dates.insert(missing_mlb_schedule_games[sub_year][team_id][missing_game_id]["index"], game)
     
-def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, s):
+def build_game_event_table(sub_data):
+    # Feeds cached before the player columns were added are rebuilt, the runner and ejection fix ups are safe to repeat
+    if "event_table" in sub_data and "batter_id" in sub_data["event_table"]:
+        return sub_data["event_table"]
+
+    event_table = {
+        "play_index" : [],
+        "inning" : [],
+        "is_top_inning" : [],
+        "event_type" : [],
+        "batter_id" : [],
+        "pitcher_id" : [],
+        "balls" : [],
+        "strikes" : [],
+        "outs" : [],
+        "pitch_count" : [],
+        "runner_ids" : [],
+        "has_play_id" : False,
+        "has_count_data" : False,
+        "has_pitch_type_data" : False,
+        "all_has_pitch_type_data" : True
+    }
+
+    for index, scoring_play in enumerate(sub_data["liveData"]["plays"]["allPlays"]):
+        for inherited_play in scoring_play["playEvents"]:
+            if "playId" in inherited_play:
+                event_table["has_play_id"] = True
+                break
+
+        if scoring_play["result"]["type"] != "atBat" or "eventType" not in scoring_play["result"]:
+            continue
+
+        runners_in_order = []
+        own_runners = []
+        for runner in scoring_play["runners"]:
+            if runner["details"]["runner"]["id"] == scoring_play["matchup"]["batter"]["id"]:
+                own_runners.append(runner)
+            else:
+                runners_in_order.append(runner)
+        runners_in_order += own_runners
+        scoring_play["runners"] = runners_in_order
+    
+        if scoring_play["result"]["eventType"] == "ejection":
+            if scoring_play["count"]["strikes"] == 3:
+                scoring_play["result"]["eventType"] = "strikeout"
+                scoring_play["playEvents"].pop()
+
+        pitch_count = 0
+        for play in scoring_play["playEvents"]:
+            if play["isPitch"]:
+                pitch_count += 1
+                code = play["details"]["call"]["code"][-1:].upper()
+                if code not in ["S", "B", "E", "X", "D", "K", "I", "H"]:
+                    event_table["has_count_data"] = True
+
+                if code not in ["V"]:
+                    if "type" in play["details"] and play["details"]["type"] and play["details"]["type"]["description"]:
+                        event_table["has_pitch_type_data"] = True
+                    else:
+                        event_table["all_has_pitch_type_data"] = False
+
+        event_type = scoring_play["result"]["eventType"]
+        if event_type in ["field_out", "double_play", "triple_play", "fielders_choice", "fielders_choice_out", "force_out", "cs_double_play"]:
+            event_type = "out"
+        elif event_type in ["field_error"]:
+            event_type = "error"
+        elif event_type in ["strike_out", "strikeout_double_play", "strikeout_triple_play"]:
+            event_type = "strikeout"
+        elif event_type in ["sac_fly_double_play"]:
+            event_type = "sac_fly"
+        elif event_type in ["sac_bunt_double_play"]:
+            event_type = "sac_bunt"
+
+        if event_type.startswith("stolen_base") or event_type.startswith("passed_ball"):
+            event_type = "no_stats_sb"
+        else:
+            if event_type not in event_type_stat_mappings or event_type in ["caught_stealing", "run_scored", "pick_off"]:
+                event_type = "no_stats"
+
+        if event_type == "home_run" and "description" in scoring_play["result"] and scoring_play["result"]["description"] and "inside-the-park" in scoring_play["result"]["description"]:
+            event_type = "inside_the_park_home_run"
+
+        event_table["play_index"].append(index)
+        event_table["inning"].append(scoring_play["about"]["inning"])
+        event_table["is_top_inning"].append(scoring_play["about"]["isTopInning"])
+        event_table["event_type"].append(event_type)
+        event_table["batter_id"].append(scoring_play["matchup"]["batter"]["id"])
+        event_table["pitcher_id"].append(scoring_play["matchup"]["pitcher"]["id"])
+        event_table["balls"].append(scoring_play["count"]["balls"])
+        event_table["strikes"].append(scoring_play["count"]["strikes"])
+        event_table["outs"].append(scoring_play["count"]["outs"])
+        event_table["pitch_count"].append(pitch_count)
+        event_table["runner_ids"].append(tuple(runner["details"]["runner"]["id"] for runner in scoring_play["runners"]))
+
+    sub_data["event_table"] = event_table
+    return event_table
+
+def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_type, qualifiers, needs_plays, s, feed_future=None):
     missing_games = False
     missing_pitch = False
     game_data = {
@@ -41015,7 +42340,10 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
     
     #print("https://statsapi.mlb.com/api/v1.1/game/" + str(row_data["MLBGameLink"]) + "/feed/live")
     try:
-        sub_data = url_request_json(s, "https://statsapi.mlb.com/api/v1.1/game/" + str(row_data["MLBGameLink"]) + "/feed/live")
+        if feed_future:
+            sub_data = feed_future.result()
+        else:
+            sub_data = url_request_json(s, game_feed_url_format.format(row_data["MLBGameLink"]))
     except requests.exceptions.HTTPError as err:
         if err.response.status_code == 404:
             missing_games = True
@@ -41235,53 +42563,15 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
         team_driven_in = 0
         opp_driven_in = 0
 
-        has_play_id = False
-        for scoring_play in sub_data["liveData"]["plays"]["allPlays"]:
-            for inherited_play in scoring_play["playEvents"]:
-                if "playId" in inherited_play:
-                    has_play_id = True
-                    break
+        event_table = build_game_event_table(sub_data)
+        # Kept out of the table itself, the table is stored as JSON with the cached feed and int keys would not survive
+        play_rows = {play_index : row for row, play_index in enumerate(event_table["play_index"])}
+        has_play_id = event_table["has_play_id"]
+        has_count_data = event_table["has_count_data"]
+        has_pitch_type_data = event_table["has_pitch_type_data"]
+        all_has_pitch_type_data = event_table["all_has_pitch_type_data"]
 
         is_final = sub_data["gameData"]["status"]["abstractGameState"] == "Final"
-
-        for index, scoring_play in enumerate(sub_data["liveData"]["plays"]["allPlays"]):
-            if scoring_play["result"]["type"] != "atBat" or "eventType" not in scoring_play["result"]:
-                continue
-
-            runners_in_order = []
-            own_runners = []
-            for runner in scoring_play["runners"]:
-                if runner["details"]["runner"]["id"] == scoring_play["matchup"]["batter"]["id"]:
-                    own_runners.append(runner)
-                else:
-                    runners_in_order.append(runner)
-            runners_in_order += own_runners
-            scoring_play["runners"] = runners_in_order
-        
-            if scoring_play["result"]["eventType"] == "ejection":
-                if scoring_play["count"]["strikes"] == 3:
-                    scoring_play["result"]["eventType"] = "strikeout"
-                    scoring_play["playEvents"].pop()
-        
-        has_count_data = False
-        has_pitch_type_data = False
-        all_has_pitch_type_data = True
-
-        for index, scoring_play in enumerate(sub_data["liveData"]["plays"]["allPlays"]):
-            if scoring_play["result"]["type"] != "atBat" or "eventType" not in scoring_play["result"]:
-                continue
-            
-            for play in scoring_play["playEvents"]:
-                if play["isPitch"]:
-                    code = play["details"]["call"]["code"][-1:].upper()
-                    if code not in ["S", "B", "E", "X", "D", "K", "I", "H"]:
-                        has_count_data = True
-
-                    if code not in ["V"]:
-                        if "type" in play["details"] and play["details"]["type"] and play["details"]["type"]["description"]:
-                            has_pitch_type_data = True
-                        else:
-                            all_has_pitch_type_data = False
         
         if not has_count_data:
             missing_pitch = True
@@ -41331,6 +42621,7 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
                                     play["postPlay"] = play["player"]["id"]
                                     play["player"]["id"] = old_player
                                     scoring_play["matchup"]["pitcher"]["id"] = old_player
+                                    event_table["pitcher_id"][play_rows[index]] = old_player
 
                                     pitch_pos = game_data["pitch_sides"][old_player]
                                     if pitch_pos == "S":
@@ -41390,6 +42681,7 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
                                             play["postPlay"] = play["player"]["id"]
                                             play["player"]["id"] = old_player
                                             scoring_play["matchup"]["batter"]["id"] = old_player
+                                            event_table["batter_id"][play_rows[index]] = old_player
                                             
                                             bat_pos = game_data["bat_sides"][old_player]
                                             if bat_pos == "S":
@@ -41481,40 +42773,14 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
         opp_team_pitch_count = 0
         max_innings = 0
         scheduled_max_innings = 7 if (row_data["DateTime"].hour == 1 or row_data["DateTime"].hour == 2) and row_data["Year"] >= 2020 else 9
-        for index, scoring_play in enumerate(sub_data["liveData"]["plays"]["allPlays"]):
-            if scoring_play["result"]["type"] != "atBat" or "eventType" not in scoring_play["result"]:
-                continue
-
-            if scoring_play["about"]["inning"] > max_innings:
-                max_innings = scoring_play["about"]["inning"]
-
-            event_type = scoring_play["result"]["eventType"]
-            if event_type in ["field_out", "double_play", "triple_play", "fielders_choice", "fielders_choice_out", "force_out", "cs_double_play"]:
-                event_type = "out"
-            elif event_type in ["field_error"]:
-                event_type = "error"
-            elif event_type in ["strike_out", "strikeout_double_play", "strikeout_triple_play"]:
-                event_type = "strikeout"
-            elif event_type in ["sac_fly_double_play"]:
-                event_type = "sac_fly"
-            elif event_type in ["sac_bunt_double_play"]:
-                event_type = "sac_bunt"
-
-            if event_type.startswith("stolen_base") or event_type.startswith("passed_ball"):
-                event_type = "no_stats_sb"
-            else:
-                if event_type not in event_type_stat_mappings or event_type in ["caught_stealing", "run_scored", "pick_off"]:
-                    event_type = "no_stats"
-
-            if event_type == "home_run" and "description" in scoring_play["result"] and scoring_play["result"]["description"] and "inside-the-park" in scoring_play["result"]["description"]:
-                event_type = "inside_the_park_home_run"
+        for index, inning, is_top_inning, event_type in zip(event_table["play_index"], event_table["inning"], event_table["is_top_inning"], event_table["event_type"]):
+            if inning > max_innings:
+                max_innings = inning
 
             if first_play == -1:
                 if event_type not in ["no_stats", "no_stats_sb"]:
                     first_play = index
 
-            is_top_inning = scoring_play["about"]["isTopInning"]
-
             if first_play_team == -1:
                 if is_home_team:
                     is_team_batting = False if is_top_inning else True
@@ -41529,6 +42795,7 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
                         if not is_team_batting:
                             first_play_team = index
 
+        player_event_rows = None
         all_times = set()
         for index, scoring_play in enumerate(sub_data["liveData"]["plays"]["allPlays"]):
             starting_tm_position_map = team_position_map.copy()
@@ -41743,55 +43010,25 @@ def get_live_game_data(row_index, has_count_stat, player_data, row_data, player_
             previous_player_event_type = None
             upcoming_player_event_type = None
             if "Previous Event Type" in qualifiers or "Upcoming Exact Event Type" in qualifiers or "Upcoming Player Event Type" in qualifiers or "Previous Exact Event Type" in qualifiers or "Previous Player Event Type" in qualifiers or "Previous Exact Player Event Type" in qualifiers or "Upcoming Event Type" in qualifiers or "Upcoming Exact Event Type" in qualifiers:
-                for sub_index, sub_scoring_play in enumerate(sub_data["liveData"]["plays"]["allPlays"]):
-                    if sub_scoring_play["result"]["type"] != "atBat" or "eventType" not in sub_scoring_play["result"]:
-                        continue
-
-                    sub_inning = sub_scoring_play["about"]["inning"]
-                    sub_is_top_inning = sub_scoring_play["about"]["isTopInning"]
-
-                    event_type = sub_scoring_play["result"]["eventType"]
-                    if event_type in ["field_out", "double_play", "triple_play", "fielders_choice", "fielders_choice_out", "force_out", "cs_double_play"]:
-                        event_type = "out"
-                    elif event_type in ["field_error"]:
-                        event_type = "error"
-                    elif event_type in ["strike_out", "strikeout_double_play", "strikeout_triple_play"]:
-                        event_type = "strikeout"
-                    elif event_type in ["sac_fly_double_play"]:
-                        event_type = "sac_fly"
-                    elif event_type in ["sac_bunt_double_play"]:
-                        event_type = "sac_bunt"
-
-                    if event_type.startswith("stolen_base") or event_type.startswith("passed_ball"):
-                        event_type = "no_stats_sb"
-                    else:
-                        if event_type not in event_type_stat_mappings or event_type in ["caught_stealing", "run_scored", "pick_off"]:
-                            event_type = "no_stats"
-
-                    if event_type == "home_run" and "description" in sub_scoring_play["result"] and sub_scoring_play["result"]["description"] and "inside-the-park" in sub_scoring_play["result"]["description"]:
-                        event_type = "inside_the_park_home_run"
-
+                for sub_index, sub_inning, sub_is_top_inning, event_type in zip(event_table["play_index"], event_table["inning"], event_table["is_top_inning"], event_table["event_type"]):
                     if sub_inning == inning and sub_is_top_inning == is_top_inning:
                         if sub_index < index:
                             previous_event_type = event_type
                         elif sub_index > index:
                             if not upcoming_event_type:
                                 upcoming_event_type = event_type
-                    
-                    if player_type["da_type"] == "Batter":
-                        if sub_scoring_play["matchup"]["batter"]["id"] == player_data["mlb_id"]:
-                            if sub_index < index:
-                                previous_player_event_type = event_type
-                            elif sub_index > index:
-                                if not upcoming_player_event_type:
-                                    upcoming_player_event_type = event_type
-                    else:
-                        if sub_scoring_play["matchup"]["pitcher"]["id"] == player_data["mlb_id"]:
-                            if sub_index < index:
-                                previous_player_event_type = event_type
-                            elif sub_index > index:
-                                if not upcoming_player_event_type:
-                                    upcoming_player_event_type = event_type
+
+                if player_event_rows is None:
+                    player_id_column = event_table["batter_id"] if player_type["da_type"] == "Batter" else event_table["pitcher_id"]
+                    player_event_rows = [row for row, player_id in enumerate(player_id_column) if player_id == player_data["mlb_id"]]
+
+                for row in player_event_rows:
+                    sub_index = event_table["play_index"][row]
+                    if sub_index < index:
+                        previous_player_event_type = event_table["event_type"][row]
+                    elif sub_index > index:
+                        upcoming_player_event_type = event_table["event_type"][row]
+                        break
 
             counts = [{
                 "balls" : 0,
@@ -43858,19 +45095,9 @@ def get_opponent_schedule(seasons, is_schedule_diff, is_runs_diff):
 
             all_rank = []
 
-            comments = None
             for table_name in table_names:
                 table = player_page.find("table", id=table_name)
 
-                if not table:
-                    if not comments:
-                        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        temp_soup = BeautifulSoup(c, "lxml")
-                        temp_table = temp_soup.find("table", id=table_name)
-                        if temp_table:
-                            table = temp_table
-                            break
 
                 if table_name == "postseason":
                     pennant_winners = set()
@@ -43994,19 +45221,9 @@ def get_opponent_schedule(seasons, is_schedule_diff, is_runs_diff):
             all_era_minus = []
             all_era = []
 
-            comments = None
             for table_name in table_names:
                 table = player_page.find("table", id=table_name)
 
-                if not table:
-                    if not comments:
-                        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        temp_soup = BeautifulSoup(c, "lxml")
-                        temp_table = temp_soup.find("table", id=table_name)
-                        if temp_table:
-                            table = temp_table
-                            break
 
                 standard_table_rows = table.find("tbody").find_all("tr")
                 for row in standard_table_rows:
@@ -45399,7 +46616,6 @@ def calculate_manual_war_7yr(all_rows, player_data, player_type, time_frame, is_
 
     table_names = ["players_value_batting", "players_value_pitching"] if is_pitching_jaws else ["players_value_batting"]
 
-    comments = None
     previous_headers = set()
     for table_index, table_name in enumerate(table_names):
         split_table_name = table_name
@@ -45416,15 +46632,6 @@ def calculate_manual_war_7yr(all_rows, player_data, player_type, time_frame, is_
         table_name = "span_stats"
 
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             header_columns = table.find("thead").find_all("th")
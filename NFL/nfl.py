@@ -6,7 +6,7 @@ import time
 import sqlite3
 import traceback
 import urllib.parse
-from bs4 import BeautifulSoup, Comment, Tag
+from bs4 import BeautifulSoup, Tag
 from urllib.parse import urlparse
 import dateutil.parser
 import dateutil.relativedelta
@@ -22,6 +22,7 @@ import threading
 import concurrent
 import getopt
 import socket
+import http.cookiejar
 import statistics
 import json
 import copy
@@ -62,6 +63,7 @@ from lxml import etree
 import multiprocessing
 import functools
 import ephem
+import bisect
 import ssl
 from requests_ip_rotator import ApiGateway
 import botocore.exceptions
@@ -96,6 +98,10 @@ request_headers= {}
 
 max_request_retries = 10
 retry_failure_delay = 3
+gateway_pool_maxsize = 50
+rate_limit_max_rate = 50
+rate_limit_min_rate = 0.2
+rate_limit_max_concurrency = gateway_pool_maxsize
 max_reddit_retries = 3
 
 player_season_age_date = datetime.datetime(1, 12, 31)
@@ -1049,6 +1055,13 @@ team_venue_history = None
 with open ("team_venue_history.json", "r") as file:
     team_venue_history = json.load(file)
 
+team_venue_year_index = {}
+for team_id in team_venue_history:
+    for stadium_id in team_venue_history[team_id]:
+        for year in team_venue_history[team_id][stadium_id]:
+            if (team_id, year) not in team_venue_year_index:
+                team_venue_year_index[(team_id, year)] = stadium_id
+
 team_name_history = None
 with open ("team_name_history.json", "r") as file:
     team_name_history = json.load(file)
@@ -1095,7 +1108,9 @@ def main():
         conn.close()
 
     global gateway
+    # Size the pool to every comment thread fanning out at once so connections are kept alive instead of discarded
     gateway = ApiGateway("https://www.pro-football-reference.com", verbose=True)
+    gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
     endpoints = gateway.start(force=True)
 
     def exit_gracefully(signum, frame):
@@ -1141,6 +1156,7 @@ def get_api_gateway(url):
     while True:
         try:
             gateway = ApiGateway(url, verbose=True)
+            gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
             return gateway.start(force=True)
         except botocore.exceptions.ClientError as e:
             err_code = e.response["Error"]["Code"]
@@ -1206,6 +1222,8 @@ def parse_input(gateway_to_use, comment, debug_mode, is_approved, existing_cur=N
         end_time = datetime.datetime.now() - start_time
         time_str = str(end_time)
         logger.info("#" + str(threading.get_ident()) + "#   " + "RunTime : " + time_str)
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Gateway pool : " + str(get_gateway_pool_stats()))
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Rate limiter : " + str(get_rate_limiter_stats()))
 
 def sub_parse_input(curr, comment, debug_mode, comment_obj, force_through):
     curr.execute("SELECT 1 FROM nfl WHERE reply_id = ?;", (comment.id, ))
@@ -6589,15 +6607,168 @@ def handle_the_same_games_quals(sub_name, qual_str, subbb_frames, time_frame, pl
                         "new_qual_type" : new_qual_type
                     }
 
+gateway_sessions = {}
+gateway_sessions_lock = threading.Lock()
+
+def get_gateway_session(host):
+    with gateway_sessions_lock:
+        gateway_session = gateway_sessions.get(host)
+        if not gateway_session or gateway_session.get_adapter(host) is not gateway:
+            # The session is shared by every comment thread, so it must not carry cookies from one request into another
+            gateway_session = requests.Session()
+            gateway_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            gateway_session.mount(host, gateway)
+            gateway_sessions[host] = gateway_session
+        return gateway_session
+
+def get_gateway_pool_stats():
+    stats = {
+        "pools" : 0,
+        "connections" : 0,
+        "requests" : 0,
+        "reuse_rate" : 0
+    }
+    pools = gateway.poolmanager.pools
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool:
+            stats["pools"] += 1
+            stats["connections"] += pool.num_connections
+            stats["requests"] += pool.num_requests
+    if stats["requests"]:
+        stats["reuse_rate"] = round(1 - stats["connections"] / stats["requests"], 3)
+    return stats
+
+rate_limiters = {}
+rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(host):
+    with rate_limiters_lock:
+        if host not in rate_limiters:
+            rate_limiters[host] = {
+                "condition" : threading.Condition(),
+                "rate" : float(rate_limit_max_rate),
+                "tokens" : float(rate_limit_max_rate),
+                "last_refill" : time.monotonic(),
+                "concurrency" : rate_limit_max_concurrency,
+                "in_flight" : 0,
+                "waiting" : 0,
+                "successes" : 0,
+                "requests" : 0,
+                "throttled" : 0,
+                "wait_time" : 0.0,
+                "max_waiting" : 0
+            }
+        return rate_limiters[host]
+
+def acquire_rate_limit(host):
+    rate_limiter = get_rate_limiter(host)
+    start_time = time.monotonic()
+    with rate_limiter["condition"]:
+        rate_limiter["waiting"] += 1
+        rate_limiter["max_waiting"] = max(rate_limiter["max_waiting"], rate_limiter["waiting"])
+        try:
+            while True:
+                now = time.monotonic()
+                rate_limiter["tokens"] = min(max(rate_limiter["rate"], 1.0), rate_limiter["tokens"] + (now - rate_limiter["last_refill"]) * rate_limiter["rate"])
+                rate_limiter["last_refill"] = now
+                if rate_limiter["in_flight"] < rate_limiter["concurrency"] and rate_limiter["tokens"] >= 1:
+                    break
+
+                if rate_limiter["in_flight"] >= rate_limiter["concurrency"]:
+                    rate_limiter["condition"].wait()
+                else:
+                    rate_limiter["condition"].wait((1 - rate_limiter["tokens"]) / rate_limiter["rate"])
+
+            rate_limiter["tokens"] -= 1
+            rate_limiter["in_flight"] += 1
+        finally:
+            rate_limiter["waiting"] -= 1
+        rate_limiter["requests"] += 1
+        rate_limiter["wait_time"] += time.monotonic() - start_time
+
+def release_rate_limit(host, status_code, response_host=None):
+    rate_limiter = get_rate_limiter(host)
+    with rate_limiter["condition"]:
+        rate_limiter["in_flight"] -= 1
+        # A 403 through the gateway only means its endpoint needs rebuilding, only a 403 from the origin itself is push back
+        if status_code == 429 or (status_code == 403 and response_host == host):
+            # Halve both the request rate and the concurrency as soon as the host pushes back
+            rate_limiter["rate"] = max(rate_limit_min_rate, rate_limiter["rate"] / 2)
+            rate_limiter["concurrency"] = max(1, rate_limiter["concurrency"] // 2)
+            rate_limiter["tokens"] = min(rate_limiter["tokens"], 0.0)
+            rate_limiter["successes"] = 0
+            rate_limiter["throttled"] += 1
+        elif status_code != None and status_code < 400:
+            rate_limiter["rate"] = min(float(rate_limit_max_rate), rate_limiter["rate"] + rate_limit_max_rate / 50)
+            rate_limiter["successes"] += 1
+            if rate_limiter["successes"] >= rate_limiter["concurrency"]:
+                rate_limiter["successes"] = 0
+                rate_limiter["concurrency"] = min(rate_limit_max_concurrency, rate_limiter["concurrency"] + 1)
+        rate_limiter["condition"].notify_all()
+
+def rate_limited_get(session, url, **kwargs):
+    host = urlparse(url).netloc
+    acquire_rate_limit(host)
+    status_code = None
+    response_host = None
+    try:
+        response = session.get(url, **kwargs)
+        status_code = response.status_code
+        response_host = urlparse(response.url).netloc
+        return response
+    finally:
+        release_rate_limit(host, status_code, response_host)
+
+def get_rate_limiter_stats():
+    with rate_limiters_lock:
+        hosts = list(rate_limiters.keys())
+
+    stats = {}
+    for host in hosts:
+        rate_limiter = rate_limiters[host]
+        with rate_limiter["condition"]:
+            stats[host] = {
+                "rate" : round(rate_limiter["rate"], 2),
+                "concurrency" : rate_limiter["concurrency"],
+                "in_flight" : rate_limiter["in_flight"],
+                "waiting" : rate_limiter["waiting"],
+                "max_waiting" : rate_limiter["max_waiting"],
+                "requests" : rate_limiter["requests"],
+                "throttled" : rate_limiter["throttled"],
+                "avg_wait" : round(rate_limiter["wait_time"] / rate_limiter["requests"], 3) if rate_limiter["requests"] else 0
+            }
+    return stats
+
+def uncomment_hidden_tables(text):
+    # Reference sites ship most secondary tables inside HTML comments, unwrap them once so a single parse exposes every table
+    parts = []
+    position = 0
+    while True:
+        comment_start = text.find(b"<!--", position)
+        if comment_start == -1:
+            break
+        comment_end = text.find(b"-->", comment_start + 4)
+        if comment_end == -1:
+            break
+        parts.append(text[position:comment_start])
+        comment = text[comment_start + 4:comment_end]
+        if b"<table" in comment:
+            parts.append(comment)
+        else:
+            parts.append(text[comment_start:comment_end + 3])
+        position = comment_end + 3
+    parts.append(text[position:])
+    return b"".join(parts)
+
 def url_request(url, timeout=30, retry_403=True):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.pro-football-reference.com", gateway)
+    gateway_session = get_gateway_session("https://www.pro-football-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
-            text = response.content
+            text = uncomment_hidden_tables(response.content)
 
             bs = BeautifulSoup(text, "lxml")
             if not bs.contents:
@@ -6637,9 +6808,9 @@ def url_request_lxml(session, url, timeout=2, retry_403=True):
     failed_counter = 0
     while(True):
         try:
-            response = session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
-            bs = lxml.html.document_fromstring(response.content)
+            bs = lxml.html.document_fromstring(uncomment_hidden_tables(response.content))
             if not bs:
                 raise requests.exceptions.HTTPError("Page is empty!")
             return response, bs
@@ -6678,12 +6849,11 @@ def url_request_lxml(session, url, timeout=2, retry_403=True):
             timeout = 10
 
 def url_request_bytes(url, timeout=30):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.pro-football-reference.com", gateway)
+    gateway_session = get_gateway_session("https://www.pro-football-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             return response.content
         except requests.exceptions.HTTPError as e:
@@ -6720,7 +6890,7 @@ def url_request_json(session, url, timeout=2):
     failed_counter = 0
     while(True):
         try:
-            response = session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             return json.loads(response.content)
         except Exception:
@@ -9490,16 +9660,6 @@ def get_game_data(index, player_data, row_data, qualifiers, extra_stats, s):
             game_datetime = timezone("US/Eastern").localize(game_datetime)
             game_data["StartTime"] = game_datetime
     game_info = player_page_xml.xpath("//table[@id = 'game_info']")
-    if not game_info:
-        for node in player_page_xml.xpath("//comment()"):
-            try:
-                temp_lxml = lxml.html.fragment_fromstring(str(node.text))
-            except Exception:
-                continue
-            temp_table = temp_lxml.xpath("//table[@id = 'game_info']")
-            if temp_table:
-                game_info = temp_table
-                break
     
     game_info = game_info[0]
     game_info_rows = game_info.xpath("./tr")
@@ -9556,16 +9716,6 @@ def get_game_data(index, player_data, row_data, qualifiers, extra_stats, s):
 
 
     officials = player_page_xml.xpath("//table[@id = 'officials']")
-    if not officials:
-        for node in player_page_xml.xpath("//comment()"):
-            try:
-                temp_lxml = lxml.html.fragment_fromstring(str(node.text))
-            except Exception:
-                continue
-            temp_table = temp_lxml.xpath("//table[@id = 'officials']")
-            if temp_table:
-                officials = temp_table
-                break
 
     if officials:
         officials = officials[0]
@@ -9590,16 +9740,6 @@ def get_game_data(index, player_data, row_data, qualifiers, extra_stats, s):
                 game_data["OtherOfficialID"].append(ref_id)
 
     home_starters = player_page_xml.xpath("//table[@id = 'home_starters']")
-    if not home_starters:
-        for node in player_page_xml.xpath("//comment()"):
-            try:
-                temp_lxml = lxml.html.fragment_fromstring(str(node.text))
-            except Exception:
-                continue
-            temp_table = temp_lxml.xpath("//table[@id = 'home_starters']")
-            if temp_table:
-                home_starters = temp_table
-                break
 
     if home_starters:
         home_starters = home_starters[0]
@@ -9618,16 +9758,6 @@ def get_game_data(index, player_data, row_data, qualifiers, extra_stats, s):
                     game_data["opp_starters"][player_id] = positon
 
         away_starters = player_page_xml.xpath("//table[@id = 'vis_starters']")
-        if not away_starters:
-            for node in player_page_xml.xpath("//comment()"):
-                try:
-                    temp_lxml = lxml.html.fragment_fromstring(str(node.text))
-                except Exception:
-                    continue
-                temp_table = temp_lxml.xpath("//table[@id = 'vis_starters']")
-                if temp_table:
-                    away_starters = temp_table
-                    break
 
         away_starters = away_starters[0]
         away_starter_rows = away_starters.xpath(".//tr")
@@ -9645,16 +9775,6 @@ def get_game_data(index, player_data, row_data, qualifiers, extra_stats, s):
                     game_data["team_starters"][player_id] = positon
     
     # play_by_play = player_page_xml.xpath("//table[@id = 'pbp']")
-    # if not play_by_play:
-    #     for node in player_page_xml.xpath("//comment()"):
-    #         try:
-    #             temp_lxml = lxml.html.fragment_fromstring(str(node.text))
-    #         except Exception:
-    #             continue
-    #         temp_table = temp_lxml.xpath("//table[@id = 'pbp']")
-    #         if temp_table:
-    #             play_by_play = temp_table
-    #             break
     # if play_by_play:
     #     play_by_play = play_by_play[0].xpath(".//tr")
 
@@ -11345,21 +11465,11 @@ def handle_fumbles_lost(player_data, all_rows, player_type, ind_player_type, tim
         else:
             raise
 
-    comments = None
     previous_headers = set()
     game_map = {}
     table_name = "stats"
     table = player_page.find("table", id=table_name)
     the_over_header = "Rushing"
-    if not table:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_table = temp_soup.find("table", id=table_name)
-            if temp_table:
-                table = temp_table
-                break
 
     if table:
         over_header_values = []
@@ -11419,20 +11529,10 @@ def handle_fumbles_lost(player_data, all_rows, player_type, ind_player_type, tim
 
 def handle_missing_playoff_rows(player_page, player_data, valid_years, all_rows, player_type, ind_player_type, time_frame):     
     table_names = ["passing_playoffs", "receiving_and_rushing_playoffs", "rushing_and_receiving_playoffs", "scoring_playoffs", "defense_playoffs", "kicking_playoffs", "returns_playoffs", "snap_counts_playoffs", "games_played_playoffs"]
-    comments = None
     previous_headers = set()
     game_map = {}
     for table_index, table_name in enumerate(table_names):
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             over_header_values = []
@@ -11535,20 +11635,10 @@ def handle_season_only_stats(is_game_page, is_game, player_page, player_data, pl
         else:
             table_names = []
         
-    comments = None
     previous_headers = set()
     game_map = {}
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             over_header_values = []
@@ -11652,20 +11742,10 @@ def handle_season_only_stats(is_game_page, is_game, player_page, player_data, pl
     if not is_game:
         table_names = ["passing_playoffs", "receiving_and_rushing_playoffs", "rushing_and_receiving_playoffs"]
 
-        comments = None
         previous_headers = set()
         game_map = {}
         for table_name in table_names:
             table = og_player_age.find("table", id=table_name)
-            if not table:
-                if not comments:
-                    comments = og_player_age.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id=table_name)
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 over_header_values = []
@@ -11741,15 +11821,6 @@ def handle_season_only_stats(is_game_page, is_game, player_page, player_data, pl
 
             for table_name in table_names:
                 table = player_page.find("table", id=table_name)
-                if not table:
-                    if not comments:
-                        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        temp_soup = BeautifulSoup(c, "lxml")
-                        temp_table = temp_soup.find("table", id=table_name)
-                        if temp_table:
-                            table = temp_table
-                            break
 
                 if table:
                     over_header_values = []
@@ -11847,18 +11918,8 @@ def handle_awards(player_page, player_data, player_type, ind_player_type, time_f
     has_quals = bool(time_frame["qualifiers"])
     is_full_career = is_full_career if is_full_career else is_career and not has_quals
 
-    comments = None
     for div_id in count_divs:
         count_div = player_page.find("div", id=div_id)
-        if not count_div:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_div = temp_soup.find("div", id=div_id)
-                if temp_div:
-                    count_div = temp_div
-                    break
                     
         if count_div:
             count_table_links = count_div.find("table").find_all("a")
@@ -11877,15 +11938,6 @@ def handle_awards(player_page, player_data, player_type, ind_player_type, time_f
                                 break
 
     awards_div = player_page.find("div", id="leaderboard_awards")
-    if not awards_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="leaderboard_awards")
-            if temp_div:
-                awards_div = temp_div
-                break
 
     if awards_div:
         awards_table_rows = awards_div.find("table").find_all("td")
@@ -11954,15 +12006,6 @@ def handle_awards(player_page, player_data, player_type, ind_player_type, time_f
                             break
 
     all_pro_table = player_page.find("table", id="all_pro")
-    if not all_pro_table:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_table = temp_soup.find("table", id="all_pro")
-            if temp_table:
-                all_pro_table = temp_table
-                break
     
     if all_pro_table:
         all_pro_rows = all_pro_table.find_all("tr")
@@ -12013,15 +12056,6 @@ def handle_awards(player_page, player_data, player_type, ind_player_type, time_f
         
         for table_name in table_names:
             per_game_table = player_page.find("table", id=table_name)
-            if not awards_div:
-                if not comments:
-                    comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_div = temp_soup.find("table", id=table_name)
-                    if temp_div:
-                        per_game_table = temp_div
-                        break
             
             if per_game_table:
                 standard_table_rows = per_game_table.find("tbody").find_all("tr")
@@ -12087,15 +12121,6 @@ def handle_awards(player_page, player_data, player_type, ind_player_type, time_f
         award_name = award_results_map[table_name]
 
         shares_div = player_page.find("div", id=table_name)
-        if not shares_div:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_div = temp_soup.find("div", id=table_name)
-                if temp_div:
-                    shares_div = temp_div
-                    break
                     
         if shares_div:
             shares_table_rows = shares_div.find("table").find_all("td")
@@ -12160,17 +12185,7 @@ def handle_leading_seasons(player_page, player_data, player_type, time_frame, ye
                         if over_header in row:
                             row[over_header][header] = 0.0
 
-    comments = None
     count_div = player_page.find("div", id="div_leaderboard")
-    if not count_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="div_leaderboard")
-            if temp_div:
-                count_div = temp_div
-                break
 
     if not count_div:
         return
@@ -13759,60 +13774,9 @@ def perform_qualifier(player_data, player_type, ind_player_type, row, time_frame
         for qual_object in qualifiers["Holiday"]:
             has_match = False
             for holiday in qual_object["values"]:
-                country = "usa"
-                eve = False
-                observed = False
-                church = "western"
-                if "canadian" in holiday:
-                    country = "canada"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("canadian", "")).strip()
-                elif "canada" in holiday:
-                    country = "canada"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("canada", "")).strip()
-                elif "eve" in holiday:
-                    eve = True
-                    holiday = re.sub(r"\s+", " ", holiday.replace("eve", "")).strip()
-                elif "observed" in holiday:
-                    observed = True
-                    holiday = re.sub(r"\s+", " ", holiday.replace("observed", "")).strip()
-                elif "orthodox" in holiday:
-                    church = "orthodox"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("orthodox", "")).strip()
-                elif "eastern" in holiday:
-                    church = "eastern"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("eastern", "")).strip()
-                holiday = re.sub(r"\W+", "", re.sub(r"[\s-]+", "_", holiday))
-
-                has_custom_match = False
-                for holiday_func in all_custom_holidays:
-                    if holiday_func[0] == holiday:
-                        has_custom_match = True
-                        if holiday_func[1](game_date, church, country, observed, eve):
-                            has_match = True
-                        break
-
-                if not has_custom_match:
-                    for holiday_func in all_holidays:
-                        if holiday_func[0] == holiday:
-                            arguments = inspect.signature(holiday_func[1]).parameters
-                            if "church" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, church=church)
-                            elif "country" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, country=country)
-                            elif "observed" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, observed=observed)
-                            elif "eve" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, eve=eve)
-                            else:
-                                holiday_date = holiday_func[1](game_date.year)
-
-                            if holiday_date:
-                                holiday_date = datetime.datetime(holiday_date[0], holiday_date[1], holiday_date[2]).date()
-                                if eve:
-                                    holiday_date -= datetime.timedelta(days=1)
-                                if game_date == holiday_date:
-                                    has_match = True
-                            break
+                if is_holiday_match(game_date, holiday):
+                    has_match = True
+                    break
             if qual_object["negate"]:
                 if has_match:
                     return False
@@ -14256,70 +14220,166 @@ def determine_venue_obj(row, is_team):
     return get_venue_obj(team_id, row["Shared"]["Year"])[1]
 
 def get_venue_obj(team_id, year):
-    if team_id in team_venue_history:
-        for pot_team_venue in team_venue_history[team_id]:
-            for stadium_id in team_venue_history[team_id]:
-                if year in team_venue_history[team_id][stadium_id]:
-                    return stadium_id, team_venues[str(stadium_id)]
+    stadium_id = team_venue_year_index.get((team_id, year))
+    if stadium_id != None:
+        return stadium_id, team_venues[str(stadium_id)]
     
     return None, None
 
+moon_phase_tables = {}
+moon_phase_names = ["Full Moon", "New Moon", "First Quarter", "Third Quarter"]
+moon_phase_next_funcs = {
+    "Full Moon" : ephem.next_full_moon,
+    "New Moon" : ephem.next_new_moon,
+    "First Quarter" : ephem.next_first_quarter_moon,
+    "Third Quarter" : ephem.next_last_quarter_moon
+}
+moon_phase_between_names = {
+    "First Quarter" : "Waxing Crescent",
+    "Full Moon" : "Waxing Gibbous",
+    "Third Quarter" : "Waning Gibbous",
+    "New Moon" : "Waning Crescent"
+}
+
 def human_moon(date):
-    date = datetime.datetime(year=date.year, month=date.month, day=date.day, hour=19, minute=0, second=0)
-    date = pytz.timezone("US/Eastern").localize(date)
-    next_full = ephem.next_full_moon(date)
-    next_new = ephem.next_new_moon(date)
-    next_last_quarter = ephem.next_last_quarter_moon(date)
-    next_first_quarter = ephem.next_first_quarter_moon(date)
-    previous_full = ephem.previous_full_moon(date)
-    previous_new = ephem.previous_new_moon(date)
-    previous_last_quarter = ephem.previous_last_quarter_moon(date)
-    previous_first_quarter = ephem.previous_first_quarter_moon(date)
-
-    moon_phases = []
-
-    if is_moon_match(date.date(), next_full):
-        moon_phases.append("Full Moon")
-    if is_moon_match(date.date(), previous_full):
-        moon_phases.append("Full Moon")
-    
-    if is_moon_match(date.date(), next_new):
-        moon_phases.append("New Moon")
-    if is_moon_match(date.date(), previous_new):
-        moon_phases.append("New Moon")
-    
-    if is_moon_match(date.date(), next_first_quarter):
-        moon_phases.append("First Quarter")
-    if is_moon_match(date.date(), previous_first_quarter):
-        moon_phases.append("First Quarter")
-    
-    if is_moon_match(date.date(), next_last_quarter):
-        moon_phases.append("Third Quarter")
-    if is_moon_match(date.date(), previous_last_quarter):
-        moon_phases.append("Third Quarter")
-    
-    if previous_new < next_first_quarter < next_full < next_last_quarter < next_new:
-        moon_phases.append("Waxing Crescent")
-    elif previous_first_quarter < next_full < next_last_quarter < next_new < next_first_quarter:
-        moon_phases.append("Waxing Gibbous")
-    elif previous_full < next_last_quarter < next_new < next_first_quarter < next_full:
-        moon_phases.append("Waning Gibbous")
-    elif previous_last_quarter < next_new < next_first_quarter < next_full < next_last_quarter:
-        moon_phases.append("Waning Crescent")
-
-    return [moon_phase.lower() for moon_phase in moon_phases]
-
-def is_moon_match(da_date, da_moon_date):
+    if date.year not in moon_phase_tables:
+        moon_phase_tables[date.year] = build_moon_phase_table(date.year)
+    return moon_phase_tables[date.year][datetime.date(date.year, date.month, date.day)]
+
+def build_moon_phase_table(year):
+    eastern = pytz.timezone("US/Eastern")
+    first_date = datetime.date(year, 1, 1)
+    end_time = ephem.Date(eastern.localize(datetime.datetime(year=year + 1, month=2, day=1, hour=19, minute=0, second=0)))
+
+    # Walk every phase event from a month before to a month after the year once, instead of searching from each day
+    phase_events = []
+    for moon_phase in moon_phase_names:
+        event_time = moon_phase_next_funcs[moon_phase](eastern.localize(datetime.datetime(year=year - 1, month=12, day=1, hour=19, minute=0, second=0)))
+        while event_time < end_time:
+            phase_events.append((float(event_time), moon_phase))
+            event_time = moon_phase_next_funcs[moon_phase](ephem.Date(event_time + 1))
+    phase_events.sort()
+    event_times = [phase_event[0] for phase_event in phase_events]
+
+    event_dates = {}
+    for event_time, moon_phase in phase_events:
+        for match_date in get_moon_match_dates(ephem.Date(event_time)):
+            if match_date not in event_dates:
+                event_dates[match_date] = set()
+            event_dates[match_date].add(moon_phase)
+
+    moon_phase_table = {}
+    for day in range((datetime.date(year + 1, 1, 1) - first_date).days):
+        da_date = first_date + datetime.timedelta(days=day)
+        da_time = ephem.Date(eastern.localize(datetime.datetime(year=da_date.year, month=da_date.month, day=da_date.day, hour=19, minute=0, second=0)))
+
+        moon_phases = [moon_phase for moon_phase in moon_phase_names if moon_phase in event_dates.get(da_date, ())]
+        next_event = phase_events[bisect.bisect_right(event_times, float(da_time))]
+        moon_phases.append(moon_phase_between_names[next_event[1]])
+
+        moon_phase_table[da_date] = [moon_phase.lower() for moon_phase in moon_phases]
+
+    return moon_phase_table
+
+def get_moon_match_dates(da_moon_date):
     da_moon_date = da_moon_date.datetime()
     da_moon_date = pytz.utc.localize(da_moon_date).astimezone(pytz.timezone("US/Eastern"))
     if da_moon_date.time() < datetime.time(hour=12, minute=0, second=0):
-        dt_1 = da_moon_date - datetime.timedelta(days=1)
-        dt_2 = da_moon_date
+        return [(da_moon_date - datetime.timedelta(days=1)).date(), da_moon_date.date()]
     else:
-        dt_1 = da_moon_date
-        dt_2 = da_moon_date
-    
-    return da_date >= dt_1.date() and da_date <= dt_2.date()
+        return [da_moon_date.date()]
+
+holiday_infos = {}
+holiday_year_dates = {}
+holiday_date_matches = {}
+
+def get_holiday_info(holiday):
+    if holiday in holiday_infos:
+        return holiday_infos[holiday]
+
+    holiday_name = holiday
+    country = "usa"
+    eve = False
+    observed = False
+    church = "western"
+    if "canadian" in holiday_name:
+        country = "canada"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("canadian", "")).strip()
+    elif "canada" in holiday_name:
+        country = "canada"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("canada", "")).strip()
+    elif "eve" in holiday_name:
+        eve = True
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("eve", "")).strip()
+    elif "observed" in holiday_name:
+        observed = True
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("observed", "")).strip()
+    elif "orthodox" in holiday_name:
+        church = "orthodox"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("orthodox", "")).strip()
+    elif "eastern" in holiday_name:
+        church = "eastern"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("eastern", "")).strip()
+    holiday_name = re.sub(r"\W+", "", re.sub(r"[\s-]+", "_", holiday_name))
+
+    holiday_info = {
+        "church" : church,
+        "country" : country,
+        "observed" : observed,
+        "eve" : eve,
+        "custom_func" : None,
+        "func" : None
+    }
+    for holiday_func in all_custom_holidays:
+        if holiday_func[0] == holiday_name:
+            holiday_info["custom_func"] = holiday_func[1]
+            break
+    if not holiday_info["custom_func"]:
+        for holiday_func in all_holidays:
+            if holiday_func[0] == holiday_name:
+                holiday_info["func"] = holiday_func[1]
+                break
+
+    holiday_infos[holiday] = holiday_info
+    return holiday_info
+
+def get_holiday_date(holiday, year):
+    holiday_key = (holiday, year)
+    if holiday_key in holiday_year_dates:
+        return holiday_year_dates[holiday_key]
+
+    holiday_info = get_holiday_info(holiday)
+    holiday_func = holiday_info["func"]
+    arguments = inspect.signature(holiday_func).parameters
+    if "church" in arguments:
+        holiday_date = holiday_func(year, church=holiday_info["church"])
+    elif "country" in arguments:
+        holiday_date = holiday_func(year, country=holiday_info["country"])
+    elif "observed" in arguments:
+        holiday_date = holiday_func(year, observed=holiday_info["observed"])
+    elif "eve" in arguments:
+        holiday_date = holiday_func(year, eve=holiday_info["eve"])
+    else:
+        holiday_date = holiday_func(year)
+
+    if holiday_date:
+        holiday_date = datetime.datetime(holiday_date[0], holiday_date[1], holiday_date[2]).date()
+        if holiday_info["eve"]:
+            holiday_date -= datetime.timedelta(days=1)
+
+    holiday_year_dates[holiday_key] = holiday_date
+    return holiday_date
+
+def is_holiday_match(game_date, holiday):
+    holiday_info = get_holiday_info(holiday)
+    if holiday_info["custom_func"]:
+        holiday_key = (holiday, game_date)
+        if holiday_key not in holiday_date_matches:
+            holiday_date_matches[holiday_key] = bool(holiday_info["custom_func"](game_date, holiday_info["church"], holiday_info["country"], holiday_info["observed"], holiday_info["eve"]))
+        return holiday_date_matches[holiday_key]
+    elif holiday_info["func"]:
+        return get_holiday_date(holiday, game_date.year) == game_date
+    return False
 
 def handle_max_min_data(all_rows, player_data, player_type, qualifiers):
     new_rows = []
@@ -18170,18 +18230,8 @@ def get_latest_player_pos(player_page):
     player_pos_map = {}
 
     table_names = ["passing", "receiving_and_rushing", "rushing_and_receiving", "scoring", "defense", "kicking", "returns", "snap_counts", "games_played", "passing_playoffs", "receiving_and_rushing_playoffs", "rushing_and_receiving_playoffs", "scoring_playoffs", "defense_playoffs", "kicking_playoffs", "returns_playoffs", "snap_counts_playoffs", "games_played_playoffs"]
-    comments = None
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find("tbody").find_all("tr")
@@ -18243,18 +18293,8 @@ def get_valid_years(player_page):
     valid_year_teams = {}
 
     table_names = ["passing", "receiving_and_rushing", "rushing_and_receiving", "scoring", "defense", "kicking", "returns", "snap_counts", "games_played", "passing_playoffs", "receiving_and_rushing_playoffs", "rushing_and_receiving_playoffs", "scoring_playoffs", "defense_playoffs", "kicking_playoffs", "returns_playoffs", "snap_counts_playoffs", "games_played_playoffs"]
-    comments = None
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find("tbody").find_all("tr")
@@ -18354,18 +18394,8 @@ def determine_rookie_years(player_page, rookie_quals):
 
     table_names = ["passing", "receiving_and_rushing", "rushing_and_receiving", "scoring", "defense", "kicking", "returns", "snap_counts", "games_played"]
 
-    comments = None
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             rookie_years = []
@@ -18602,7 +18632,6 @@ def get_player_current_team_number(player_page, needs_numbers):
     number = None
     numbers_map = []
     numbers_team_map = {}
-    comments = None
     team_info = player_page.find("div", {"id" : "meta"}).find("strong", text="Team")
     number_info = player_page.find("div", {"class" : "uni_holder"})
     if team_info:
@@ -18613,15 +18642,6 @@ def get_player_current_team_number(player_page, needs_numbers):
         valid_teams = {}
         for table_name in table_names:
             table = player_page.find("table", id=table_name)
-            if not table:
-                if not comments:
-                    comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id=table_name)
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 standard_table_rows = table.find_all("tr")
@@ -18768,7 +18788,6 @@ def parse_table(player_page, player_data, time_frame, year, player_type, ind_pla
                             hide_first_downs = True
     hide_first_downs = False
     
-    comments = None
 
     previous_headers = set()
     game_counter = 0
@@ -18778,15 +18797,6 @@ def parse_table(player_page, player_data, time_frame, year, player_type, ind_pla
     all_rows = []
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             over_header_values = []
@@ -22059,14 +22069,6 @@ def get_opponent_schedule(seasons, has_offensive_stats, has_defensive_stats, fan
 
             conf_winners = set()
             table = player_page.find("table", id="playoff_results")
-            if not table:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id="playoff_results")
-                    if temp_table:
-                        table = temp_table
-                        break
 
             if table:
                 standard_table_rows = table.find("tbody").find_all("tr")
@@ -22102,21 +22104,11 @@ def get_opponent_schedule(seasons, has_offensive_stats, has_defensive_stats, fan
             all_pass_td_rate = []
             all_rush_td_rate = []
 
-            comments = None
             has_wild_card = False
             has_division_winner = False
             for table_name in table_names:
                 table = player_page.find("table", id=table_name)
 
-                if not table:
-                    if not comments:
-                        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        temp_soup = BeautifulSoup(c, "lxml")
-                        temp_table = temp_soup.find("table", id=table_name)
-                        if temp_table:
-                            table = temp_table
-                            break
 
                 standard_table_rows = table.find("tbody").find_all("tr")
                 current_division = None
@@ -22352,19 +22344,9 @@ def get_opponent_schedule(seasons, has_offensive_stats, has_defensive_stats, fan
             all_pass_td_allowed_rate = []
             all_rush_td_allowed_rate = []
 
-            comments = None
             for table_name in table_names:
                 table = player_page.find("table", id=table_name)
 
-                if not table:
-                    if not comments:
-                        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        temp_soup = BeautifulSoup(c, "lxml")
-                        temp_table = temp_soup.find("table", id=table_name)
-                        if temp_table:
-                            table = temp_table
-                            break
 
                 standard_table_rows = table.find("tbody").find_all("tr")
                 for row in standard_table_rows:
@@ -22526,18 +22508,8 @@ def get_opponent_schedule(seasons, has_offensive_stats, has_defensive_stats, fan
                 if not has_offensive_stats and not has_defensive_stats:
                     team_obj[season_obj["Year"]] = {}
 
-                comments = None
                 table = player_page.find("table", id=table_name)
 
-                if not table:
-                    if not comments:
-                        comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        temp_soup = BeautifulSoup(c, "lxml")
-                        temp_table = temp_soup.find("table", id=table_name)
-                        if temp_table:
-                            table = temp_table
-                            break
                 
                 all_fantasy_points = []
                 all_fantasy_points_rate = []
@@ -4,9 +4,10 @@ import re
 import math
 import time
 import sqlite3
+import zlib
 import traceback
 import urllib.parse
-from bs4 import BeautifulSoup, Comment, Tag
+from bs4 import BeautifulSoup, Tag
 from urllib.parse import urlparse
 import dateutil.parser
 import dateutil.relativedelta
@@ -23,6 +24,7 @@ import threading
 import concurrent
 import getopt
 import socket
+import http.cookiejar
 import json
 import copy
 from pytz import timezone
@@ -46,6 +48,8 @@ import os
 import tempfile
 import shutil
 import base64
+import heapq
+import itertools
 import pytz
 import requests
 try:
@@ -68,6 +72,7 @@ from lxml import etree
 import multiprocessing
 import functools
 import ephem
+import bisect
 import ssl
 import mergedeep
 import cProfile
@@ -110,16 +115,29 @@ request_headers= {}
 
 max_request_retries = 3
 retry_failure_delay = 3
+gateway_pool_maxsize = 50
+rate_limit_max_rate = 50
+rate_limit_min_rate = 0.2
+rate_limit_max_concurrency = gateway_pool_maxsize
 max_reddit_retries = 3
+shift_chart_batch_size = 10
+shift_chart_page_limit = 1000
 
 player_season_age_date = datetime.datetime(1, 1, 31)
 
+strength_labels = ["SH", "EV", "PP"]
+interval_toi_qualifiers = {"On Ice With", "On Ice Against"}
+
 imgur_upload_url = "https://api.imgur.com/3/upload.json"
 imgur_headers = {
     "Authorization" : "Client-ID a79699457a20a4d"
 }
 
 use_threads_for_game = False
+use_html_report_cache = True
+html_report_cache_db = "nhl_html_reports.db"
+html_report_settle_days = 2
+html_report_missing_expiry = 7 * 24 * 60 * 60
 display_progress_as_edit = True
 ignore_approved = True
 
@@ -7198,8 +7216,9 @@ adv_url_format = "https://www.hockey-reference.com/players/{}/{}-advanced-{}.htm
 opponent_schedule_url_format = "https://www.hockey-reference.com/leagues/NHL_{}.html"
 team_roster_url_format = "https://statsapi.web.nhl.com/api/v1/teams/{}/roster?season={}&hydrate=person"
 nhl_team_schedule_url_format = "https://statsapi.web.nhl.com/api/v1/schedule?teamId={}&season={}&gameType=P,R"
+nhl_season_schedule_url_format = "https://statsapi.web.nhl.com/api/v1/schedule?season={}&gameType=P,R"
 #nhl_team_schedule_url_format = "https://statsapi.web.nhl.com/api/v1/schedule?teamId={}&startDate={}&endDate={}&gameType=P,R"
-nhl_shifts_report_format = "https://api.nhle.com/stats/rest/en/shiftcharts?cayenneExp=gameId={}"
+nhl_shifts_report_format = "https://api.nhle.com/stats/rest/en/shiftcharts?cayenneExp={}&sort={}&start={}&limit={}"
 nhl_html_shifts_report_format = "http://www.nhl.com/scores/htmlreports/{}/T{}{}.HTM"
 nhl_html_plays_report_format = "http://www.nhl.com/scores/htmlreports/{}/PL{}.HTM"
 nhl_html_summary_report_format = "http://www.nhl.com/scores/htmlreports/{}/GS{}.HTM"
@@ -7261,6 +7280,13 @@ with open ("team_venues.json", "r") as file:
 team_venue_history = None
 with open ("team_venue_history.json", "r") as file:
     team_venue_history = json.load(file)
+
+team_venue_year_index = {}
+for team_id in team_venue_history:
+    for stadium_id in team_venue_history[team_id]:
+        for year in team_venue_history[team_id][stadium_id]:
+            if (team_id, year) not in team_venue_year_index:
+                team_venue_year_index[(team_id, year)] = stadium_id
     
 manual_info = {
     1987030999 : {
@@ -7332,8 +7358,10 @@ def main():
     manual_comment_long = "comment"
     debug_mode_short = "d"
     debug_mode_long = "debug"
+    backfill_short = "b"
+    backfill_long = "backfill"
     try:
-        options = getopt.getopt(sys.argv[1:], manual_comment_short + ":" + debug_mode_short + ":", [manual_comment_long + "=", debug_mode_long + "="])[0]
+        options = getopt.getopt(sys.argv[1:], manual_comment_short + ":" + debug_mode_short + ":" + backfill_short + ":", [manual_comment_long + "=", debug_mode_long + "=", backfill_long + "="])[0]
     except getopt.GetoptError as err:
         logger.error("Encountered error \"" + str(err) + "\" parsing arguments")
         return
@@ -7365,7 +7393,9 @@ def main():
         conn.close()
 
     global gateway
+    # Size the pool to every comment thread fanning out at once so connections are kept alive instead of discarded
     gateway = ApiGateway("https://www.hockey-reference.com", verbose=True)
+    gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
     endpoints = gateway.start(force=True)
 
     def exit_gracefully(signum, frame):
@@ -7389,6 +7419,9 @@ def main():
                     logger.info("FOUND COMMENT " + str(comment.id))
                     parse_input(gateway, comment, True, False)
                 return
+            elif opt in ("-" + backfill_short, "--" + backfill_long):
+                backfill_html_reports(arg.strip())
+                return
 
         with ThreadPoolExecutor(max_workers=10) as executor:
             for comment in subreddit.stream.comments():
@@ -7411,6 +7444,7 @@ def get_api_gateway(url):
     while True:
         try:
             gateway = ApiGateway(url, verbose=True)
+            gateway.init_poolmanager(gateway_pool_maxsize, gateway_pool_maxsize)
             return gateway.start(force=True)
         except botocore.exceptions.ClientError as e:
             err_code = e.response["Error"]["Code"]
@@ -7476,6 +7510,8 @@ def parse_input(gateway_to_use, comment, debug_mode, is_approved, existing_cur=N
         end_time = datetime.datetime.now() - start_time
         time_str = str(end_time)
         logger.info("#" + str(threading.get_ident()) + "#   " + "RunTime : " + time_str)
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Gateway pool : " + str(get_gateway_pool_stats()))
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Rate limiter : " + str(get_rate_limiter_stats()))
 
 def sub_parse_input(curr, comment, debug_mode, comment_obj, force_through):
     curr.execute("SELECT 1 FROM nhl WHERE reply_id = ?;", (comment.id, ))
@@ -14995,19 +15031,19 @@ def sub_handle_the_quals(players, qualifier, qual_str, player_str, time_frame, k
                 elif key == "Either":
                     date = row["NHLGameLink"]
                     if not row["Tm"].lower() in player_games:
-                        player_games[row["Tm"].lower()] = []
-                    player_games[row["Tm"].lower()].append(date)
+                        player_games[row["Tm"].lower()] = set()
+                    player_games[row["Tm"].lower()].add(date)
                     if not row["Opponent"].lower() in player_games:
-                        player_games[row["Opponent"].lower()] = []
-                    player_games[row["Opponent"].lower()].append(date)
+                        player_games[row["Opponent"].lower()] = set()
+                    player_games[row["Opponent"].lower()].add(date)
                 else:
                     date = row["NHLGameLink"]
                     opponent = row[key]
                     if key == "Tm":
                         opponent = opponent.lower()
                     if not opponent in player_games:
-                        player_games[opponent] = []
-                    player_games[opponent].append(date)
+                        player_games[opponent] = set()
+                    player_games[opponent].add(date)
 
         qual_index = 0
         for index, player_name in enumerate(player_data["stat_values"]["Player"]):
@@ -15182,15 +15218,264 @@ def handle_the_same_games_quals(sub_name, qual_str, subbb_frames, time_frame, pl
                         "new_qual_type" : new_qual_type
                     }
 
+gateway_sessions = {}
+gateway_sessions_lock = threading.Lock()
+
+def get_gateway_session(host):
+    with gateway_sessions_lock:
+        gateway_session = gateway_sessions.get(host)
+        if not gateway_session or gateway_session.get_adapter(host) is not gateway:
+            # The session is shared by every comment thread, so it must not carry cookies from one request into another
+            gateway_session = requests.Session()
+            gateway_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            gateway_session.mount(host, gateway)
+            gateway_sessions[host] = gateway_session
+        return gateway_session
+
+def get_gateway_pool_stats():
+    stats = {
+        "pools" : 0,
+        "connections" : 0,
+        "requests" : 0,
+        "reuse_rate" : 0
+    }
+    pools = gateway.poolmanager.pools
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool:
+            stats["pools"] += 1
+            stats["connections"] += pool.num_connections
+            stats["requests"] += pool.num_requests
+    if stats["requests"]:
+        stats["reuse_rate"] = round(1 - stats["connections"] / stats["requests"], 3)
+    return stats
+
+rate_limiters = {}
+rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(host):
+    with rate_limiters_lock:
+        if host not in rate_limiters:
+            rate_limiters[host] = {
+                "condition" : threading.Condition(),
+                "rate" : float(rate_limit_max_rate),
+                "tokens" : float(rate_limit_max_rate),
+                "last_refill" : time.monotonic(),
+                "concurrency" : rate_limit_max_concurrency,
+                "in_flight" : 0,
+                "waiting" : 0,
+                "successes" : 0,
+                "requests" : 0,
+                "throttled" : 0,
+                "wait_time" : 0.0,
+                "max_waiting" : 0
+            }
+        return rate_limiters[host]
+
+def acquire_rate_limit(host):
+    rate_limiter = get_rate_limiter(host)
+    start_time = time.monotonic()
+    with rate_limiter["condition"]:
+        rate_limiter["waiting"] += 1
+        rate_limiter["max_waiting"] = max(rate_limiter["max_waiting"], rate_limiter["waiting"])
+        try:
+            while True:
+                now = time.monotonic()
+                rate_limiter["tokens"] = min(max(rate_limiter["rate"], 1.0), rate_limiter["tokens"] + (now - rate_limiter["last_refill"]) * rate_limiter["rate"])
+                rate_limiter["last_refill"] = now
+                if rate_limiter["in_flight"] < rate_limiter["concurrency"] and rate_limiter["tokens"] >= 1:
+                    break
+
+                if rate_limiter["in_flight"] >= rate_limiter["concurrency"]:
+                    rate_limiter["condition"].wait()
+                else:
+                    rate_limiter["condition"].wait((1 - rate_limiter["tokens"]) / rate_limiter["rate"])
+
+            rate_limiter["tokens"] -= 1
+            rate_limiter["in_flight"] += 1
+        finally:
+            rate_limiter["waiting"] -= 1
+        rate_limiter["requests"] += 1
+        rate_limiter["wait_time"] += time.monotonic() - start_time
+
+def release_rate_limit(host, status_code, response_host=None):
+    rate_limiter = get_rate_limiter(host)
+    with rate_limiter["condition"]:
+        rate_limiter["in_flight"] -= 1
+        # A 403 through the gateway only means its endpoint needs rebuilding, only a 403 from the origin itself is push back
+        if status_code == 429 or (status_code == 403 and response_host == host):
+            # Halve both the request rate and the concurrency as soon as the host pushes back
+            rate_limiter["rate"] = max(rate_limit_min_rate, rate_limiter["rate"] / 2)
+            rate_limiter["concurrency"] = max(1, rate_limiter["concurrency"] // 2)
+            rate_limiter["tokens"] = min(rate_limiter["tokens"], 0.0)
+            rate_limiter["successes"] = 0
+            rate_limiter["throttled"] += 1
+        elif status_code != None and status_code < 400:
+            rate_limiter["rate"] = min(float(rate_limit_max_rate), rate_limiter["rate"] + rate_limit_max_rate / 50)
+            rate_limiter["successes"] += 1
+            if rate_limiter["successes"] >= rate_limiter["concurrency"]:
+                rate_limiter["successes"] = 0
+                rate_limiter["concurrency"] = min(rate_limit_max_concurrency, rate_limiter["concurrency"] + 1)
+        rate_limiter["condition"].notify_all()
+
+def rate_limited_get(session, url, **kwargs):
+    host = urlparse(url).netloc
+    acquire_rate_limit(host)
+    status_code = None
+    response_host = None
+    try:
+        response = session.get(url, **kwargs)
+        status_code = response.status_code
+        response_host = urlparse(response.url).netloc
+        return response
+    finally:
+        release_rate_limit(host, status_code, response_host)
+
+def get_rate_limiter_stats():
+    with rate_limiters_lock:
+        hosts = list(rate_limiters.keys())
+
+    stats = {}
+    for host in hosts:
+        rate_limiter = rate_limiters[host]
+        with rate_limiter["condition"]:
+            stats[host] = {
+                "rate" : round(rate_limiter["rate"], 2),
+                "concurrency" : rate_limiter["concurrency"],
+                "in_flight" : rate_limiter["in_flight"],
+                "waiting" : rate_limiter["waiting"],
+                "max_waiting" : rate_limiter["max_waiting"],
+                "requests" : rate_limiter["requests"],
+                "throttled" : rate_limiter["throttled"],
+                "avg_wait" : round(rate_limiter["wait_time"] / rate_limiter["requests"], 3) if rate_limiter["requests"] else 0
+            }
+    return stats
+
+deferred_retry_state = threading.local()
+
+def get_request_retries():
+    # Work handed to submit_retrying gives its retries to the retry scheduler instead of sleeping in place
+    if getattr(deferred_retry_state, "enabled", False):
+        return 0
+    return max_request_retries
+
+def get_request_timeout(timeout):
+    # Deferred attempts run one request each, so the last one is picked out by its attempt number
+    if getattr(deferred_retry_state, "enabled", False) and deferred_retry_state.failed_counter >= max_request_retries:
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Last retry, will use a timeout of 10 seconds")
+        return 10
+    return timeout
+
+retry_schedule = []
+retry_schedule_counter = itertools.count()
+retry_schedule_condition = threading.Condition()
+retry_schedule_thread = None
+
+def run_retry_schedule():
+    while True:
+        with retry_schedule_condition:
+            while not retry_schedule or retry_schedule[0][0] > time.monotonic():
+                retry_schedule_condition.wait(retry_schedule[0][0] - time.monotonic() if retry_schedule else None)
+            retry_call = heapq.heappop(retry_schedule)[2]
+        try:
+            retry_call()
+        except Exception:
+            logger.error("#" + str(threading.get_ident()) + "#   " + "Unable to run scheduled retry\n" + traceback.format_exc())
+
+def schedule_retry(delay, retry_call):
+    global retry_schedule_thread
+    with retry_schedule_condition:
+        if not retry_schedule_thread:
+            retry_schedule_thread = threading.Thread(target=run_retry_schedule, name="retry_schedule", daemon=True)
+            retry_schedule_thread.start()
+        heapq.heappush(retry_schedule, (time.monotonic() + delay, next(retry_schedule_counter), retry_call))
+        retry_schedule_condition.notify()
+
+def is_retryable_error(err):
+    # Only transport failures and throttled or failing responses are retried, parse errors are raised right away
+    if isinstance(err, requests.exceptions.HTTPError):
+        return err.response == None or err.response.status_code in (403, 429) or err.response.status_code >= 500
+    return isinstance(err, requests.exceptions.RequestException)
+
+def run_deferred_retry_call(func, args, failed_counter):
+    deferred_retry_state.enabled = True
+    deferred_retry_state.failed_counter = failed_counter
+    try:
+        return func(*args)
+    finally:
+        deferred_retry_state.enabled = False
+
+def submit_retrying(executor, func, *args):
+    outer_future = concurrent.futures.Future()
+    attempt_info = {
+        "failed_counter" : 0
+    }
+
+    def attempt_done(attempt_future):
+        if outer_future.cancelled():
+            return
+
+        err = attempt_future.exception()
+        try:
+            if not err:
+                outer_future.set_result(attempt_future.result())
+                return
+
+            attempt_info["failed_counter"] += 1
+            if attempt_info["failed_counter"] > max_request_retries or not is_retryable_error(err):
+                outer_future.set_exception(err)
+                return
+        except concurrent.futures.InvalidStateError:
+            # Cancelled by the caller after the check above
+            return
+
+        # The worker is released while waiting, the attempt is resubmitted once the delay passes
+        logger.info("#" + str(threading.get_ident()) + "#   " + "Scheduling retry " + str(attempt_info["failed_counter"]) + " of " + func.__name__ + " in " + str(retry_failure_delay) + " seconds")
+        schedule_retry(retry_failure_delay, submit_attempt)
+
+    def submit_attempt():
+        if outer_future.cancelled():
+            return
+        try:
+            executor.submit(run_deferred_retry_call, func, args, attempt_info["failed_counter"]).add_done_callback(attempt_done)
+        except Exception as err:
+            try:
+                outer_future.set_exception(err)
+            except concurrent.futures.InvalidStateError:
+                pass
+
+    submit_attempt()
+    return outer_future
+
+def uncomment_hidden_tables(text):
+    # Reference sites ship most secondary tables inside HTML comments, unwrap them once so a single parse exposes every table
+    parts = []
+    position = 0
+    while True:
+        comment_start = text.find(b"<!--", position)
+        if comment_start == -1:
+            break
+        comment_end = text.find(b"-->", comment_start + 4)
+        if comment_end == -1:
+            break
+        parts.append(text[position:comment_start])
+        comment = text[comment_start + 4:comment_end]
+        if b"<table" in comment:
+            parts.append(comment)
+        else:
+            parts.append(text[comment_start:comment_end + 3])
+        position = comment_end + 3
+    parts.append(text[position:])
+    return b"".join(parts)
+
 def url_request(url, timeout=30, retry_403=True):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.hockey-reference.com", gateway)
+    gateway_session = get_gateway_session("https://www.hockey-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
-            text = response.content
+            text = uncomment_hidden_tables(response.content)
 
             bs = BeautifulSoup(text, "lxml")
             if not bs.contents:
@@ -15207,15 +15492,15 @@ def url_request(url, timeout=30, retry_403=True):
                     return url_request(rebuilt_url, timeout=timeout, retry_403=False)
                 else:
                     failed_counter += 1
-                    if failed_counter > max_request_retries:
+                    if failed_counter > get_request_retries():
                         raise
             else:
                 failed_counter += 1
-                if failed_counter > max_request_retries:
+                if failed_counter > get_request_retries():
                     raise
         except Exception as e:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
         
         delay_step = 10
@@ -15227,10 +15512,11 @@ def url_request(url, timeout=30, retry_403=True):
         logger.info("#" + str(threading.get_ident()) + "#   " + "0")
 
 def url_request_lxml(session, url, timeout=2):
+    timeout = get_request_timeout(timeout)
     failed_counter = 0
     while(True):
         try:
-            response = session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             bs = lxml.html.document_fromstring(response.content)
             if not bs:
@@ -15238,7 +15524,7 @@ def url_request_lxml(session, url, timeout=2):
             return response, bs
         except Exception:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
         
         delay_step = 10
@@ -15253,13 +15539,88 @@ def url_request_lxml(session, url, timeout=2):
             logger.info("#" + str(threading.get_ident()) + "#   " + "Last retry, will use a timeout of 10 seconds")
             timeout = 10
 
+def connect_html_report_cache():
+    conn = sqlite3.connect(html_report_cache_db, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS html_reports (url TEXT PRIMARY KEY, game_id INTEGER NOT NULL, report BLOB, timestamp INTEGER NOT NULL);")
+    conn.execute("CREATE INDEX IF NOT EXISTS html_reports_game ON html_reports (game_id);")
+    return conn
+
+def get_cached_html_report(url):
+    conn = connect_html_report_cache()
+    try:
+        row = conn.execute("SELECT report, timestamp FROM html_reports WHERE url = ?;", (url, )).fetchone()
+    finally:
+        conn.close()
+
+    if row:
+        if row[0]:
+            return True, zlib.decompress(row[0])
+        elif time.time() - row[1] < html_report_missing_expiry:
+            return True, None
+    return False, None
+
+def store_cached_html_report(url, game_id, content):
+    report = zlib.compress(content) if content else None
+    conn = connect_html_report_cache()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO html_reports (url, game_id, report, timestamp) VALUES (?, ?, ?, ?);", (url, int(game_id), report, int(time.time())))
+    finally:
+        conn.close()
+
+def url_request_html_report(session, url, game_id, is_final, game_date):
+    # Reports can still be corrected shortly after a game ends, only cache once the game has settled. A missing report is stored empty and retried once it expires
+    if not use_html_report_cache or not is_final or game_date > datetime.date.today() - datetime.timedelta(days=html_report_settle_days):
+        return url_request_lxml(session, url)
+
+    has_report, report = get_cached_html_report(url)
+    if has_report:
+        if not report:
+            return None, None
+        return None, lxml.html.document_fromstring(report)
+
+    try:
+        response, player_page_xml = url_request_lxml(session, url)
+    except requests.exceptions.HTTPError as err:
+        if err.response is not None and err.response.status_code == 404:
+            store_cached_html_report(url, game_id, None)
+        raise
+
+    store_cached_html_report(url, game_id, response.content)
+    return response, player_page_xml
+
+def backfill_html_reports(season):
+    s = requests.Session()
+    sub_data = url_request_json(s, nhl_season_schedule_url_format.format(season))
+    for date in sub_data["dates"]:
+        for game in date["games"]:
+            if game["status"]["abstractGameState"] != "Final":
+                continue
+
+            game_id = str(game["gamePk"])
+            sub_year = int(game_id[:4])
+            year_str = str(sub_year)
+            year_str += str(sub_year + 1)
+            report_urls = [
+                nhl_html_plays_report_format.format(year_str, game_id[4:]),
+                nhl_html_summary_report_format.format(year_str, game_id[4:]),
+                nhl_html_shifts_report_format.format(year_str, "H", game_id[4:]),
+                nhl_html_shifts_report_format.format(year_str, "V", game_id[4:])
+            ]
+            for report_url in report_urls:
+                try:
+                    url_request_html_report(s, report_url, game["gamePk"], True, dateutil.parser.parse(game["gameDate"]).date())
+                except requests.exceptions.HTTPError as err:
+                    if err.response is None or err.response.status_code != 404:
+                        raise
+            logger.info("#" + str(threading.get_ident()) + "#   " + "Backfilled HTML reports for game " + game_id)
+
 def url_request_lxml_href(url, timeout=2):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.hockey-reference.com", gateway)
+    gateway_session = get_gateway_session("https://www.hockey-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             bs = lxml.html.document_fromstring(response.content)
             if not bs:
@@ -15309,12 +15670,11 @@ def url_request_lxml_href(url, timeout=2):
             timeout = 10
 
 def url_request_bytes(url, timeout=30):
-    gateway_session = requests.Session()
-    gateway_session.mount("https://www.hockey-reference.com", gateway)
+    gateway_session = get_gateway_session("https://www.hockey-reference.com")
     failed_counter = 0
     while(True):
         try:
-            response = gateway_session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(gateway_session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             return response.content
         except requests.exceptions.HTTPError as e:
@@ -15348,15 +15708,16 @@ def url_request_bytes(url, timeout=30):
         logger.info("#" + str(threading.get_ident()) + "#   " + "0")
 
 def url_request_json(session, url, timeout=2):
+    timeout = get_request_timeout(timeout)
     failed_counter = 0
     while(True):
         try:
-            response = session.get(url, timeout=timeout, headers=request_headers)
+            response = rate_limited_get(session, url, timeout=timeout, headers=request_headers)
             response.raise_for_status()
             return json.loads(response.content)
         except Exception:
             failed_counter += 1
-            if failed_counter > max_request_retries:
+            if failed_counter > get_request_retries():
                 raise
 
         logger.info("#" + str(threading.get_ident()) + "#   " + "Retrying to allow request to " + url + " to chill")
@@ -19097,16 +19458,6 @@ def handle_hat_tricks(player_page, all_rows):
     table_name = "hat_tricks"
     
     table = player_page.find("table", id=table_name)
-    comments = None
-    if not table:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_table = temp_soup.find("table", id=table_name)
-            if temp_table:
-                table = temp_table
-                break
 
     if table:
         standard_table_rows = table.find("tbody").find_all("tr")
@@ -19132,16 +19483,6 @@ def handle_playoff_ot_goals(player_page, all_rows, is_game):
     table_name = "playoff_ot_goals"
     
     table = player_page.find("table", id=table_name)
-    comments = None
-    if not table:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_table = temp_soup.find("table", id=table_name)
-            if temp_table:
-                table = temp_table
-                break
 
     if table:
         standard_table_rows = table.find("tbody").find_all("tr")
@@ -19173,18 +19514,8 @@ def handle_season_only_stats(player_page, player_data, player_type, time_frame,
         table_names = ["stats_misc_plus_nhl", "skaters_advanced_ev"]
     else:
         table_names = ["stats_goalie_situational"]
-    comments = None
     for table_index, table_name in enumerate(table_names):
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             tables.append(table)
@@ -20826,14 +21157,6 @@ def get_opponent_schedule(seasons):
         
         conf_winners = set()
         table = player_page.find("table", id="all_playoffs")
-        if not table:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id="all_playoffs")
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find("tbody").find_all("tr")
@@ -20853,19 +21176,9 @@ def get_opponent_schedule(seasons):
         all_goals_diff = []
         all_rank = []
 
-        comments = None
         for table_name in table_names:
             table = player_page.find("table", id=table_name)
 
-            if not table:
-                if not comments:
-                    comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_table = temp_soup.find("table", id=table_name)
-                    if temp_table:
-                        table = temp_table
-                        break
             
             if not table:
                 continue
@@ -21609,15 +21922,22 @@ def get_nhl_game_schedule(player_data, all_rows, games_to_skip, player_link, pla
     #     "penalties" : {"type" : set(), "sev" : set()}
     # }
 
+    shift_prefetch = create_shift_prefetch([row_data["NHLGameLink"] for row_data in all_rows if row_data["NHLGameLink"] and row_data["NHLGameLink"] not in games_to_skip and row_data["Year"] >= 2007])
+
+    game_futures = []
     with ThreadPoolExecutor(max_workers=5) as sub_executor:
         for index, row_data in enumerate(all_rows):
             if row_data["NHLGameLink"]:
                 if row_data["NHLGameLink"] not in games_to_skip:
-                    future = sub_executor.submit(get_game_data, index, player_data, row_data, player_id, player_type, time_frame, extra_stats, s)
+                    future = submit_retrying(sub_executor, get_game_data, index, player_data, row_data, player_id, player_type, time_frame, extra_stats, s, shift_prefetch)
                     future.add_done_callback(functools.partial(result_call_back, time_frame, count_info, new_rows, player_type, player_data, player_link, row_data, extra_stats, index))
+                    game_futures.append(future)
             else:
                 count_info["missing_games"].append("[" + str(row_data["Date"]) + "](" + "https://www.nhl.com/gamecenter/" + str(row_data["NHLGameLink"]) + ")")
 
+        # A game waiting on a retry holds no worker, so the pool is only shut down once every game has finished
+        concurrent.futures.wait(game_futures)
+
     # profile = cProfile.Profile()
     # profile.enable()
     # for index, row_data in enumerate(all_rows):
@@ -21753,14 +22073,17 @@ def get_nhl_game_schedule_single_thread(player_data, all_rows, games_to_skip, pl
 
     is_reverse = "Event Stat Reversed" in time_frame["qualifiers"] or "Starting Event Stat Reversed" in time_frame["qualifiers"]
 
-    for index, row_data in enumerate(sorted(all_rows, key=lambda row: row["Date"], reverse=is_reverse)):
+    sorted_rows = sorted(all_rows, key=lambda row: row["Date"], reverse=is_reverse)
+    shift_prefetch = create_shift_prefetch([row_data["NHLGameLink"] for row_data in sorted_rows if row_data["NHLGameLink"] not in games_to_skip and row_data["Year"] >= 2007])
+
+    for index, row_data in enumerate(sorted_rows):
         if row_data["NHLGameLink"] not in games_to_skip:
             try:
-                game_data, row_data, sub_missing_games = get_game_data(index, player_data, row_data, player_id, player_type, time_frame, extra_stats, s)
+                game_data, row_data, sub_missing_games = get_game_data(index, player_data, row_data, player_id, player_type, time_frame, extra_stats, s, shift_prefetch)
                 has_match, raw_row_data = handle_result_qualifiers(game_data, row_data, sub_missing_games, time_frame, index, saved_row_data, count_info, player_type, player_data, player_link, extra_stats)
                 if not has_match:
                     continue
-                
+            
                 hit_end = False
                 hit_start = False
                 if og_stats_needed_length:
@@ -21787,7 +22110,7 @@ def get_nhl_game_schedule_single_thread(player_data, all_rows, games_to_skip, pl
                                     hit_end = True
 
                         saved_row_data[stat] += raw_row_data[stat]
-                    
+                
                         if stat in event_stats_needed:
                             saved_row_data["career_stat_" + stat] = saved_row_data[stat]
                             if event_stats_negate:
@@ -23364,7 +23687,12 @@ def is_player_on_ice(player_shift_data, team_on_ice, opp_on_ice, period, period_
         period_time += 1
 
     team_str = "team" if is_team else "opp"
-    return player_id in player_shift_data[team_str] and period in player_shift_data[team_str][player_id] and period_time in player_shift_data[team_str][player_id][period]
+    if player_id not in player_shift_data[team_str] or period not in player_shift_data[team_str][player_id]:
+        return False
+
+    intervals = player_shift_data[team_str][player_id][period]
+    interval_index = bisect.bisect_right(intervals, [period_time, math.inf]) - 1
+    return interval_index >= 0 and intervals[interval_index][1] >= period_time
 
 def set_row_data(player_game_info, row_data):
     if not player_game_info:
@@ -23391,7 +23719,7 @@ def set_row_data(player_game_info, row_data):
     row_data["is_href_stats"] = player_game_info["is_href_stats"]
     row_data["is_toi_stats"] = player_game_info["is_toi_stats"]
 
-def get_game_data(index, player_data, row_data, player_id, player_type, time_frame, extra_stats, s):
+def get_game_data(index, player_data, row_data, player_id, player_type, time_frame, extra_stats, s, shift_prefetch=None):
     game_data, missing_games, all_plays = setup_game_data(player_data, row_data, player_id, player_type, time_frame, extra_stats, s)
 
     if not "current-stats" in extra_stats:
@@ -23609,20 +23937,16 @@ def get_game_data(index, player_data, row_data, player_id, player_type, time_fra
     game_data["scoring_play_data"] = scoring_play_data
     
     if row_data["Year"] >= 2007 and "hide-toi" not in extra_stats:
-        game_data["shift_data"], game_data["player_shift_data"], game_data["num_on_ice_data"] = get_html_shift_data(row_data["NHLGameLink"], row_data["Location"], game_data, player_data, row_data["Year"], s)
+        game_data["shift_data"] = get_html_shift_data(row_data["NHLGameLink"], row_data["Location"], game_data, player_data, row_data["Year"], s)
 
         if game_data["shift_data"]:
             if not has_period_shift_event(game_data, game_data["shift_data"]):
                 game_data["shift_data"] = {} 
-                game_data["player_shift_data"] = {}
-                game_data["num_on_ice_data"] = {}
 
         if not game_data["shift_data"] and game_data["is_final"]:
-            game_data["shift_data"], game_data["player_shift_data"], game_data["num_on_ice_data"] = get_shift_data(game_data, row_data["NHLGameLink"], game_data["team_id"], s)
+            game_data["shift_data"] = get_shift_data(game_data, row_data["NHLGameLink"], game_data["team_id"], s, shift_prefetch)
             if not has_period_shift_event(game_data, game_data["shift_data"]):
                 game_data["shift_data"] = {} 
-                game_data["player_shift_data"] = {}
-                game_data["num_on_ice_data"] = {}
 
         if not game_data["shift_data"]:
             game_data["missing_toi"] = True
@@ -23631,109 +23955,23 @@ def get_game_data(index, player_data, row_data, player_id, player_type, time_fra
             game_data["is_toi_stats"] = True
 
             if not game_data["is_final"] and game_data["current_period"] == 1:
-                for player in game_data["raw_team_players"]:
-                    player = game_data["raw_team_players"][player]
-                    stat_str = "goalieStats" if player["position"]["code"] == "G" else "skaterStats"
-                    if stat_str in player["stats"] and player["person"]["id"] not in game_data["shift_data"]["team"]:
-                        time_end = start_time_to_str(player["stats"][stat_str]["timeOnIce"])
-                        if time_end:
-                            if "team" not in game_data["shift_data"]:
-                                game_data["shift_data"]["team"] = {}
-                            if player["person"]["id"] not in game_data["shift_data"]["team"]:
-                                game_data["shift_data"]["team"][player["person"]["id"]] = {}
-                                game_data["player_shift_data"]["team"][player["person"]["id"]] = {}
-                            if 1 not in game_data["num_on_ice_data"]:
-                                game_data["num_on_ice_data"][1] = {}
-
-                            game_data["shift_data"]["team"][player["person"]["id"]][1] = [{
-                                "time_start" : 1,
-                                "time_end" : time_end,
-                                "period" : 1
-                            }]
-
-                            if 1 in game_data["player_shift_data"]["team"][player["person"]["id"]]:
-                                for second in game_data["player_shift_data"]["team"][player["person"]["id"]][1]:
-                                    if second not in game_data["num_on_ice_data"][1]:
-                                        game_data["num_on_ice_data"][1][second] = {
-                                            "team_goalies" : 0,
-                                            "team_skaters" : 0,
-                                            "opp_goalies" : 0,
-                                            "opp_skaters" : 0
-                                        }
-
-                                    if player["person"]["id"] in game_data["team_goalies"]:
-                                        game_data["num_on_ice_data"][1][second]["team_goalies"] -= 1
-                                    else:
-                                        game_data["num_on_ice_data"][1][second]["team_skaters"] -= 1
-
-                            game_data["player_shift_data"]["team"][player["person"]["id"]][1] = set()
-                            for second in range(1, time_end + 1):
-                                game_data["player_shift_data"]["team"][player["person"]["id"]][1].add(second)
-
-                                if second not in game_data["num_on_ice_data"][1]:
-                                    game_data["num_on_ice_data"][1][second] = {
-                                        "team_goalies" : 0,
-                                        "team_skaters" : 0,
-                                        "opp_goalies" : 0,
-                                        "opp_skaters" : 0
-                                    }
-
-                                if player["person"]["id"] in game_data["team_goalies"]:
-                                    game_data["num_on_ice_data"][1][second]["team_goalies"] += 1
-                                else:
-                                    game_data["num_on_ice_data"][1][second]["team_skaters"] += 1
-                
-                for player in game_data["raw_opp_players"]:
-                    player = game_data["raw_opp_players"][player]
-                    stat_str = "goalieStats" if player["position"]["code"] == "G" else "skaterStats"
-                    if stat_str in player["stats"] and player["person"]["id"] not in game_data["shift_data"]["opp"]:
-                        time_end = start_time_to_str(player["stats"][stat_str]["timeOnIce"])
-                        if time_end:
-                            if "opp" not in game_data["shift_data"]:
-                                game_data["shift_data"]["opp"] = {}
-                            if player["person"]["id"] not in game_data["shift_data"]["opp"]:
-                                game_data["shift_data"]["opp"][player["person"]["id"]] = {}
-                                game_data["player_shift_data"]["opp"][player["person"]["id"]] = {}
-                            if 1 not in game_data["num_on_ice_data"]:
-                                game_data["num_on_ice_data"][1] = {}
-
-                            game_data["shift_data"]["opp"][player["person"]["id"]][1] = [{
-                                "time_start" : 1,
-                                "time_end" : time_end,
-                                "period" : 1
-                            }]
-
-                            if 1 in game_data["player_shift_data"]["opp"][player["person"]["id"]]:
-                                for second in game_data["player_shift_data"]["opp"][player["person"]["id"]][1]:
-                                    if second not in game_data["num_on_ice_data"][1]:
-                                        game_data["num_on_ice_data"][1][second] = {
-                                            "team_goalies" : 0,
-                                            "team_skaters" : 0,
-                                            "opp_goalies" : 0,
-                                            "opp_skaters" : 0
-                                        }
-
-                                    if player["person"]["id"] in game_data["opp_goalies"]:
-                                        game_data["num_on_ice_data"][1][second]["opp_goalies"] -= 1
-                                    else:
-                                        game_data["num_on_ice_data"][1][second]["opp_skaters"] -= 1
-
-                            game_data["player_shift_data"]["opp"][player["person"]["id"]][1] = set()
-                            for second in range(1, time_end + 1):
-                                game_data["player_shift_data"]["opp"][player["person"]["id"]][1].add(second)
-
-                                if second not in game_data["num_on_ice_data"][1]:
-                                    game_data["num_on_ice_data"][1][second] = {
-                                        "team_goalies" : 0,
-                                        "team_skaters" : 0,
-                                        "opp_goalies" : 0,
-                                        "opp_skaters" : 0
-                                    }
+                for team_str, raw_players_str in (("team", "raw_team_players"), ("opp", "raw_opp_players")):
+                    for player in game_data[raw_players_str]:
+                        player = game_data[raw_players_str][player]
+                        stat_str = "goalieStats" if player["position"]["code"] == "G" else "skaterStats"
+                        if stat_str in player["stats"] and player["person"]["id"] not in game_data["shift_data"][team_str]:
+                            time_end = start_time_to_str(player["stats"][stat_str]["timeOnIce"])
+                            if time_end:
+                                game_data["shift_data"][team_str][player["person"]["id"]] = {
+                                    1 : [{
+                                        "time_start" : 1,
+                                        "time_end" : time_end,
+                                        "period" : 1
+                                    }]
+                                }
 
-                                if player["person"]["id"] in game_data["opp_goalies"]:
-                                    game_data["num_on_ice_data"][1][second]["opp_goalies"] += 1
-                                else:
-                                    game_data["num_on_ice_data"][1][second]["opp_skaters"] += 1
+            game_data["player_shift_data"] = get_shift_intervals(game_data["shift_data"])
+            game_data["strength_timeline"] = get_strength_timeline(game_data["player_shift_data"], game_data)
 
     if (not game_data["is_older_html_stats"] or game_data["is_api_stats"]) and not game_data["is_toi_stats"] and has_shift_quals(time_frame["qualifiers"]):
         missing_games = True
@@ -24410,7 +24648,7 @@ def get_game_data(index, player_data, row_data, player_id, player_type, time_fra
         game_data["all_plays"].append(scoring_play)
 
     shift_data = game_data["shift_data"]
-    if shift_data and player_id in shift_data["team"]:
+    if shift_data and player_id in shift_data["team"] and needs_shift_events(time_frame["qualifiers"], game_data, extra_stats):
         shift_index = 1
         for period in shift_data["team"][player_id]:
             for shift_event in shift_data["team"][player_id][period]:
@@ -24771,7 +25009,7 @@ def setup_game_data(player_data, row_data, player_id, player_type, time_frame, e
         "period_length" : {},
         "shift_data" : {},
         "player_shift_data" : {},
-        "num_on_ice_data" : {},
+        "strength_timeline" : {},
         "all_events" : {},
         "shift_events" : [],
         "all_shift_events" : [],
@@ -25001,7 +25239,7 @@ def get_html_game_stats(game_data, missing_games, row_data, s):
         year_str = str(sub_year)
         year_str += str(sub_year + 1)
         game_id = game_id[4:]
-        response, player_page_xml = url_request_lxml(s, nhl_html_summary_report_format.format(year_str, game_id))
+        response, player_page_xml = url_request_html_report(s, nhl_html_summary_report_format.format(year_str, game_id), row_data["NHLGameLink"], game_data["is_final"], game_data["Date"])
     except requests.exceptions.HTTPError as err:
         if err.response.status_code == 404:
             missing_games = True
@@ -25133,7 +25371,7 @@ def setup_href_game_data(player_data, row_data, player_id, player_type, time_fra
         "period_length" : {},
         "shift_data" : {},
         "player_shift_data" : {},
-        "num_on_ice_data" : {},
+        "strength_timeline" : {},
         "all_events" : {},
         "shift_events" : [],
         "all_shift_events" : [],
@@ -25319,15 +25557,86 @@ def seconds_to_str(value):
     minutes, seconds = divmod(round_value(value), 60)
     return ("{:02d}").format(minutes) + ":" + ("{:02d}").format(seconds)
 
-def get_shift_data(game_data, game_id, player_team_id, s):
-    sub_data = url_request_json(s, nhl_shifts_report_format.format(game_id))
-    if sub_data["total"] == 1000:
-        return {}, {}, {}
-    shift_infos = sub_data["data"]
+def get_shift_infos(game_ids, s):
+    if len(game_ids) == 1:
+        cayenne_exp = "gameId=" + str(game_ids[0])
+    else:
+        cayenne_exp = "gameId in (" + ",".join(str(game_id) for game_id in game_ids) + ")"
+
+    shift_infos = {game_id : [] for game_id in game_ids}
+    seen_shift_ids = set()
+    start = 0
+    while True:
+        # Paging needs a stable order or rows can shift between pages and be skipped
+        sub_data = url_request_json(s, nhl_shifts_report_format.format(urllib.parse.quote(cayenne_exp), urllib.parse.quote("[{\"property\":\"id\",\"direction\":\"ASC\"}]"), start, shift_chart_page_limit))
+        for shift_info in sub_data["data"]:
+            if "id" in shift_info:
+                if shift_info["id"] in seen_shift_ids:
+                    continue
+                seen_shift_ids.add(shift_info["id"])
+            if shift_info["gameId"] not in shift_infos:
+                shift_infos[shift_info["gameId"]] = []
+            shift_infos[shift_info["gameId"]].append(shift_info)
+
+        start += len(sub_data["data"])
+        if not sub_data["data"] or start >= sub_data["total"]:
+            break
+    return shift_infos
+
+def create_shift_prefetch(game_ids):
+    return {
+        "game_ids" : [int(game_id) for game_id in game_ids],
+        "positions" : {int(game_id) : index for index, game_id in enumerate(game_ids)},
+        "requested" : set(),
+        "futures" : {},
+        "lock" : threading.Lock()
+    }
+
+def get_game_shift_infos(game_id, s, shift_prefetch=None):
+    # The first game of a request that falls through to shiftcharts also fetches the next games of its season in the same request, the other workers wait on that batch
+    game_id = int(game_id)
+    if not shift_prefetch or game_id not in shift_prefetch["positions"]:
+        return get_shift_infos([game_id], s)[game_id]
+
+    batch_futures = {}
+    with shift_prefetch["lock"]:
+        future = shift_prefetch["futures"].get(game_id)
+        if not future and game_id not in shift_prefetch["requested"]:
+            for pending_game_id in shift_prefetch["game_ids"][shift_prefetch["positions"][game_id]:]:
+                if len(batch_futures) >= shift_chart_batch_size:
+                    break
+                if pending_game_id // 1000000 == game_id // 1000000 and pending_game_id not in shift_prefetch["requested"]:
+                    batch_futures[pending_game_id] = concurrent.futures.Future()
+            shift_prefetch["requested"].update(batch_futures)
+            shift_prefetch["futures"].update(batch_futures)
+            future = batch_futures[game_id]
+
+    if batch_futures:
+        try:
+            shift_infos = get_shift_infos(list(batch_futures), s)
+        except Exception as err:
+            # Games only riding along fetch themselves instead of inheriting this failure
+            for sub_game_id in batch_futures:
+                if sub_game_id != game_id:
+                    batch_futures[sub_game_id].set_result(None)
+            future.set_exception(err)
+        else:
+            for sub_game_id in batch_futures:
+                batch_futures[sub_game_id].set_result(shift_infos[sub_game_id])
+
+    try:
+        game_shift_infos = future.result() if future else None
+    finally:
+        with shift_prefetch["lock"]:
+            shift_prefetch["futures"].pop(game_id, None)
+    if game_shift_infos == None:
+        game_shift_infos = get_shift_infos([game_id], s)[game_id]
+    return game_shift_infos
+
+def get_shift_data(game_data, game_id, player_team_id, s, shift_prefetch=None):
+    shift_infos = get_game_shift_infos(game_id, s, shift_prefetch)
     shift_infos = sorted(shift_infos, key = lambda shift_info: (shift_info["period"], start_time_to_str(shift_info["startTime"])))
     shift_data = {}
-    player_shift_data = {}
-    num_on_ice_data = {}
     for shift_info in shift_infos:
         player_id = shift_info["playerId"]
         period = shift_info["period"]
@@ -25348,17 +25657,12 @@ def get_shift_data(game_data, game_id, player_team_id, s):
 
         if team_str not in shift_data:
             shift_data[team_str] = {}
-            player_shift_data[team_str] = {}
         if player_id not in shift_data[team_str]:
             shift_data[team_str][player_id] = {}
-            player_shift_data[team_str][player_id] = {}
         if period not in shift_data[team_str][player_id]:
             shift_data[team_str][player_id][period] = []
-            player_shift_data[team_str][player_id][period] = set()
-        if period not in num_on_ice_data:
-            num_on_ice_data[period] = {}
 
-        if time_start in player_shift_data[team_str][player_id][period]:
+        if is_shift_time_covered(shift_data[team_str][player_id][period], time_start):
             continue
 
         shift_data[team_str][player_id][period].append({
@@ -25367,36 +25671,135 @@ def get_shift_data(game_data, game_id, player_team_id, s):
             "period" : period
         })
 
-        for second in range(time_start, time_end + 1):
-            player_shift_data[team_str][player_id][period].add(second)
+    return shift_data
 
-            if second not in num_on_ice_data[period]:
-                num_on_ice_data[period][second] = {
-                    "team_goalies" : 0,
-                    "team_skaters" : 0,
-                    "opp_goalies" : 0,
-                    "opp_skaters" : 0
-                }
+def is_shift_time_covered(shifts, second):
+    for shift in shifts:
+        if shift["time_start"] <= second <= shift["time_end"]:
+            return True
+    return False
 
-            if team_str == "team":
-                if player_id in game_data["team_goalies"]:
-                    num_on_ice_data[period][second]["team_goalies"] += 1
-                else:
-                    num_on_ice_data[period][second]["team_skaters"] += 1
+def get_shift_intervals(shift_data):
+    player_shift_data = {}
+    for team_str in shift_data:
+        player_shift_data[team_str] = {}
+        for player_id in shift_data[team_str]:
+            player_shift_data[team_str][player_id] = {}
+            for period in shift_data[team_str][player_id]:
+                intervals = []
+                for shift in sorted(shift_data[team_str][player_id][period], key=lambda shift: shift["time_start"]):
+                    if shift["time_end"] < shift["time_start"]:
+                        continue
+                    if intervals and shift["time_start"] <= intervals[-1][1] + 1:
+                        intervals[-1][1] = max(intervals[-1][1], shift["time_end"])
+                    else:
+                        intervals.append([shift["time_start"], shift["time_end"]])
+                player_shift_data[team_str][player_id][period] = intervals
+    return player_shift_data
+
+def get_strength_timeline(player_shift_data, game_data):
+    period_intervals = {}
+    for team_str in player_shift_data:
+        for player_id in player_shift_data[team_str]:
+            count_index = (0 if team_str == "team" else 2) + (1 if player_id in game_data[team_str + "_goalies"] else 0)
+            for period in player_shift_data[team_str][player_id]:
+                if period not in period_intervals:
+                    period_intervals[period] = []
+                for interval_start, interval_end in player_shift_data[team_str][player_id][period]:
+                    if interval_end >= 0:
+                        period_intervals[period].append((count_index, max(interval_start, 0), interval_end))
+
+    strength_timeline = {}
+    for period in period_intervals:
+        max_second = max([interval_end for count_index, interval_start, interval_end in period_intervals[period]] + [0])
+        count_changes = numpy.zeros((max_second + 2, 4), dtype=numpy.int16)
+        for count_index, interval_start, interval_end in period_intervals[period]:
+            count_changes[interval_start, count_index] += 1
+            count_changes[interval_end + 1, count_index] -= 1
+        counts = numpy.cumsum(count_changes[:-1], axis=0).astype(numpy.int8)
+
+        team_players = counts[:, 0].astype(numpy.int16) + counts[:, 1]
+        opp_players = counts[:, 2].astype(numpy.int16) + counts[:, 3]
+        strengths = (numpy.sign(team_players - opp_players) + 1).astype(numpy.int8)
+        is_five = numpy.all(counts == numpy.array([5, 1, 5, 1], dtype=numpy.int8), axis=1)
+        strength_timeline[period] = {
+            "counts" : counts,
+            "strengths" : strengths,
+            "is_five" : is_five,
+            "counts_list" : counts.tolist(),
+            "strength_list" : strengths.tolist(),
+            "is_five_list" : is_five.tolist()
+        }
+    return strength_timeline
+
+def get_timeline_strength(player_game_info, goal_event, period, second):
+    if not player_game_info.get("strength_timeline"):
+        return None
+    if goal_event.get("team_on_ice") or goal_event.get("opp_on_ice") or goal_event.get("emptyNet"):
+        return None
+
+    if period in player_game_info["strength_timeline"]:
+        period_timeline = player_game_info["strength_timeline"][period]
+        if 0 <= second < len(period_timeline["strength_list"]):
+            return strength_labels[period_timeline["strength_list"][second]], period_timeline["is_five_list"][second]
+    return "EV", False
+
+def get_timeline_shift_strengths(strength_timeline, period, time_start, time_end, shift_mask=None):
+    # Seconds past the end of the timeline have nobody recorded on ice, which counts as even strength
+    strengths = numpy.ones(time_end - time_start + 1, dtype=numpy.int8)
+    is_five = numpy.zeros(time_end - time_start + 1, dtype=bool)
+    if period in strength_timeline:
+        period_timeline = strength_timeline[period]
+        sub_strengths = period_timeline["strengths"][max(time_start, 0):time_end + 1]
+        offset = max(time_start, 0) - time_start
+        strengths[offset:offset + len(sub_strengths)] = sub_strengths
+        is_five[offset:offset + len(sub_strengths)] = period_timeline["is_five"][max(time_start, 0):time_end + 1]
+
+    if shift_mask is not None:
+        strengths = strengths[shift_mask]
+        is_five = is_five[shift_mask]
+    return numpy.bincount(strengths, minlength=3).tolist(), int(numpy.count_nonzero(is_five))
+
+def has_qual_player_game(qual_object, row):
+    for player in qual_object["values"]:
+        if row["Tm"].lower() in player["games"] and row["NHLGameLink"] in player["games"][row["Tm"].lower()]:
+            return True
+    return False
+
+def get_on_ice_qual_mask(qualifiers, player_game_info, row, period, mask_length):
+    mask = numpy.ones(mask_length, dtype=bool)
+    for qual_str, team_str in (("On Ice With", "team"), ("On Ice Against", "opp")):
+        if qual_str not in qualifiers:
+            continue
+
+        team_intervals = player_game_info["player_shift_data"][team_str] if team_str in player_game_info["player_shift_data"] else {}
+        for qual_object in qualifiers[qual_str]:
+            if not qual_object["negate"] and not has_qual_player_game(qual_object, row):
+                mask[:] = False
+                return mask
+
+            on_ice = numpy.zeros(mask_length, dtype=bool)
+            for player in qual_object["values"]:
+                if player["nhl_id"] in team_intervals and period in team_intervals[player["nhl_id"]]:
+                    for interval_start, interval_end in team_intervals[player["nhl_id"]][period]:
+                        on_ice[max(interval_start, 0):interval_end + 1] = True
+
+            if qual_object["negate"]:
+                mask &= ~on_ice
             else:
-                if player_id in game_data["opp_goalies"]:
-                    num_on_ice_data[period][second]["opp_goalies"] += 1
-                else:
-                    num_on_ice_data[period][second]["opp_skaters"] += 1
+                mask &= on_ice
+    return mask
 
-    return shift_data, player_shift_data, num_on_ice_data
+def get_interval_overlap(intervals, time_start, time_end):
+    overlap = 0
+    for interval_start, interval_end in intervals:
+        overlap += max(min(time_end, interval_end) - max(time_start, interval_start) + 1, 0)
+    return overlap
 
 def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s):
     # profile = cProfile.Profile()
     # profile.enable()
     shift_data = {}
-    player_shift_data = {}
-    num_on_ice_data = {}
     for team_str in ("H", "V"):
         try:
             game_id = str(og_game_id)
@@ -25404,21 +25807,21 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
             year_str = str(sub_year)
             year_str += str(sub_year + 1)
             game_id = game_id[4:]
-            response, player_page_xml = url_request_lxml(s, nhl_html_shifts_report_format.format(year_str, team_str, game_id))
+            response, player_page_xml = url_request_html_report(s, nhl_html_shifts_report_format.format(year_str, team_str, game_id), og_game_id, game_data["is_final"], game_data["Date"])
         except requests.exceptions.HTTPError as err:
             if err.response.status_code == 404:
-                return {}, {}, {}
+                return {}
             else:
                 raise
         
         if not player_page_xml:
-            return {}, {}, {}
+            return {}
 
         period_length_obj = game_data["period_length"]
 
         game_info_table = player_page_xml.xpath("body//table[@id = 'GameInfo']")
         if not game_info_table:
-            return {}, {}, {}
+            return {}
 
         game_info_table_rows = []
         game_info_table = game_info_table[0]
@@ -25432,7 +25835,7 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                 if game_info_match:
                     pot_game_id = str(game_info_match.group(1))
                     if pot_game_id != game_id[2:]:
-                        return {}, {}, {}
+                        return {}
                 else:
                     try:
                         pot_date = dateutil.parser.parse(game_info_row_text)
@@ -25440,7 +25843,7 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                         if pot_date.month <= 8 or game_data["is_playoffs"]:
                             pot_year -= 1
                         if pot_year != row_year:
-                            return {}, {}, {}
+                            return {}
                     except Exception:
                         try:
                             game_info_row_text_split = game_info_row_text.split("/")
@@ -25450,7 +25853,7 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                                 if pot_date.month <= 8 or game_data["is_playoffs"]:
                                     pot_year -= 1
                                 if pot_year != row_year:
-                                    return {}, {}, {}
+                                    return {}
                         except Exception:
                             pass
             
@@ -25516,43 +25919,16 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                                 crazy_period = period + 1
                                 if team_str not in shift_data:
                                     shift_data[team_str] = {}
-                                    player_shift_data[team_str] = {}
                                 if current_player_id not in shift_data[team_str]:
                                     shift_data[team_str][current_player_id] = {}
-                                    player_shift_data[team_str][current_player_id] = {}
                                 if crazy_period not in shift_data[team_str][current_player_id]:
                                     shift_data[team_str][current_player_id][crazy_period] = []
-                                    player_shift_data[team_str][current_player_id][crazy_period] = set()
-                                if crazy_period not in num_on_ice_data:
-                                    num_on_ice_data[crazy_period] = {}
 
                                 shift_data[team_str][current_player_id][crazy_period].append({
                                     "time_start" : 1,
                                     "time_end" : time_end,
                                     "period" : crazy_period
                                 })
-
-                                for second in range(1, time_end + 1):
-                                    player_shift_data[team_str][current_player_id][crazy_period].add(second)
-
-                                    if second not in num_on_ice_data[crazy_period]:
-                                        num_on_ice_data[crazy_period][second] = {
-                                            "team_goalies" : 0,
-                                            "team_skaters" : 0,
-                                            "opp_goalies" : 0,
-                                            "opp_skaters" : 0
-                                        }
-
-                                    if team_str == "team":
-                                        if current_player_id in game_data["team_goalies"]:
-                                            num_on_ice_data[crazy_period][second]["team_goalies"] += 1
-                                        else:
-                                            num_on_ice_data[crazy_period][second]["team_skaters"] += 1
-                                    else:
-                                        if current_player_id in game_data["opp_goalies"]:
-                                            num_on_ice_data[crazy_period][second]["opp_goalies"] += 1
-                                        else:
-                                            num_on_ice_data[crazy_period][second]["opp_skaters"] += 1
                             time_end = period_length_obj[period]
                         else:
                             continue
@@ -25565,17 +25941,12 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
 
                     if team_str not in shift_data:
                         shift_data[team_str] = {}
-                        player_shift_data[team_str] = {}
                     if current_player_id not in shift_data[team_str]:
                         shift_data[team_str][current_player_id] = {}
-                        player_shift_data[team_str][current_player_id] = {}
                     if period not in shift_data[team_str][current_player_id]:
                         shift_data[team_str][current_player_id][period] = []
-                        player_shift_data[team_str][current_player_id][period] = set()
-                    if period not in num_on_ice_data:
-                        num_on_ice_data[period] = {}
 
-                    if time_start in player_shift_data[team_str][current_player_id][period]:
+                    if is_shift_time_covered(shift_data[team_str][current_player_id][period], time_start):
                         continue
 
                     shift_data[team_str][current_player_id][period].append({
@@ -25583,28 +25954,6 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                         "time_end" : time_end,
                         "period" : period
                     })
-
-                    for second in range(time_start, time_end + 1):
-                        player_shift_data[team_str][current_player_id][period].add(second)
-
-                        if second not in num_on_ice_data[period]:
-                            num_on_ice_data[period][second] = {
-                                "team_goalies" : 0,
-                                "team_skaters" : 0,
-                                "opp_goalies" : 0,
-                                "opp_skaters" : 0
-                            }
-
-                        if team_str == "team":
-                            if current_player_id in game_data["team_goalies"]:
-                                num_on_ice_data[period][second]["team_goalies"] += 1
-                            else:
-                                num_on_ice_data[period][second]["team_skaters"] += 1
-                        else:
-                            if current_player_id in game_data["opp_goalies"]:
-                                num_on_ice_data[period][second]["opp_goalies"] += 1
-                            else:
-                                num_on_ice_data[period][second]["opp_skaters"] += 1
             elif len(columns) == 7:
                 if period_length_obj and row.get("class") and ("evenColor" in row.get("class") or "oddColor" in row.get("class")) and current_player_id:
                     period_str = str(columns[0].text).strip()
@@ -25628,62 +25977,14 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                         if time_duration == period_length_obj[period]:
                             if team_str not in shift_data:
                                 shift_data[team_str] = {}
-                                player_shift_data[team_str] = {}
                             if current_player_id not in shift_data[team_str]:
                                 shift_data[team_str][current_player_id] = {}
-                                player_shift_data[team_str][current_player_id] = {}
-                            if period not in num_on_ice_data:
-                                num_on_ice_data[period] = {}
 
                             shift_data[team_str][current_player_id][period] = [{
                                 "time_start" : 1,
                                 "time_end" : period_length_obj[period],
                                 "period" : period
                             }]
-
-                            if period in player_shift_data[team_str][current_player_id]:
-                                for second in player_shift_data[team_str][current_player_id][period]:
-                                    if second not in num_on_ice_data[period]:
-                                        num_on_ice_data[period][second] = {
-                                            "team_goalies" : 0,
-                                            "team_skaters" : 0,
-                                            "opp_goalies" : 0,
-                                            "opp_skaters" : 0
-                                        }
-
-                                    if team_str == "team":
-                                        if current_player_id in game_data["team_goalies"]:
-                                            num_on_ice_data[period][second]["team_goalies"] -= 1
-                                        else:
-                                            num_on_ice_data[period][second]["team_skaters"] -= 1
-                                    else:
-                                        if current_player_id in game_data["opp_goalies"]:
-                                            num_on_ice_data[period][second]["opp_goalies"] -= 1
-                                        else:
-                                            num_on_ice_data[period][second]["opp_skaters"] -= 1
-
-                            player_shift_data[team_str][current_player_id][period] = set()
-                            for second in range(1, period_length_obj[period] + 1):
-                                player_shift_data[team_str][current_player_id][period].add(second)
-
-                                if second not in num_on_ice_data[period]:
-                                    num_on_ice_data[period][second] = {
-                                        "team_goalies" : 0,
-                                        "team_skaters" : 0,
-                                        "opp_goalies" : 0,
-                                        "opp_skaters" : 0
-                                    }
-
-                                if team_str == "team":
-                                    if current_player_id in game_data["team_goalies"]:
-                                        num_on_ice_data[period][second]["team_goalies"] += 1
-                                    else:
-                                        num_on_ice_data[period][second]["team_skaters"] += 1
-                                else:
-                                    if current_player_id in game_data["opp_goalies"]:
-                                        num_on_ice_data[period][second]["opp_goalies"] += 1
-                                    else:
-                                        num_on_ice_data[period][second]["opp_skaters"] += 1
                         elif current_player_id in shift_data[team_str] and period in shift_data[team_str][current_player_id]:
                             if period == in_progress_period:
                                 total_on_ice = sum(shift["time_end"] - shift["time_start"] + 1 for shift in shift_data[team_str][current_player_id][period])
@@ -25696,156 +25997,36 @@ def get_html_shift_data(og_game_id, is_home, game_data, player_data, row_year, s
                                             "time_end" : period_length_obj[period],
                                             "period" : period
                                         })
-
-                                        for second in range(start_time, period_length_obj[period] + 1):
-                                            player_shift_data[team_str][current_player_id][period].add(second)
-
-                                            if second not in num_on_ice_data[period]:
-                                                num_on_ice_data[period][second] = {
-                                                    "team_goalies" : 0,
-                                                    "team_skaters" : 0,
-                                                    "opp_goalies" : 0,
-                                                    "opp_skaters" : 0
-                                                }
-
-                                            if team_str == "team":
-                                                if current_player_id in game_data["team_goalies"]:
-                                                    num_on_ice_data[period][second]["team_goalies"] += 1
-                                                else:
-                                                    num_on_ice_data[period][second]["team_skaters"] += 1
-                                            else:
-                                                if current_player_id in game_data["opp_goalies"]:
-                                                    num_on_ice_data[period][second]["opp_goalies"] += 1
-                                                else:
-                                                    num_on_ice_data[period][second]["opp_skaters"] += 1
                         else:
                             if period == in_progress_period:
                                 if team_str not in shift_data:
                                     shift_data[team_str] = {}
-                                    player_shift_data[team_str] = {}
                                 if current_player_id not in shift_data[team_str]:
                                     shift_data[team_str][current_player_id] = {}
-                                    player_shift_data[team_str][current_player_id] = {}
-                                if period not in num_on_ice_data:
-                                    num_on_ice_data[period] = {}
 
                                 shift_data[team_str][current_player_id][period] = [{
                                     "time_start" : 1,
                                     "time_end" : time_duration,
                                     "period" : period
                                 }]
-
-                                if period in player_shift_data[team_str][current_player_id]:
-                                    for second in player_shift_data[team_str][current_player_id][period]:
-                                        if second not in num_on_ice_data[period]:
-                                            num_on_ice_data[period][second] = {
-                                                "team_goalies" : 0,
-                                                "team_skaters" : 0,
-                                                "opp_goalies" : 0,
-                                                "opp_skaters" : 0
-                                            }
-
-                                        if team_str == "team":
-                                            if current_player_id in game_data["team_goalies"]:
-                                                num_on_ice_data[period][second]["team_goalies"] -= 1
-                                            else:
-                                                num_on_ice_data[period][second]["team_skaters"] -= 1
-                                        else:
-                                            if current_player_id in game_data["opp_goalies"]:
-                                                num_on_ice_data[period][second]["opp_goalies"] -= 1
-                                            else:
-                                                num_on_ice_data[period][second]["opp_skaters"] -= 1
-
-                                player_shift_data[team_str][current_player_id][period] = set()
-
-                                for second in range(1, time_duration + 1):
-                                    player_shift_data[team_str][current_player_id][period].add(second)
-
-                                    if second not in num_on_ice_data[period]:
-                                        num_on_ice_data[period][second] = {
-                                            "team_goalies" : 0,
-                                            "team_skaters" : 0,
-                                            "opp_goalies" : 0,
-                                            "opp_skaters" : 0
-                                        }
-
-                                    if team_str == "team":
-                                        if current_player_id in game_data["team_goalies"]:
-                                            num_on_ice_data[period][second]["team_goalies"] += 1
-                                        else:
-                                            num_on_ice_data[period][second]["team_skaters"] += 1
-                                    else:
-                                        if current_player_id in game_data["opp_goalies"]:
-                                            num_on_ice_data[period][second]["opp_goalies"] += 1
-                                        else:
-                                            num_on_ice_data[period][second]["opp_skaters"] += 1
                     else:
                         total_time_duration = sum(period_length_obj[period] for period in period_length_obj)
                         if time_duration == total_time_duration:
                             for period in period_length_obj:
                                 if team_str not in shift_data:
                                     shift_data[team_str] = {}
-                                    player_shift_data[team_str] = {}
                                 if current_player_id not in shift_data[team_str]:
                                     shift_data[team_str][current_player_id] = {}
-                                    player_shift_data[team_str][current_player_id] = {}
-                                if period not in num_on_ice_data:
-                                    num_on_ice_data[period] = {}
                                 shift_data[team_str][current_player_id][period] = [{
                                     "time_start" : 1,
                                     "time_end" : period_length_obj[period],
                                     "period" : period
                                 }]
 
-                                if period in player_shift_data[team_str][current_player_id]:
-                                    for second in player_shift_data[team_str][current_player_id][period]:
-                                        if second not in num_on_ice_data[period]:
-                                            num_on_ice_data[period][second] = {
-                                                "team_goalies" : 0,
-                                                "team_skaters" : 0,
-                                                "opp_goalies" : 0,
-                                                "opp_skaters" : 0
-                                            }
-
-                                        if team_str == "team":
-                                            if current_player_id in game_data["team_goalies"]:
-                                                num_on_ice_data[period][second]["team_goalies"] -= 1
-                                            else:
-                                                num_on_ice_data[period][second]["team_skaters"] -= 1
-                                        else:
-                                            if current_player_id in game_data["opp_goalies"]:
-                                                num_on_ice_data[period][second]["opp_goalies"] -= 1
-                                            else:
-                                                num_on_ice_data[period][second]["opp_skaters"] -= 1
-
-                                player_shift_data[team_str][current_player_id][period] = set()
-
-                                for second in range(1, period_length_obj[period] + 1):
-                                    player_shift_data[team_str][current_player_id][period].add(second)
-
-                                    if second not in num_on_ice_data[period]:
-                                        num_on_ice_data[period][second] = {
-                                            "team_goalies" : 0,
-                                            "team_skaters" : 0,
-                                            "opp_goalies" : 0,
-                                            "opp_skaters" : 0
-                                        }
-
-                                    if team_str == "team":
-                                        if current_player_id in game_data["team_goalies"]:
-                                            num_on_ice_data[period][second]["team_goalies"] += 1
-                                        else:
-                                            num_on_ice_data[period][second]["team_skaters"] += 1
-                                    else:
-                                        if current_player_id in game_data["opp_goalies"]:
-                                            num_on_ice_data[period][second]["opp_goalies"] += 1
-                                        else:
-                                            num_on_ice_data[period][second]["opp_skaters"] += 1
-
     # ps = pstats.Stats(profile)
     # ps.sort_stats(pstats.SortKey.TIME)
     # ps.print_stats()
-    return shift_data, player_shift_data, num_on_ice_data
+    return shift_data
 
 def get_html_play_data(scoring_plays, player_data, og_game_id, is_home, game_data, row_year, s):
     scoring_plays.clear()
@@ -25856,7 +26037,7 @@ def get_html_play_data(scoring_plays, player_data, og_game_id, is_home, game_dat
         year_str = str(sub_year)
         year_str += str(sub_year + 1)
         game_id = game_id[4:]
-        response, player_page_xml = url_request_lxml(s, nhl_html_plays_report_format.format(year_str, game_id))
+        response, player_page_xml = url_request_html_report(s, nhl_html_plays_report_format.format(year_str, game_id), og_game_id, game_data["is_final"], game_data["Date"])
     except requests.exceptions.HTTPError as err:
         if err.response.status_code == 404:
             return []
@@ -26383,7 +26564,7 @@ def get_old_html_play_data(scoring_plays, player_data, og_game_id, is_home, game
         year_str = str(sub_year)
         year_str += str(sub_year + 1)
         game_id = game_id[4:]
-        response, player_page_xml = url_request_lxml(s, nhl_html_plays_report_format.format(year_str, game_id))
+        response, player_page_xml = url_request_html_report(s, nhl_html_plays_report_format.format(year_str, game_id), og_game_id, game_data["is_final"], game_data["Date"])
     except requests.exceptions.HTTPError as err:
         if err.response.status_code == 404:
             return []
@@ -26896,7 +27077,7 @@ def get_older_html_play_data(scoring_plays, player_data, og_game_id, is_home, ga
         year_str = str(sub_year)
         year_str += str(sub_year + 1)
         game_id = game_id[4:]
-        response, player_page_xml = url_request_lxml(s, nhl_html_summary_report_format.format(year_str, game_id))
+        response, player_page_xml = url_request_html_report(s, nhl_html_summary_report_format.format(year_str, game_id), og_game_id, game_data["is_final"], game_data["Date"])
     except requests.exceptions.HTTPError as err:
         if err.response.status_code == 404:
             return []
@@ -28666,6 +28847,10 @@ def calculate_toi(row, qualifiers, player_game_info, player_id, player_link, sav
 
     needs_on_ice = bool(teammate_on_ice_quals) or bool(teammate_off_ice_quals)
 
+    if not needs_shift_events(qualifiers, player_game_info, extra_stats):
+        calculate_interval_toi(row, qualifiers, player_game_info, player_id, needs_five_stats, extra_stats)
+        return
+
     matching_shifts = set()
     for shift_event in player_game_info["shift_events"]:
         if not needs_on_ice or perform_on_ice_quals(qualifiers, player_shift_data, shift_event, row, shift_event["period"], shift_event["periodTime"], teammate_on_ice_quals, teammate_off_ice_quals):
@@ -28690,7 +28875,79 @@ def calculate_toi(row, qualifiers, player_game_info, player_id, player_link, sav
                 row["offITOI"] += 1
                 row["TmTtlTOI"] += 1
 
+def needs_shift_events(qualifiers, player_game_info, extra_stats):
+    # Per-second shift events are only built when something other than interval TOI has to look at them
+    return not all(qual_str in interval_toi_qualifiers for qual_str in qualifiers) or player_game_info["is_shootout"] or "event-id" in extra_stats
+
+def calculate_interval_toi(row, qualifiers, player_game_info, player_id, needs_five_stats, extra_stats):
+    needs_strength = not ("strength-stats" in extra_stats or "hide-strength" in extra_stats) or "strength" in extra_stats
+    has_on_ice_data = bool(player_game_info["strength_timeline"])
+    player_shifts = player_game_info["shift_data"]["team"][player_id]
+    player_intervals = player_game_info["player_shift_data"]["team"][player_id]
+
+    on_ice_masks = {}
+    if qualifiers:
+        for period in set(player_game_info["periods"]) | set(player_shifts):
+            mask_length = player_game_info["period_length"][period] if period in player_game_info["period_length"] else 0
+            if period in player_shifts:
+                for shift in player_shifts[period]:
+                    mask_length = max(mask_length, shift["time_end"])
+            on_ice_masks[period] = get_on_ice_qual_mask(qualifiers, player_game_info, row, period, mask_length + 1)
+
+    for period in player_shifts:
+        for shift in player_shifts[period]:
+            shift_toi = shift["time_end"] - shift["time_start"] + 1
+            if shift_toi <= 0:
+                continue
+            row["iTtlTOI"] += shift_toi
+
+            shift_mask = None
+            if qualifiers:
+                shift_mask = on_ice_masks[period][shift["time_start"]:shift["time_end"] + 1]
+                shift_toi = int(numpy.count_nonzero(shift_mask))
+                if not shift_toi:
+                    continue
+
+            row["TOI"] += shift_toi
+            row["TmTtlTOI"] += shift_toi
+            row["Shft"] += 1
+
+            if has_on_ice_data and (needs_strength or needs_five_stats):
+                strength_tois, five_toi = get_timeline_shift_strengths(player_game_info["strength_timeline"], period, shift["time_start"], shift["time_end"], shift_mask)
+                if needs_strength:
+                    for strength_index, strength in enumerate(strength_labels):
+                        row[strength + "TOI"] += strength_tois[strength_index]
+                if needs_five_stats:
+                    row["TOI_5v5"] += five_toi
+
+    for period in player_game_info["periods"]:
+        period_length = player_game_info["period_length"][period]
+        if qualifiers:
+            off_ice = on_ice_masks[period][1:period_length + 1].copy()
+            if period in player_intervals:
+                for interval_start, interval_end in player_intervals[period]:
+                    off_ice[max(interval_start - 1, 0):interval_end] = False
+            off_ice_toi = int(numpy.count_nonzero(off_ice))
+        else:
+            off_ice_toi = period_length
+            if period in player_intervals:
+                off_ice_toi -= get_interval_overlap(player_intervals[period], 1, period_length)
+        row["offITOI"] += off_ice_toi
+        row["TmTtlTOI"] += off_ice_toi
+
+def get_counts_strength(team_skaters, team_goalies, opp_skaters, opp_goalies):
+    if team_skaters + team_goalies  < opp_skaters + opp_goalies:
+        return "SH"
+    elif team_skaters + team_goalies  > opp_skaters + opp_goalies:
+        return "PP"
+    else:
+        return "EV"
+
 def is_five_toi(player_game_info, goal_event, period, second):
+    timeline_strength = get_timeline_strength(player_game_info, goal_event, period, second)
+    if timeline_strength:
+        return timeline_strength[1]
+
     team_skaters, team_goalies, opp_skaters, opp_goalies, has_team_shift_data, has_opp_shift_data = get_on_ice_info(player_game_info, goal_event, period, second, True, True, True, True)
     return has_team_shift_data and has_opp_shift_data and team_skaters == 5 and team_goalies == 1 and opp_skaters == 5 and opp_goalies == 1
 
@@ -28703,18 +28960,17 @@ def determine_strength(player_game_info, period, second, goal_event):
         elif goal_event["strength"] == "SHG":
             return "SH"
 
+    timeline_strength = get_timeline_strength(player_game_info, goal_event, period, second)
+    if timeline_strength:
+        return timeline_strength[0]
+
     team_skaters, team_goalies, opp_skaters, opp_goalies, has_team_shift_data, has_opp_shift_data = get_on_ice_info(player_game_info, goal_event, period, second, True, True, True, True)
     if has_team_shift_data and has_opp_shift_data:
-        if team_skaters + team_goalies  < opp_skaters + opp_goalies:
-            return "SH"
-        elif team_skaters + team_goalies  > opp_skaters + opp_goalies:
-            return "PP"
-        else:
-            return "EV"
+        return get_counts_strength(team_skaters, team_goalies, opp_skaters, opp_goalies)
     return None
 
 def get_on_ice_info(player_game_info, goal_event, period, second, needs_team, needs_opp, needs_skaters, needs_goalies, is_faceoff=False):
-    player_shift_data = player_game_info["num_on_ice_data"]
+    strength_timeline = player_game_info["strength_timeline"]
     team_skaters = 0
     team_goalies = 0
     opp_skaters = 0
@@ -28722,28 +28978,30 @@ def get_on_ice_info(player_game_info, goal_event, period, second, needs_team, ne
     team_on_ice = goal_event["team_on_ice"] if "team_on_ice" in goal_event else None
     opp_on_ice = goal_event["opp_on_ice"] if "opp_on_ice" in goal_event else None
 
-    has_team_shift_data = (bool(team_on_ice["P"]) if team_on_ice else False) or bool(player_shift_data)
-    has_opp_shift_data = (bool(opp_on_ice["P"]) if opp_on_ice else False) or bool(player_shift_data)
+    has_team_shift_data = (bool(team_on_ice["P"]) if team_on_ice else False) or bool(strength_timeline)
+    has_opp_shift_data = (bool(opp_on_ice["P"]) if opp_on_ice else False) or bool(strength_timeline)
+
+    counts = None
+    if period in strength_timeline and 0 <= second < len(strength_timeline[period]["counts_list"]):
+        counts = strength_timeline[period]["counts_list"][second]
 
     if needs_team:
         if has_team_shift_data:
             if team_on_ice:
                 team_goalies = len(team_on_ice["G"])
                 team_skaters = len(team_on_ice["S"])
-            else:
-                if period in player_shift_data and second in player_shift_data[period]:
-                    team_goalies = player_shift_data[period][second]["team_goalies"]
-                    team_skaters = player_shift_data[period][second]["team_skaters"]
+            elif counts:
+                team_skaters = counts[0]
+                team_goalies = counts[1]
     
     if needs_opp:
         if has_opp_shift_data:
             if opp_on_ice:
                 opp_goalies = len(opp_on_ice["G"])
                 opp_skaters = len(opp_on_ice["S"])
-            else:
-                if period in player_shift_data and second in player_shift_data[period]:
-                    opp_goalies = player_shift_data[period][second]["opp_goalies"]
-                    opp_skaters = player_shift_data[period][second]["opp_skaters"]
+            elif counts:
+                opp_skaters = counts[2]
+                opp_goalies = counts[3]
 
 
     if "emptyNet" in goal_event and goal_event["emptyNet"]:
@@ -30835,13 +31093,8 @@ def perform_sub_on_ice_qual(qualifers, player_shift_data, goal_event, row, perio
         if negate and skip_negative:
             continue
 
-        has_match = False
-        for player in qual_object["values"]:
-            if row["Tm"].lower() in player["games"] and row["NHLGameLink"] in player["games"][row["Tm"].lower()]:
-                has_match = True
-
         if not negate:
-            if not has_match:
+            if not has_qual_player_game(qual_object, row):
                 return False
 
         has_match = False
@@ -31639,16 +31892,6 @@ def calculate_row_attrs(row, player_type):
 
 def handle_awards(player_page, player_data, player_type, time_frame, years_to_skip, years_to_skip_champ, all_rows):
     all_star_div = player_page.find("div", id="leaderboard_honors")
-    comments = None
-    if not all_star_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="leaderboard_honors")
-            if temp_div:
-                all_star_div = temp_div
-                break
                 
     if all_star_div:
         all_star_rows = all_star_div.find("table").find_all("td")
@@ -31674,15 +31917,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, years_to_sk
                                 break
 
     awards_div = player_page.find("div", id="leaderboard_awards")
-    if not awards_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="leaderboard_awards")
-            if temp_div:
-                awards_div = temp_div
-                break
                 
     if awards_div:
         awards_table_rows = awards_div.find("table").find_all("td")
@@ -31767,15 +32001,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, years_to_sk
                                     break
     
     champs_div = player_page.find("div", id="leaderboard_champs")
-    if not champs_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="leaderboard_champs")
-            if temp_div:
-                champs_div = temp_div
-                break
                 
     if champs_div:
         champs_table_rows = champs_div.find("table").find_all("td")
@@ -31795,15 +32020,6 @@ def handle_awards(player_page, player_data, player_type, time_frame, years_to_sk
         table_names = ["stats_basic_plus_nhl", "stats_basic_nhl"]
         for table_name in table_names:
             per_game_table = player_page.find("table", id=table_name)
-            if not awards_div:
-                if not comments:
-                    comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-                for c in comments:
-                    temp_soup = BeautifulSoup(c, "lxml")
-                    temp_div = temp_soup.find("table", id=table_name)
-                    if temp_div:
-                        per_game_table = temp_div
-                        break
             
             if per_game_table:
                 standard_table_rows = per_game_table.find_all("tr")
@@ -31880,17 +32096,7 @@ def handle_leading_seasons(player_page, player_data, player_type, time_frame, ye
             for row in all_rows:
                 row[header] = 0.0
 
-    comments = None
     count_div = player_page.find("div", id="div_leaderboard")
-    if not count_div:
-        if not comments:
-            comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-        for c in comments:
-            temp_soup = BeautifulSoup(c, "lxml")
-            temp_div = temp_soup.find("div", id="div_leaderboard")
-            if temp_div:
-                count_div = temp_div
-                break
 
     if not count_div:
         return
@@ -31920,19 +32126,9 @@ def handle_leading_seasons(player_page, player_data, player_type, time_frame, ye
         
     
     table_names = ["stats_basic_plus_nhl", "stats_basic_nhl"]
-    comments = None
     parsed_years = set()
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find_all("tr")
@@ -33390,60 +33586,9 @@ def perform_qualifier(player_data, player_type, row, time_frame, all_rows):
         for qual_object in qualifiers["Holiday"]:
             has_match = False
             for holiday in qual_object["values"]:
-                country = "usa"
-                eve = False
-                observed = False
-                church = "western"
-                if "canadian" in holiday:
-                    country = "canada"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("canadian", "")).strip()
-                elif "canada" in holiday:
-                    country = "canada"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("canada", "")).strip()
-                elif "eve" in holiday:
-                    eve = True
-                    holiday = re.sub(r"\s+", " ", holiday.replace("eve", "")).strip()
-                elif "observed" in holiday:
-                    observed = True
-                    holiday = re.sub(r"\s+", " ", holiday.replace("observed", "")).strip()
-                elif "orthodox" in holiday:
-                    church = "orthodox"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("orthodox", "")).strip()
-                elif "eastern" in holiday:
-                    church = "eastern"
-                    holiday = re.sub(r"\s+", " ", holiday.replace("eastern", "")).strip()
-                holiday = re.sub(r"\W+", "", re.sub(r"[\s-]+", "_", holiday))
-
-                has_custom_match = False
-                for holiday_func in all_custom_holidays:
-                    if holiday_func[0] == holiday:
-                        has_custom_match = True
-                        if holiday_func[1](game_date, church, country, observed, eve):
-                            has_match = True
-                        break
-
-                if not has_custom_match:
-                    for holiday_func in all_holidays:
-                        if holiday_func[0] == holiday:
-                            arguments = inspect.signature(holiday_func[1]).parameters
-                            if "church" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, church=church)
-                            elif "country" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, country=country)
-                            elif "observed" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, observed=observed)
-                            elif "eve" in arguments:
-                                holiday_date = holiday_func[1](game_date.year, eve=eve)
-                            else:
-                                holiday_date = holiday_func[1](game_date.year)
-
-                            if holiday_date:
-                                holiday_date = datetime.datetime(holiday_date[0], holiday_date[1], holiday_date[2]).date()
-                                if eve:
-                                    holiday_date -= datetime.timedelta(days=1)
-                                if game_date == holiday_date:
-                                    has_match = True
-                            break
+                if is_holiday_match(game_date, holiday):
+                    has_match = True
+                    break
             if qual_object["negate"]:
                 if has_match:
                     return False
@@ -33835,70 +33980,166 @@ def determine_venue_obj(row, is_team):
     return get_venue_obj(team_id, row["Year"])[1]
 
 def get_venue_obj(team_id, year):
-    if team_id in team_venue_history:
-        for pot_team_venue in team_venue_history[team_id]:
-            for stadium_id in team_venue_history[team_id]:
-                if year in team_venue_history[team_id][stadium_id]:
-                    return stadium_id, team_venues[str(stadium_id)]
+    stadium_id = team_venue_year_index.get((team_id, year))
+    if stadium_id != None:
+        return stadium_id, team_venues[str(stadium_id)]
     
     return None, None
 
+moon_phase_tables = {}
+moon_phase_names = ["Full Moon", "New Moon", "First Quarter", "Third Quarter"]
+moon_phase_next_funcs = {
+    "Full Moon" : ephem.next_full_moon,
+    "New Moon" : ephem.next_new_moon,
+    "First Quarter" : ephem.next_first_quarter_moon,
+    "Third Quarter" : ephem.next_last_quarter_moon
+}
+moon_phase_between_names = {
+    "First Quarter" : "Waxing Crescent",
+    "Full Moon" : "Waxing Gibbous",
+    "Third Quarter" : "Waning Gibbous",
+    "New Moon" : "Waning Crescent"
+}
+
 def human_moon(date):
-    date = datetime.datetime(year=date.year, month=date.month, day=date.day, hour=19, minute=0, second=0)
-    date = pytz.timezone("US/Eastern").localize(date)
-    next_full = ephem.next_full_moon(date)
-    next_new = ephem.next_new_moon(date)
-    next_last_quarter = ephem.next_last_quarter_moon(date)
-    next_first_quarter = ephem.next_first_quarter_moon(date)
-    previous_full = ephem.previous_full_moon(date)
-    previous_new = ephem.previous_new_moon(date)
-    previous_last_quarter = ephem.previous_last_quarter_moon(date)
-    previous_first_quarter = ephem.previous_first_quarter_moon(date)
-
-    moon_phases = []
-
-    if is_moon_match(date.date(), next_full):
-        moon_phases.append("Full Moon")
-    if is_moon_match(date.date(), previous_full):
-        moon_phases.append("Full Moon")
-    
-    if is_moon_match(date.date(), next_new):
-        moon_phases.append("New Moon")
-    if is_moon_match(date.date(), previous_new):
-        moon_phases.append("New Moon")
-    
-    if is_moon_match(date.date(), next_first_quarter):
-        moon_phases.append("First Quarter")
-    if is_moon_match(date.date(), previous_first_quarter):
-        moon_phases.append("First Quarter")
-    
-    if is_moon_match(date.date(), next_last_quarter):
-        moon_phases.append("Third Quarter")
-    if is_moon_match(date.date(), previous_last_quarter):
-        moon_phases.append("Third Quarter")
-    
-    if previous_new < next_first_quarter < next_full < next_last_quarter < next_new:
-        moon_phases.append("Waxing Crescent")
-    elif previous_first_quarter < next_full < next_last_quarter < next_new < next_first_quarter:
-        moon_phases.append("Waxing Gibbous")
-    elif previous_full < next_last_quarter < next_new < next_first_quarter < next_full:
-        moon_phases.append("Waning Gibbous")
-    elif previous_last_quarter < next_new < next_first_quarter < next_full < next_last_quarter:
-        moon_phases.append("Waning Crescent")
-
-    return [moon_phase.lower() for moon_phase in moon_phases]
-
-def is_moon_match(da_date, da_moon_date):
+    if date.year not in moon_phase_tables:
+        moon_phase_tables[date.year] = build_moon_phase_table(date.year)
+    return moon_phase_tables[date.year][datetime.date(date.year, date.month, date.day)]
+
+def build_moon_phase_table(year):
+    eastern = pytz.timezone("US/Eastern")
+    first_date = datetime.date(year, 1, 1)
+    end_time = ephem.Date(eastern.localize(datetime.datetime(year=year + 1, month=2, day=1, hour=19, minute=0, second=0)))
+
+    # Walk every phase event from a month before to a month after the year once, instead of searching from each day
+    phase_events = []
+    for moon_phase in moon_phase_names:
+        event_time = moon_phase_next_funcs[moon_phase](eastern.localize(datetime.datetime(year=year - 1, month=12, day=1, hour=19, minute=0, second=0)))
+        while event_time < end_time:
+            phase_events.append((float(event_time), moon_phase))
+            event_time = moon_phase_next_funcs[moon_phase](ephem.Date(event_time + 1))
+    phase_events.sort()
+    event_times = [phase_event[0] for phase_event in phase_events]
+
+    event_dates = {}
+    for event_time, moon_phase in phase_events:
+        for match_date in get_moon_match_dates(ephem.Date(event_time)):
+            if match_date not in event_dates:
+                event_dates[match_date] = set()
+            event_dates[match_date].add(moon_phase)
+
+    moon_phase_table = {}
+    for day in range((datetime.date(year + 1, 1, 1) - first_date).days):
+        da_date = first_date + datetime.timedelta(days=day)
+        da_time = ephem.Date(eastern.localize(datetime.datetime(year=da_date.year, month=da_date.month, day=da_date.day, hour=19, minute=0, second=0)))
+
+        moon_phases = [moon_phase for moon_phase in moon_phase_names if moon_phase in event_dates.get(da_date, ())]
+        next_event = phase_events[bisect.bisect_right(event_times, float(da_time))]
+        moon_phases.append(moon_phase_between_names[next_event[1]])
+
+        moon_phase_table[da_date] = [moon_phase.lower() for moon_phase in moon_phases]
+
+    return moon_phase_table
+
+def get_moon_match_dates(da_moon_date):
     da_moon_date = da_moon_date.datetime()
     da_moon_date = pytz.utc.localize(da_moon_date).astimezone(pytz.timezone("US/Eastern"))
     if da_moon_date.time() < datetime.time(hour=12, minute=0, second=0):
-        dt_1 = da_moon_date - datetime.timedelta(days=1)
-        dt_2 = da_moon_date
+        return [(da_moon_date - datetime.timedelta(days=1)).date(), da_moon_date.date()]
     else:
-        dt_1 = da_moon_date
-        dt_2 = da_moon_date
-    
-    return da_date >= dt_1.date() and da_date <= dt_2.date()
+        return [da_moon_date.date()]
+
+holiday_infos = {}
+holiday_year_dates = {}
+holiday_date_matches = {}
+
+def get_holiday_info(holiday):
+    if holiday in holiday_infos:
+        return holiday_infos[holiday]
+
+    holiday_name = holiday
+    country = "usa"
+    eve = False
+    observed = False
+    church = "western"
+    if "canadian" in holiday_name:
+        country = "canada"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("canadian", "")).strip()
+    elif "canada" in holiday_name:
+        country = "canada"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("canada", "")).strip()
+    elif "eve" in holiday_name:
+        eve = True
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("eve", "")).strip()
+    elif "observed" in holiday_name:
+        observed = True
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("observed", "")).strip()
+    elif "orthodox" in holiday_name:
+        church = "orthodox"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("orthodox", "")).strip()
+    elif "eastern" in holiday_name:
+        church = "eastern"
+        holiday_name = re.sub(r"\s+", " ", holiday_name.replace("eastern", "")).strip()
+    holiday_name = re.sub(r"\W+", "", re.sub(r"[\s-]+", "_", holiday_name))
+
+    holiday_info = {
+        "church" : church,
+        "country" : country,
+        "observed" : observed,
+        "eve" : eve,
+        "custom_func" : None,
+        "func" : None
+    }
+    for holiday_func in all_custom_holidays:
+        if holiday_func[0] == holiday_name:
+            holiday_info["custom_func"] = holiday_func[1]
+            break
+    if not holiday_info["custom_func"]:
+        for holiday_func in all_holidays:
+            if holiday_func[0] == holiday_name:
+                holiday_info["func"] = holiday_func[1]
+                break
+
+    holiday_infos[holiday] = holiday_info
+    return holiday_info
+
+def get_holiday_date(holiday, year):
+    holiday_key = (holiday, year)
+    if holiday_key in holiday_year_dates:
+        return holiday_year_dates[holiday_key]
+
+    holiday_info = get_holiday_info(holiday)
+    holiday_func = holiday_info["func"]
+    arguments = inspect.signature(holiday_func).parameters
+    if "church" in arguments:
+        holiday_date = holiday_func(year, church=holiday_info["church"])
+    elif "country" in arguments:
+        holiday_date = holiday_func(year, country=holiday_info["country"])
+    elif "observed" in arguments:
+        holiday_date = holiday_func(year, observed=holiday_info["observed"])
+    elif "eve" in arguments:
+        holiday_date = holiday_func(year, eve=holiday_info["eve"])
+    else:
+        holiday_date = holiday_func(year)
+
+    if holiday_date:
+        holiday_date = datetime.datetime(holiday_date[0], holiday_date[1], holiday_date[2]).date()
+        if holiday_info["eve"]:
+            holiday_date -= datetime.timedelta(days=1)
+
+    holiday_year_dates[holiday_key] = holiday_date
+    return holiday_date
+
+def is_holiday_match(game_date, holiday):
+    holiday_info = get_holiday_info(holiday)
+    if holiday_info["custom_func"]:
+        holiday_key = (holiday, game_date)
+        if holiday_key not in holiday_date_matches:
+            holiday_date_matches[holiday_key] = bool(holiday_info["custom_func"](game_date, holiday_info["church"], holiday_info["country"], holiday_info["observed"], holiday_info["eve"]))
+        return holiday_date_matches[holiday_key]
+    elif holiday_info["func"]:
+        return get_holiday_date(holiday, game_date.year) == game_date
+    return False
 
 def handle_max_min_data(all_rows, player_data, player_type, qualifiers, extra_stats):
     new_rows = []
@@ -37480,18 +37721,8 @@ def get_valid_years(player_page, player_type):
     valid_year_teams = {}
 
     table_names = ["stats_basic_plus_nhl", "stats_basic_nhl", "stats_basic_plus_nhl_po", "stats_basic_nhl_po"]
-    comments = None
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find_all("tr")
@@ -37732,19 +37963,9 @@ def get_player_current_team_number(player_page):
             
     parsed_teams = set()
     table_names = ["stats_basic_plus_nhl", "stats_basic_nhl", "stats_basic_plus_nhl_po", "stats_basic_nhl_po"]
-    comments = None
     for table_name in table_names:
         table = player_page.find("table", id=table_name)
 
-        if not table:
-            if not comments:
-                comments = player_page.find_all(string=lambda text: isinstance(text, Comment))
-            for c in comments:
-                temp_soup = BeautifulSoup(c, "lxml")
-                temp_table = temp_soup.find("table", id=table_name)
-                if temp_table:
-                    table = temp_table
-                    break
 
         if table:
             standard_table_rows = table.find_all("tr")